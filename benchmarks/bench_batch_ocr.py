@@ -0,0 +1,63 @@
+"""
+Benchmark: documents per second of process_batch with one tesseract run per
+image (subprocess backend) vs one run per chunk of images (batch backend)
+ID cards are small, so model load dominates each run and batching pays most there
+Usage: python benchmarks/bench_batch_ocr.py [--documents 64] [--batch-sizes 4 16 32] [--workers 1]
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from common import build_sample_corpus, print_table, tesseract_available
+
+from modules.ocr_engine import OCREngine
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--documents', type=int, default=64)
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[4, 16, 32])
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--all-types', action='store_true', help='Use every sample, not just the ID cards')
+    args = parser.parse_args()
+    
+    if not tesseract_available():
+        print("⚠️  Tesseract not found; this benchmark needs it to OCR the samples")
+        return
+        
+    paths = build_sample_corpus()
+    if not args.all_types:
+        paths = [path for path in paths if Path(path).stem.endswith('_id')]
+    # Read once so every configuration OCRs the same in-memory files
+    contents = [Path(path).read_bytes() for path in paths]
+    documents = [contents[i % len(contents)] for i in range(args.documents)]
+    
+    configurations = [('subprocess', 1)] + [('batch', size) for size in args.batch_sizes]
+    rows = []
+    baseline = None
+    for backend, batch_size in configurations:
+        engine = OCREngine(backend=backend, profile='fast')
+        if backend == 'batch':
+            engine.backend.batch_size = batch_size
+            
+        start = time.perf_counter()
+        results = engine.process_batch(documents, workers=args.workers)
+        elapsed = time.perf_counter() - start
+        
+        docs_per_s = len(documents) / elapsed
+        baseline = baseline or docs_per_s
+        rows.append({
+            'backend': backend,
+            'batch_size': batch_size,
+            'docs_per_s': round(docs_per_s, 1),
+            'ms_per_doc': round(elapsed * 1000 / len(documents), 1),
+            'speedup': f"{docs_per_s / baseline:.2f}x",
+            'errors': sum(result['status'] != 'success' for result in results),
+        })
+        
+    print_table(f"process_batch over {len(documents)} documents ({args.workers} worker(s))", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark: throughput vs accuracy of the rules-first classification cascade
+Sweeps confidence_threshold and reports how many documents the rules decide,
+how many fall back to the model, accuracy and documents per second, next to
+the rules and the model on their own
+Usage: python benchmarks/bench_classifier_cascade.py [--thresholds 0.3 0.45 0.6 0.75] [--documents 2000]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from common import build_labeled_texts, print_table
+
+from modules.document_classifier import DocumentClassifier
+
+
+def run(classifier: DocumentClassifier, documents: list, threshold: float, batch_size: int) -> dict:
+    """Classify documents in batches; returns docs/s and accuracy"""
+    start = time.perf_counter()
+    results = []
+    for i in range(0, len(documents), batch_size):
+        results += classifier.classify_batch(documents[i:i + batch_size], confidence_threshold=threshold)
+    elapsed = time.perf_counter() - start
+    correct = sum(result['document_type'] == document['label'] for result, document in zip(results, documents))
+    return {
+        'docs_per_s': round(len(documents) / elapsed),
+        'accuracy_%': round(100.0 * correct / len(documents), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--thresholds', type=float, nargs='+', default=[0.3, 0.45, 0.6, 0.75])
+    parser.add_argument('--documents', type=int, default=2000)
+    parser.add_argument('--batch-size', type=int, default=3, help='Documents per classify_batch call (one application)')
+    args = parser.parse_args()
+    
+    training = build_labeled_texts(200, seed=1)
+    test = build_labeled_texts(max(1, args.documents // 9), seed=2)[:args.documents]
+    model_path = str(Path(tempfile.mkdtemp(prefix='cascade_bench_')) / 'document_classifier.pkl')
+    DocumentClassifier(method='ml').train(
+        [document['text'] for document in training], [document['label'] for document in training],
+        model_path=model_path
+    )
+    
+    rows = []
+    for threshold in args.thresholds:
+        for method in ('rule_based', 'ml', 'cascade'):
+            classifier = DocumentClassifier(method=method, model_path=model_path)
+            if method != 'rule_based':
+                classifier.load_model()
+            row = {'threshold': threshold, 'method': method, **run(classifier, test, threshold, args.batch_size)}
+            row['to_model_%'] = {'rule_based': 0.0, 'ml': 100.0}.get(method)
+            row['rules_ms_per_doc'] = row['model_ms_per_doc'] = ''
+            if method == 'cascade':
+                stats = classifier.get_cascade_stats()
+                row['to_model_%'] = stats['escalation_rate']
+                row['rules_ms_per_doc'] = stats['rule_based_ms_per_document']
+                row['model_ms_per_doc'] = stats['ml_ms_per_document']
+            rows.append(row)
+            
+    print_table(f"Classification of {len(test)} texts in batches of {args.batch_size}", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark: trained TF-IDF + Naive Bayes classification
+Trains on synthetic labeled texts, saves and lazily reloads the artifact, then
+compares per-document classify_document calls with one classify_batch call
+(one sparse matrix, one predict_proba) and reports accuracy against the rules
+Usage: python benchmarks/bench_classifier_ml.py [--train-per-type 200] [--documents 2000]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from common import build_labeled_texts, print_table
+
+from modules.document_classifier import DocumentClassifier
+
+
+def accuracy(results: list, documents: list) -> float:
+    correct = sum(result['document_type'] == document['label'] for result, document in zip(results, documents))
+    return round(100.0 * correct / len(documents), 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--train-per-type', type=int, default=200)
+    parser.add_argument('--documents', type=int, default=2000)
+    args = parser.parse_args()
+    
+    training = build_labeled_texts(args.train_per_type, seed=1)
+    test = build_labeled_texts(max(1, args.documents // 9), seed=2)[:args.documents]
+    model_path = Path(tempfile.mkdtemp(prefix='classifier_bench_')) / 'document_classifier.pkl'
+    
+    start = time.perf_counter()
+    info = DocumentClassifier(method='ml').train(
+        [document['text'] for document in training], [document['label'] for document in training],
+        model_path=str(model_path)
+    )
+    train_s = time.perf_counter() - start
+    
+    classifier = DocumentClassifier(method='ml', model_path=str(model_path))
+    start = time.perf_counter()
+    classifier.classify_document(test[0]['text'])
+    load_ms = (time.perf_counter() - start) * 1000
+    
+    rows = []
+    start = time.perf_counter()
+    single = [classifier.classify_document(document['text']) for document in test]
+    elapsed = time.perf_counter() - start
+    rows.append({'method': 'ml, per document', 'docs_per_s': round(len(test) / elapsed), 'accuracy_%': accuracy(single, test)})
+    
+    start = time.perf_counter()
+    batch = classifier.classify_batch(test)
+    elapsed = time.perf_counter() - start
+    rows.append({'method': 'ml, classify_batch', 'docs_per_s': round(len(test) / elapsed), 'accuracy_%': accuracy(batch, test)})
+    
+    rules = DocumentClassifier()
+    start = time.perf_counter()
+    rule_results = rules.classify_batch(test)
+    elapsed = time.perf_counter() - start
+    rows.append({'method': 'rule_based', 'docs_per_s': round(len(test) / elapsed), 'accuracy_%': accuracy(rule_results, test)})
+    
+    print(f"\nTrained on {info['documents']} texts in {train_s:.2f}s "
+          f"({info['vocabulary_size']} terms, {model_path.stat().st_size / 1024:.0f} KB artifact, "
+          f"first call incl. lazy load {load_ms:.1f} ms)")
+    print_table(f"Classification of {len(test)} held-out texts", rows)
+
+
+if __name__ == "__main__":
+    main()
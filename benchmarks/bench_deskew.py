@@ -0,0 +1,80 @@
+"""
+Benchmark: skew estimation memory and time per page
+Compares the full-resolution np.where/column_stack approach with
+OCREngine.estimate_skew_angle (downsampled cv2.findNonZero)
+Usage: python benchmarks/bench_deskew.py [--dpi 300] [--repeat N]
+"""
+
+import argparse
+import tracemalloc
+
+import cv2
+import numpy as np
+
+from common import build_sample_corpus, time_call, print_table
+
+from modules.ocr_engine import OCREngine
+
+LETTER_INCHES = (8.5, 11)
+
+
+def legacy_skew_angle(binary: np.ndarray) -> float:
+    """Skew estimate as preprocess_image computed it before estimate_skew_angle"""
+    coords = np.column_stack(np.where(binary > 0))
+    angle = cv2.minAreaRect(coords.astype(np.int32))[-1]
+    if angle < -45:
+        return -(90 + angle)
+    return -angle
+
+
+def peak_allocation_mb(func) -> float:
+    """Peak traced allocation (NumPy buffers included) while running func"""
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return round(peak / (1024 * 1024), 2)
+
+
+def make_page(path: str, dpi: int, rotation: float) -> np.ndarray:
+    """Binarized sample document scaled to a letter page at dpi, optionally rotated on a black frame"""
+    gray = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+    size = (int(LETTER_INCHES[0] * dpi), int(LETTER_INCHES[1] * dpi))
+    gray = cv2.resize(gray, size, interpolation=cv2.INTER_CUBIC)
+    if rotation:
+        # Shrink slightly so the rotated page stays inside the frame
+        M = cv2.getRotationMatrix2D((size[0] // 2, size[1] // 2), rotation, 0.9)
+        gray = cv2.warpAffine(gray, M, size, flags=cv2.INTER_CUBIC, borderValue=0)
+    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    return binary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--dpi', type=int, default=300, help='Scan resolution to simulate')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    
+    engine = OCREngine()
+    rows = []
+    for path in build_sample_corpus()[:3]:
+        for rotation in (0, 3):
+            page = make_page(path, args.dpi, rotation)
+            legacy = legacy_skew_angle(page)
+            current = engine.estimate_skew_angle(page)
+            rows.append({
+                'document': path.rsplit('/', 1)[-1],
+                'rotated': rotation,
+                'legacy_angle': round(legacy, 2),
+                'new_angle': round(current, 2),
+                'legacy_ms': time_call(lambda: legacy_skew_angle(page), args.repeat)['mean_ms'],
+                'new_ms': time_call(lambda: engine.estimate_skew_angle(page), args.repeat)['mean_ms'],
+                'legacy_peak_mb': peak_allocation_mb(lambda: legacy_skew_angle(page)),
+                'new_peak_mb': peak_allocation_mb(lambda: engine.estimate_skew_angle(page)),
+            })
+            
+    print_table(f"Skew estimation on letter-size pages at {args.dpi} DPI", rows)
+
+
+if __name__ == "__main__":
+    main()
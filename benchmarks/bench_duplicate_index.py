@@ -0,0 +1,80 @@
+"""
+Benchmark: near-duplicate lookup latency as the index grows
+Compares PerceptualHashIndex.find (multi-index hashing) with a linear Hamming scan
+Usage: python benchmarks/bench_duplicate_index.py [--sizes 10000 100000 1000000] [--queries 200]
+"""
+
+import argparse
+import random
+import time
+
+from common import print_table
+
+from modules.duplicate_index import PerceptualHashIndex, hamming_distance
+
+
+def linear_find(hashes: list, query: int, max_distance: int):
+    best = None
+    for i, image_hash in enumerate(hashes):
+        distance = hamming_distance(query, image_hash)
+        if distance <= max_distance and (best is None or distance < best[1]):
+            best = (i, distance)
+    return best
+
+
+def flip_bits(value: int, count: int, rng: random.Random) -> int:
+    for bit in rng.sample(range(64), count):
+        value ^= 1 << bit
+    return value
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--scopes', type=int, default=1, help='Distinct scopes the entries are spread over')
+    parser.add_argument('--max-distance', type=int, default=4)
+    args = parser.parse_args()
+    
+    rng = random.Random(11)
+    rows = []
+    for size in args.sizes:
+        index = PerceptualHashIndex(max_distance=args.max_distance)
+        hashes = [rng.getrandbits(64) for _ in range(size)]
+        start = time.perf_counter()
+        for i, image_hash in enumerate(hashes):
+            index.add(image_hash, str(i), f"scope-{i % args.scopes}")
+        build_s = time.perf_counter() - start
+        
+        # Half the queries are near-duplicates of indexed entries, half are new documents
+        queries = []
+        for q in range(args.queries):
+            if q % 2 == 0:
+                i = rng.randrange(size)
+                queries.append((flip_bits(hashes[i], rng.randint(0, args.max_distance), rng), f"scope-{i % args.scopes}"))
+            else:
+                queries.append((rng.getrandbits(64), 'scope-0'))
+                
+        start = time.perf_counter()
+        found = sum(index.find(query, scope) is not None for query, scope in queries)
+        index_ms = (time.perf_counter() - start) * 1000 / len(queries)
+        
+        linear_queries = queries[:max(2, args.queries // 20)]
+        start = time.perf_counter()
+        for query, _ in linear_queries:
+            linear_find(hashes, query, args.max_distance)
+        linear_ms = (time.perf_counter() - start) * 1000 / len(linear_queries)
+        
+        rows.append({
+            'entries': size,
+            'build_s': round(build_s, 2),
+            'found': f"{found}/{len(queries)}",
+            'index_ms_per_lookup': round(index_ms, 3),
+            'linear_ms_per_lookup': round(linear_ms, 2),
+        })
+        
+    print_table(f"Near-duplicate lookup (max distance {args.max_distance})", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark: import time of the package's entry points, with a budget
+Each import runs in a fresh interpreter under `python -X importtime`; the
+cost is what the statement adds on top of interpreter startup. Exits with
+status 1 when an entry point exceeds its budget or pulls in a heavy
+dependency it should not, so CI can run it as a startup regression check
+Usage: python benchmarks/bench_import_time.py [--repeat 5] [--budget-scale 1.0]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+from common import ROOT, print_table
+
+
+# Heavy third-party packages, with their typical import cost
+HEAVY_MODULES = ['sklearn', 'scipy', 'cv2', 'pytesseract', 'PIL', 'numpy', 'pdf2image']
+
+# Statement -> (budget in ms, heavy packages it may import)
+ENTRY_POINTS = {
+    'from modules import NotificationSystem': (100, []),
+    'from modules import WorkflowRouter': (100, []),
+    'from modules import EnrollmentValidator': (100, []),
+    'from modules import DocumentClassifier': (150, []),
+    'from modules import OCREngine': (600, ['cv2', 'pytesseract', 'PIL', 'numpy', 'pdf2image']),
+    'import main': (800, ['cv2', 'pytesseract', 'PIL', 'numpy', 'pdf2image']),
+}
+
+
+def parse_importtime(stderr: str) -> dict:
+    """Module name -> (cumulative microseconds, nesting level) from -X importtime output"""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        modules[name.strip()] = (int(cumulative), level)
+    return modules
+
+
+def measure(statement: str, startup: set) -> tuple:
+    """(import ms added by statement, modules it imported)"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    modules = parse_importtime(result.stderr)
+    added = {name: value for name, value in modules.items() if name not in startup}
+    total_us = sum(cumulative for cumulative, level in added.values() if level == 0)
+    return total_us / 1000, set(added)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--budget-scale', type=float, default=1.0, help='Multiply budgets (slow CI machines)')
+    args = parser.parse_args()
+    
+    startup = set(parse_importtime(subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'pass'], capture_output=True, text=True, check=True
+    ).stderr))
+    
+    rows = []
+    failures = 0
+    for statement, (budget_ms, allowed) in ENTRY_POINTS.items():
+        timings = []
+        imported = set()
+        for _ in range(args.repeat):
+            ms, imported = measure(statement, startup)
+            timings.append(ms)
+            
+        median_ms = statistics.median(timings)
+        budget_ms *= args.budget_scale
+        heavy = sorted(
+            package for package in HEAVY_MODULES
+            if package in imported and package not in allowed
+        )
+        ok = median_ms <= budget_ms and not heavy
+        failures += not ok
+        rows.append({
+            'entry_point': statement,
+            'median_ms': round(median_ms, 1),
+            'budget_ms': round(budget_ms),
+            'unexpected_heavy_imports': ', '.join(heavy) or '-',
+            'status': 'ok' if ok else 'FAIL',
+        })
+        
+    print_table("Import time per entry point (fresh interpreter, startup excluded)", rows)
+    if failures:
+        print(f"\n❌ {failures} entry point(s) over budget or importing heavy dependencies")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark: rule-based classification of long multi-page transcripts
+Compares DocumentClassifier.classify_document (one KeywordMatcher pass) with
+the previous scoring loop (one substring scan per keyword and type) and
+checks both give identical results
+Usage: python benchmarks/bench_keyword_matcher.py [--pages 1 10 50] [--documents 50]
+"""
+
+import argparse
+import random
+import time
+
+from common import print_table
+
+from modules.document_classifier import DocumentClassifier
+
+
+TRANSCRIPT_LINES = [
+    "ONTARIO SECONDARY SCHOOL TRANSCRIPT",
+    "Student Name: Sarah Johnson    Student Number: 123456789",
+    "Course Code  Course Title                     Grade  Credit",
+    "ENG4U        English, Grade 12, University    85     1.00",
+    "MHF4U        Advanced Functions               78     1.00",
+    "SCH4U        Chemistry                        91     1.00",
+    "CGW4U        Canadian and World Issues        88     1.00",
+    "Semester 2, Term 1 - Essex County District School Board",
+    "Community involvement hours completed: 40",
+    "Credits earned this year: 8.00   Cumulative: 30.00",
+]
+
+
+def keyword_loop(classifier: DocumentClassifier, text: str) -> dict:
+    """classify_document's scoring before KeywordMatcher: a substring scan per keyword"""
+    text_lower = text.lower()
+    scores = {}
+    matched_keywords = {}
+    for doc_type, keywords in classifier.keywords.items():
+        matches = [keyword for keyword in keywords if keyword in text_lower]
+        scores[doc_type] = sum(len(keyword.split()) for keyword in matches)
+        matched_keywords[doc_type] = matches
+        
+    best_type = max(scores, key=scores.get)
+    total_possible_score = sum(len(kw.split()) for kw in classifier.keywords[best_type])
+    confidence = min(scores[best_type] / total_possible_score, 1.0)
+    if confidence >= 0.6:
+        return {
+            'document_type': best_type,
+            'confidence': round(confidence, 2),
+            'matched_keywords': matched_keywords[best_type],
+            'classification_method': 'rule_based'
+        }
+    return {
+        'document_type': 'unknown',
+        'confidence': 0.0,
+        'matched_keywords': [],
+        'classification_method': 'rule_based'
+    }
+
+
+def transcript_text(pages: int, rng: random.Random) -> str:
+    return '\n\n'.join(
+        '\n'.join(rng.choice(TRANSCRIPT_LINES) for _ in range(50)) for _ in range(pages)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--pages', type=int, nargs='+', default=[1, 10, 50])
+    parser.add_argument('--documents', type=int, default=50)
+    args = parser.parse_args()
+    
+    classifier = DocumentClassifier()
+    rng = random.Random(7)
+    rows = []
+    for pages in args.pages:
+        texts = [transcript_text(pages, rng) for _ in range(args.documents)]
+        
+        start = time.perf_counter()
+        expected = [keyword_loop(classifier, text) for text in texts]
+        loop_ms = (time.perf_counter() - start) * 1000 / len(texts)
+        
+        start = time.perf_counter()
+        results = [classifier.classify_document(text) for text in texts]
+        matcher_ms = (time.perf_counter() - start) * 1000 / len(texts)
+        
+        rows.append({
+            'pages': pages,
+            'kb_per_doc': round(sum(map(len, texts)) / len(texts) / 1024, 1),
+            'loop_ms': round(loop_ms, 3),
+            'matcher_ms': round(matcher_ms, 3),
+            'speedup': f"{loop_ms / matcher_ms:.2f}x",
+            'identical': results == expected,
+        })
+        
+    print_table(f"Keyword scoring per document (matcher: {classifier.keyword_matcher.backend})", rows)
+
+
+if __name__ == "__main__":
+    main()
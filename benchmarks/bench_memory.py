@@ -0,0 +1,97 @@
+"""
+Benchmark: process memory (RSS) of a long batch-worker preprocessing run
+Each profile runs in a fresh process that decodes and preprocesses --documents
+sample pages (resized by a few percent each time, like real uploads) the way
+a batch worker does, sampling RSS and counting minor page faults as it goes
+Usage: python benchmarks/bench_memory.py [--documents 10000] [--profiles fast balanced]
+"""
+
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+
+import cv2
+
+from common import build_sample_corpus, print_table
+
+from modules.ocr_engine import OCREngine
+
+
+def rss_mb() -> float:
+    """Current resident set size of this process"""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        # No /proc (macOS): fall back to the peak, which only grows
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_profile(profile: str, documents: int) -> dict:
+    """Preprocess the corpus in this process and report RSS over the run"""
+    rng = random.Random(5)
+    pages = []
+    for path in build_sample_corpus():
+        image = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+        for scale in (1.0, 1.04, 1.1, 1.5):
+            resized = cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_CUBIC)
+            pages.append(cv2.imencode('.png', resized)[1].tobytes())
+            
+    engine = OCREngine(profile=profile)
+    warmup = min(200, documents // 10)
+    samples = []
+    faults_before = resource.getrusage(resource.RUSAGE_SELF).ru_minflt
+    start = time.perf_counter()
+    for index in range(documents):
+        gray = engine._decode_gray(rng.choice(pages))
+        engine._preprocess(gray)
+        if index == warmup:
+            warm_rss = rss_mb()
+        if index % 100 == 0:
+            samples.append(rss_mb())
+    elapsed = time.perf_counter() - start
+    faults = resource.getrusage(resource.RUSAGE_SELF).ru_minflt - faults_before
+    
+    return {
+        'profile': profile,
+        'docs_per_s': round(documents / elapsed, 1),
+        'rss_after_warmup_mb': round(warm_rss, 1),
+        'rss_peak_mb': round(max(samples), 1),
+        'rss_final_mb': round(rss_mb(), 1),
+        'rss_growth_mb': round(rss_mb() - warm_rss, 1),
+        # Fresh pages the kernel had to map in: every new large array faults its pages in
+        'page_faults_per_doc': round(faults / documents)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--documents', type=int, default=10000)
+    parser.add_argument('--profiles', nargs='+', default=['fast', 'balanced'])
+    parser.add_argument('--run', metavar='PROFILE', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.run:
+        print(json.dumps(run_profile(args.run, args.documents)))
+        return
+        
+    rows = []
+    for profile in args.profiles:
+        output = subprocess.run(
+            [sys.executable, __file__, '--run', profile, '--documents', str(args.documents)],
+            capture_output=True, text=True, check=True
+        ).stdout
+        rows.append(json.loads(output.strip().splitlines()[-1]))
+        
+    print_table(f"Preprocessing RSS over {args.documents} documents", rows)
+
+
+if __name__ == "__main__":
+    main()
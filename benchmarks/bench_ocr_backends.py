@@ -0,0 +1,52 @@
+"""
+Benchmark: Tesseract subprocess backend vs persistent tesserocr backend
+Usage: python benchmarks/bench_ocr_backends.py [--repeat N]
+"""
+
+import argparse
+
+from common import build_sample_corpus, time_call, print_table
+
+from modules.ocr_engine import OCREngine
+from modules.ocr_backends import create_backend, available_backends
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=5, help='OCR calls per image and backend')
+    args = parser.parse_args()
+    
+    # The batch backend runs single images exactly like subprocess; see bench_batch_ocr.py
+    backends = [name for name in available_backends() if name != 'batch']
+    if len(backends) < 2:
+        print("⚠️  tesserocr is not installed; only the subprocess backend will be measured")
+        
+    engine = OCREngine()
+    images = [(path, engine.preprocess_image(path)) for path in build_sample_corpus()]
+    
+    rows = []
+    per_backend = {}
+    for name in backends:
+        backend = create_backend(name)
+        # Warm-up call: the persistent backend loads its model here, once
+        backend.image_to_data(images[0][1], 'eng', engine.tesseract_config)
+        
+        total = 0.0
+        for path, image in images:
+            timing = time_call(lambda: backend.image_to_data(image, 'eng', engine.tesseract_config), args.repeat)
+            total += timing['mean_ms']
+            rows.append({'backend': name, 'document': path.rsplit('/', 1)[-1], **timing})
+        per_backend[name] = total / len(images)
+        backend.close()
+        
+    print_table("OCR call time per document (preprocessing excluded)", rows)
+    
+    print("\nMean per document:")
+    for name, mean_ms in per_backend.items():
+        print(f"   {name:<12} {mean_ms:8.1f} ms")
+    if 'subprocess' in per_backend and 'tesserocr' in per_backend:
+        print(f"   Speedup: {per_backend['subprocess'] / per_backend['tesserocr']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
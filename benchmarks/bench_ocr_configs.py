@@ -0,0 +1,114 @@
+"""
+Benchmark: generic vs per-document-type Tesseract settings
+OCRs the demo sample documents (clean and as phone photos) with the generic
+first-pass config and with each type's OCR_CONFIGS entry, and scores the
+extracted fields against the values the samples were generated with
+Usage: python benchmarks/bench_ocr_configs.py [--repeat N]
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from common import build_sample_corpus, print_table, tesseract_available
+
+from modules.ocr_engine import OCREngine
+
+
+# Values generate_all_samples() renders into each document, by file name
+EXPECTED = {
+    'sarah_id.png': ('id', {'full_name': 'SARAH JOHNSON', 'date_of_birth': '1998-05-15'}),
+    'michael_id.png': ('id', {'full_name': 'MICHAEL CHEN', 'date_of_birth': '1999-11-22'}),
+    'emily_id.png': ('id', {'full_name': 'EMILY RODRIGUEZ', 'date_of_birth': '2000-03-08'}),
+    'sarah_transcript.png': ('transcript', {'student_name': 'Sarah Johnson', 'gpa': '85.2'}),
+    'michael_transcript.png': ('transcript', {'student_name': 'Michael Chen', 'gpa': '85.2'}),
+    'emily_transcript.png': ('transcript', {'student_name': 'Emily Rodriguez', 'gpa': '85.2'}),
+    'sarah_address.png': ('proof_of_address', {'name': 'Sarah Johnson'}),
+    'emily_address.png': ('proof_of_address', {'name': 'Emily Rodriguez'}),
+}
+
+# Words that must appear in the page text, per type
+EXPECTED_WORDS = {
+    'id': ['ONTARIO', 'PHOTO', 'CARD'],
+    'transcript': ['ENG4U', 'MHF4U', 'SCH4U', 'SBI4U', 'CGW4U', 'HHS4U'],
+    'proof_of_address': ['HYDRO', 'TORONTO'],
+}
+
+
+class GenericEngine(OCREngine):
+    """Engine without per-type settings: every pass uses the generic config"""
+    
+    def ocr_settings_for(self, document_type: str = None) -> dict:
+        return {}
+
+
+def as_phone_photo(path: str) -> np.ndarray:
+    """Upscaled, noisy, unevenly lit and slightly rotated copy of a page"""
+    image = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+    image = cv2.resize(image, None, fx=2.0, fy=2.0, interpolation=cv2.INTER_CUBIC)
+    noise = np.random.default_rng(3).normal(0, 12, image.shape)
+    image = np.clip(image + noise, 0, 255).astype(np.uint8)
+    gradient = np.linspace(0.6, 1.0, image.shape[1], dtype=np.float32)
+    image = (image * gradient[np.newaxis, :]).astype(np.uint8)
+    M = cv2.getRotationMatrix2D((image.shape[1] // 2, image.shape[0] // 2), 1.5, 1.0)
+    return cv2.warpAffine(image, M, (image.shape[1], image.shape[0]), borderValue=180)
+
+
+def score(document_type: str, expected: dict, data: dict, text: str) -> float:
+    """Share (0-100) of expected field values and words that were read correctly"""
+    checks = [
+        expected_value.lower() in str(data.get(field) or '').lower()
+        for field, expected_value in expected.items()
+    ]
+    checks += [word in text.upper() for word in EXPECTED_WORDS.get(document_type, [])]
+    return 100.0 * sum(checks) / len(checks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=1)
+    args = parser.parse_args()
+    
+    if not tesseract_available():
+        print("⚠️  Tesseract not found; this benchmark needs it to OCR the samples")
+        return
+        
+    pages = []
+    for path in build_sample_corpus():
+        name = Path(path).name
+        if name in EXPECTED:
+            document_type, expected = EXPECTED[name]
+            pages.append((document_type, 'clean', cv2.imread(path), expected))
+            pages.append((document_type, 'photo', as_phone_photo(path), expected))
+            
+    engines = {'generic': GenericEngine(profile='auto'), 'per_type': OCREngine(profile='auto')}
+    results = {}
+    for config_name, engine in engines.items():
+        for document_type, kind, image, expected in pages:
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                document = engine.process_document(image, document_type=document_type)
+                data = engine.extract_structured_data(document, document_type)
+                elapsed = (time.perf_counter() - start) * 1000
+                
+                stats = results.setdefault((document_type, kind), {}).setdefault(config_name, {'ms': [], 'score': []})
+                stats['ms'].append(elapsed)
+                stats['score'].append(score(document_type, expected, data, document.text))
+                
+    rows = []
+    for (document_type, kind), by_config in results.items():
+        row = {'type': document_type, 'pages': kind}
+        for config_name in engines:
+            stats = by_config[config_name]
+            row[f'{config_name}_ms'] = round(sum(stats['ms']) / len(stats['ms']), 1)
+            row[f'{config_name}_correct_%'] = round(sum(stats['score']) / len(stats['score']), 1)
+        rows.append(row)
+        
+    print_table("Generic vs per-type OCR settings (mean per page, OCR + extraction)", rows)
+
+
+if __name__ == "__main__":
+    main()
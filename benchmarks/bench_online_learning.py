@@ -0,0 +1,88 @@
+"""
+Benchmark: online learning from streamed staff corrections
+A learner starts without a model and absorbs labeled texts through
+record_correction (micro-batched partial_fit, periodic checkpoints); a
+separate worker classifier hot-swaps each checkpoint without restarting.
+Reports the worker's held-out accuracy per checkpoint, update and
+checkpoint costs, and the cost of retraining TF-IDF from scratch instead
+Usage: python benchmarks/bench_online_learning.py [--corrections 1800] [--checkpoint-every 300]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from common import build_labeled_texts, print_table
+
+from modules.document_classifier import DocumentClassifier
+
+
+def accuracy(results: list, documents: list) -> float:
+    correct = sum(result['document_type'] == document['label'] for result, document in zip(results, documents))
+    return round(100.0 * correct / len(documents), 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--corrections', type=int, default=1800)
+    parser.add_argument('--batch-size', type=int, default=16, help='correction_batch_size')
+    parser.add_argument('--checkpoint-every', type=int, default=300)
+    parser.add_argument('--documents', type=int, default=900, help='Held-out texts the worker classifies')
+    args = parser.parse_args()
+    
+    stream = build_labeled_texts(max(1, args.corrections // 9), seed=1)[:args.corrections]
+    test = build_labeled_texts(max(1, args.documents // 9), seed=2)[:args.documents]
+    test_texts = [document['text'] for document in test]
+    model_path = str(Path(tempfile.mkdtemp(prefix='online_bench_')) / 'document_classifier.pkl')
+    
+    learner = DocumentClassifier(method='ml', model_path=model_path)
+    learner.correction_batch_size = args.batch_size
+    learner.checkpoint_every = args.checkpoint_every
+    worker = DocumentClassifier(method='ml', model_path=model_path)
+    worker.reload_interval = 0.0
+    
+    rows = []
+    update_s = checkpoint_s = 0.0
+    for seen, document in enumerate(stream, 1):
+        checkpoints = Path(model_path).stat().st_mtime_ns if Path(model_path).exists() else None
+        start = time.perf_counter()
+        learner.record_correction(document['text'], document['label'])
+        elapsed = time.perf_counter() - start
+        if not Path(model_path).exists() or Path(model_path).stat().st_mtime_ns == checkpoints:
+            update_s += elapsed
+            continue
+        checkpoint_s += elapsed
+        
+        # The worker notices the new artifact on its next call and swaps it in
+        start = time.perf_counter()
+        worker.classify_document(test_texts[0])
+        swap_ms = (time.perf_counter() - start) * 1000
+        results = worker.classify_batch(test, confidence_threshold=0.0)
+        
+        # What the same point would cost without partial_fit: a full retrain
+        start = time.perf_counter()
+        DocumentClassifier(method='ml').train(
+            [seen_document['text'] for seen_document in stream[:seen]],
+            [seen_document['label'] for seen_document in stream[:seen]]
+        )
+        retrain_s = time.perf_counter() - start
+        
+        rows.append({
+            'corrections': seen,
+            'worker_model_version': worker.model_info['model_version'],
+            'accuracy_%': accuracy(results, test),
+            'swap_ms': round(swap_ms, 1),
+            'artifact_mb': round(Path(model_path).stat().st_size / 2 ** 20, 1),
+            'full_retrain_s': round(retrain_s, 2),
+        })
+        
+    applied = learner.model_info.get('documents', 0)
+    print(f"\n{applied} corrections applied in {learner.model_info.get('updates', 0)} partial_fit batches: "
+          f"{update_s * 1000 / max(applied, 1):.2f} ms per correction; "
+          f"{len(rows)} checkpoints: {checkpoint_s * 1000 / max(len(rows), 1):.0f} ms each (incl. their last batch)")
+    print_table(f"Worker accuracy on {len(test)} held-out texts after each checkpoint", rows)
+
+
+if __name__ == "__main__":
+    main()
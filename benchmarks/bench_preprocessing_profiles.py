@@ -0,0 +1,52 @@
+"""
+Benchmark: preprocessing time and OCR accuracy per preprocessing profile
+Runs every profile over a synthetic corpus of clean, noisy and phone-photo pages
+Usage: python benchmarks/bench_preprocessing_profiles.py [--pages N]
+"""
+
+import argparse
+import time
+
+from common import build_text_corpus, word_accuracy, tesseract_available, print_table
+
+from modules.ocr_engine import OCREngine, PREPROCESSING_PROFILES
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--pages', type=int, default=3, help='Pages per degradation kind')
+    args = parser.parse_args()
+    
+    corpus = build_text_corpus(args.pages)
+    run_ocr = tesseract_available()
+    if not run_ocr:
+        print("⚠️  Tesseract not found; reporting preprocessing time only")
+        
+    rows = []
+    for profile in PREPROCESSING_PROFILES:
+        engine = OCREngine(profile=profile)
+        by_kind = {}
+        for page in corpus:
+            start = time.perf_counter()
+            image = engine.preprocess_image(page['path'])
+            elapsed = (time.perf_counter() - start) * 1000
+            
+            stats = by_kind.setdefault(page['kind'], {'ms': [], 'accuracy': []})
+            stats['ms'].append(elapsed)
+            if run_ocr:
+                text = engine._text_from_data(engine.backend.image_to_data(image, 'eng', engine.tesseract_config))
+                stats['accuracy'].append(word_accuracy(page['truth'], text))
+                
+        for kind, stats in by_kind.items():
+            rows.append({
+                'profile': profile,
+                'pages': kind,
+                'preprocess_ms': round(sum(stats['ms']) / len(stats['ms']), 1),
+                'word_accuracy_%': round(sum(stats['accuracy']) / len(stats['accuracy']), 1) if stats['accuracy'] else 'n/a'
+            })
+            
+    print_table("Preprocessing profiles (mean per page)", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+"""
+Shared helpers for the benchmark scripts
+Builds a synthetic corpus with the demo's sample document generator
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+# Allow running as `python benchmarks/<script>.py` from the repository root
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from generate_samples import SampleDocumentGenerator
+
+
+def build_sample_corpus(output_dir: str = None) -> List[str]:
+    """
+    Generate the demo sample documents
+    
+    Args:
+        output_dir: Where to write them (default: a fresh temporary directory)
+        
+    Returns:
+        Paths of the generated images
+    """
+    output_dir = Path(output_dir or tempfile.mkdtemp(prefix='ocr_bench_'))
+    SampleDocumentGenerator(str(output_dir)).generate_all_samples()
+    return sorted(str(path) for path in output_dir.glob('*.png'))
+
+
+def time_call(func: Callable, repeat: int = 5) -> Dict:
+    """
+    Time a zero-argument callable
+    
+    Returns:
+        Dictionary with best and mean wall time in milliseconds
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        'best_ms': round(min(timings), 2),
+        'mean_ms': round(sum(timings) / len(timings), 2)
+    }
+
+
+def print_table(title: str, rows: List[Dict]):
+    """Print benchmark rows as an aligned table"""
+    print(f"\n{title}")
+    print("-" * 70)
+    if not rows:
+        print("   (no results)")
+        return
+    columns = list(rows[0].keys())
+    widths = {c: max(len(c), *(len(str(r.get(c, ''))) for r in rows)) for c in columns}
+    print("   " + "  ".join(c.ljust(widths[c]) for c in columns))
+    for row in rows:
+        print("   " + "  ".join(str(row.get(c, '')).ljust(widths[c]) for c in columns))
+
+
+CORPUS_LINES = [
+    "STUDENT NAME: Sarah Johnson",
+    "DATE OF BIRTH: 1998-05-15",
+    "CARD NUMBER: P1234-56789-01234",
+    "ONTARIO SECONDARY SCHOOL DIPLOMA",
+    "English, Grade 12, U   ENG4U   85%",
+    "Advanced Functions, U   MHF4U   78%",
+    "SERVICE ADDRESS: 123 Main Street, Toronto, ON M5V 2T6",
+    "BILL DATE: October 02, 2026",
+    "OVERALL AVERAGE: 85.2%",
+    "CREDITS EARNED: 30 / 30 Required",
+]
+
+DEGRADATIONS = ['clean', 'noisy', 'photo']
+
+
+def build_text_corpus(pages_per_kind: int = 3, output_dir: str = None) -> List[Dict]:
+    """
+    Generate pages with known text in several quality levels
+    
+    clean: rendered page as uploaded digitally
+    noisy: Gaussian sensor noise plus slight blur (poor scanner)
+    photo: uneven lighting, noise and a small rotation (phone photo)
+    
+    Returns:
+        List of {'path', 'kind', 'truth'} dictionaries
+    """
+    import random
+    
+    import cv2
+    import numpy as np
+    from PIL import Image, ImageDraw, ImageFont
+    
+    output_dir = Path(output_dir or tempfile.mkdtemp(prefix='ocr_text_corpus_'))
+    output_dir.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(42)
+    
+    font = None
+    for name in ("arial.ttf", "DejaVuSans.ttf"):
+        try:
+            font = ImageFont.truetype(name, 28)
+            break
+        except OSError:
+            continue
+    if font is None:
+        font = ImageFont.load_default()
+        
+    corpus = []
+    for kind in DEGRADATIONS:
+        for index in range(pages_per_kind):
+            lines = rng.sample(CORPUS_LINES, 6)
+            page = Image.new('L', (1275, 1650), color=255)
+            draw = ImageDraw.Draw(page)
+            for line_number, line in enumerate(lines):
+                draw.text((80, 120 + line_number * 70), line, fill=0, font=font)
+            image = np.array(page)
+            
+            if kind in ('noisy', 'photo'):
+                noise = np.random.default_rng(index).normal(0, 25, image.shape)
+                image = np.clip(image + noise, 0, 255).astype(np.uint8)
+                image = cv2.GaussianBlur(image, (3, 3), 0)
+            if kind == 'photo':
+                gradient = np.linspace(0.55, 1.0, image.shape[1], dtype=np.float32)
+                image = (image * gradient[np.newaxis, :]).astype(np.uint8)
+                M = cv2.getRotationMatrix2D((image.shape[1] // 2, image.shape[0] // 2), 2.0, 1.0)
+                image = cv2.warpAffine(image, M, (image.shape[1], image.shape[0]), borderValue=200)
+                
+            path = output_dir / f"{kind}_{index}.png"
+            cv2.imwrite(str(path), image)
+            corpus.append({'path': str(path), 'kind': kind, 'truth': '\n'.join(lines)})
+            
+    return corpus
+
+
+def word_accuracy(truth: str, text: str) -> float:
+    """Similarity (0-100) between the expected and recognized word sequences"""
+    from difflib import SequenceMatcher
+    return round(SequenceMatcher(None, truth.split(), text.split()).ratio() * 100, 1)
+
+
+def tesseract_available() -> bool:
+    """True if the tesseract executable can be run"""
+    import pytesseract
+    try:
+        pytesseract.get_tesseract_version()
+        return True
+    except Exception:
+        return False
+
+
+# Lines typical of each document type, for build_labeled_texts
+LABELED_TEMPLATES = {
+    'government_id': [
+        "ONTARIO PHOTO CARD", "CARTE-PHOTO DE L'ONTARIO", "SURNAME / NOM DE FAMILLE: {last}",
+        "GIVEN NAMES / PRENOMS: {first}", "DATE OF BIRTH: {date}", "SEX / SEXE: F",
+        "HEIGHT / TAILLE: 168 cm", "CARD NUMBER: P{number}", "ISSUE DATE: {date}", "EXPIRY DATE: {date}",
+    ],
+    'drivers_license': [
+        "ONTARIO DRIVER'S LICENCE", "PERMIS DE CONDUIRE", "CLASS G2", "{last}, {first}",
+        "RESTRICTIONS: A", "ENDORSEMENTS: NONE", "MINISTRY OF TRANSPORTATION", "DD/JJ {number}",
+        "EXP/EXP {date}", "LICENCE NO. {number}",
+    ],
+    'transcript': [
+        "ONTARIO STUDENT TRANSCRIPT", "Student: {first} {last}", "ENG4U English Grade 12 85 1.00",
+        "MHF4U Advanced Functions 78 1.00", "Semester 2 2023-2024", "Credits earned: 30",
+        "Course code  Course title  Mark  Credit", "Academic standing: good", "Cumulative average 85.2",
+    ],
+    'diploma': [
+        "ONTARIO SECONDARY SCHOOL DIPLOMA", "This is to certify that", "{first} {last}",
+        "has completed the requirements and is awarded this diploma", "Conferred on {date}",
+        "with honours", "Certificate of completion", "Principal", "Ministry of Education",
+    ],
+    'proof_of_address': [
+        "Lease agreement", "Tenant: {first} {last}", "Service address: {number} Main Street, Toronto",
+        "Billing address: {number} King Street West", "Customer since {date}", "Statement date {date}",
+        "Account holder {first} {last}", "Monthly rent $1,850.00",
+    ],
+    'utility_bill': [
+        "TORONTO HYDRO-ELECTRIC SYSTEM", "Electricity usage this period: 612 kWh", "Enbridge Gas",
+        "Account number {number}", "Bill date: {date}", "Amount due: $142.17", "Water and wastewater",
+        "Service address: {number} Queen Street", "Customer: {first} {last}",
+    ],
+    'bank_statement': [
+        "ROYAL BANK OF CANADA", "Account statement {date} to {date}", "Opening balance $3,210.55",
+        "Deposit PAYROLL $1,920.00", "Withdrawal ATM $60.00", "Transaction details", "Branch transit 01234",
+        "Closing balance $4,402.10", "{first} {last}",
+    ],
+    'osap_document': [
+        "ONTARIO STUDENT ASSISTANCE PROGRAM", "OSAP funding summary", "Canada Student Loan $4,200",
+        "Ontario Student Grant $3,100", "NSLSC account {number}", "Financial aid assessment",
+        "Ministry of Training, Colleges and Universities", "Student: {first} {last}",
+    ],
+    'study_permit': [
+        "IMMIGRATION, REFUGEES AND CITIZENSHIP CANADA", "STUDY PERMIT", "UCI {number}",
+        "Temporary resident", "International student", "Authorized to study at a DLI",
+        "Valid until {date}", "Conditions: may work 20 hours per week", "{last}, {first}",
+    ],
+}
+
+# Boilerplate found on documents of any type
+SHARED_LINES = [
+    "Page 1 of 2", "{first} {last}", "{number} Main Street, Toronto, ON M5V 2T6", "Date: {date}",
+    "Ontario", "Please keep this document for your records", "Reference number {number}",
+    "For questions call 1-800-555-0199", "Signature",
+]
+
+FIRST_NAMES = ['Sarah', 'Michael', 'Emily', 'Priya', 'Jean', 'Amir', 'Olivia', 'Wei']
+LAST_NAMES = ['Johnson', 'Chen', 'Rodriguez', 'Patel', 'Tremblay', 'Haddad', 'Brown', 'Zhang']
+
+
+def build_labeled_texts(documents_per_type: int = 100, noise: float = 0.03, seed: int = 0) -> List[Dict]:
+    """
+    Generate OCR-like document texts with known types
+    
+    Each text has a few lines of its own type, often lines of other types and
+    boilerplate every type shares, and a share of characters is replaced as
+    OCR misreads would, so neither keywords nor a model get every text right.
+    
+    Args:
+        documents_per_type: Texts per LABELED_TEMPLATES type
+        noise: Probability that a letter is misread
+        seed: Random seed
+        
+    Returns:
+        Shuffled list of {'text', 'label'} dictionaries
+    """
+    import random
+    
+    rng = random.Random(seed)
+    types = list(LABELED_TEMPLATES)
+    misreads = {'o': '0', 'l': '1', 'i': 'l', 'e': 'c', 's': '5', 'a': 'o', 'n': 'm', 't': 'f'}
+    
+    def fill(line: str) -> str:
+        return line.format(
+            first=rng.choice(FIRST_NAMES), last=rng.choice(LAST_NAMES),
+            date=f"{rng.randint(2018, 2026)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            number=rng.randint(10000, 99999)
+        )
+        
+    def misread(text: str) -> str:
+        return ''.join(
+            misreads.get(c.lower(), c) if rng.random() < noise else c for c in text
+        )
+        
+    documents = []
+    for label in types:
+        for _ in range(documents_per_type):
+            own = LABELED_TEMPLATES[label]
+            lines = rng.sample(own, rng.randint(2, len(own)))
+            while rng.random() < 0.5:
+                lines.append(rng.choice(LABELED_TEMPLATES[rng.choice(types)]))
+            lines += rng.sample(SHARED_LINES, rng.randint(0, 3))
+            rng.shuffle(lines)
+            documents.append({'text': misread('\n'.join(fill(line) for line in lines)), 'label': label})
+            
+    rng.shuffle(documents)
+    return documents
@@ -11,11 +11,15 @@ from typing import Dict, List
 
 from modules import (
     OCREngine,
+    OCRCache,
+    PerceptualHashIndex,
+    UnreadableDocumentError,
     DocumentClassifier,
     EnrollmentValidator,
     NotificationSystem,
     WorkflowRouter
 )
+from modules.ocr_engine import READABILITY_REASONS
 
 
 class EnrollmentAutomationSystem:
@@ -24,14 +28,67 @@ class EnrollmentAutomationSystem:
     """
     
     def __init__(self, config: Dict = None):
-        """Initialize all automation components"""
+        """
+        Initialize all automation components
+        
+        Args:
+            config: Optional settings, e.g.
+                {'ocr_cache': {'enabled': True, 'max_bytes': 512 * 1024 * 1024},
+                 'near_duplicates': {'enabled': True, 'max_distance': 4},
+                 'ocr_backend': 'tesserocr', 'ocr_profile': 'auto',
+                 'ocr_tile_height': 2000, 'two_tier_ocr': True,
+                 'readability_gate': True, 'classification_method': 'cascade',
+                 'classifier_model_path': 'models/document_classifier.pkl'}
+                readability_gate is on by default (images whose shorter side is
+                under 400 px are sent back for re-upload); False OCRs everything.
+        """
         print("🚀 Initializing Brukd Career College Automation System...")
         
         self.config = config or {}
         
+        # Create output directories
+        self.output_dir = Path('output')
+        self.output_dir.mkdir(exist_ok=True)
+        (self.output_dir / 'reports').mkdir(exist_ok=True)
+        (self.output_dir / 'logs').mkdir(exist_ok=True)
+        
+        # Optional OCR result cache (re-uploads and batch re-runs skip OCR)
+        self.ocr_cache = None
+        cache_config = self.config.get('ocr_cache', {})
+        if cache_config.get('enabled'):
+            self.ocr_cache = OCRCache(
+                cache_dir=cache_config.get('directory', self.output_dir / 'ocr_cache'),
+                max_bytes=cache_config.get('max_bytes', 256 * 1024 * 1024)
+            )
+        
+        # Optional near-duplicate reuse (needs the cache): a student's re-upload of the
+        # same scan under another name or compression reuses the earlier OCR
+        self.duplicate_index = None
+        duplicate_config = self.config.get('near_duplicates', {})
+        if duplicate_config.get('enabled') and self.ocr_cache is not None:
+            self.duplicate_index = PerceptualHashIndex(
+                path=duplicate_config.get('index_path', self.output_dir / 'ocr_cache' / 'duplicate_index.tsv'),
+                max_distance=duplicate_config.get('max_distance', 4)
+            )
+        
         # Initialize modules
-        self.ocr = OCREngine()
-        self.classifier = DocumentClassifier()
+        self.ocr = OCREngine(
+            cache=self.ocr_cache,
+            duplicate_index=self.duplicate_index,
+            backend=self.config.get('ocr_backend', 'subprocess'),
+            profile=self.config.get('ocr_profile', 'quality'),
+            pdf_dpi=self.config.get('pdf_dpi', 200),
+            tile_height=self.config.get('ocr_tile_height'),
+            # Unreadable uploads go straight to a re-upload request without OCR
+            readability_gate=self.config.get('readability_gate', True)
+        )
+        self.classifier = DocumentClassifier(
+            method=self.config.get('classification_method', 'rule_based'),
+            model_path=self.config.get('classifier_model_path')
+        )
+        if self.classifier.method != 'rule_based' and not self.classifier.model_path:
+            print(f"   ⚠️  classification_method '{self.classifier.method}' has no classifier_model_path; "
+                  f"documents are classified by keyword rules")
         self.validator = EnrollmentValidator()
         self.notifier = NotificationSystem()
         self.router = WorkflowRouter()
@@ -43,15 +100,14 @@ class EnrollmentAutomationSystem:
             'total_processing_time': 0,
             'auto_approved': 0,
             'requires_review': 0,
-            'incomplete': 0
+            'incomplete': 0,
+            'ocr_tiers': {'header_only': 0, 'full': 0},
+            'ocr_reused': 0,
+            'unreadable_documents': 0,
+            'unreadable_reasons': {},
+            'type_corrections': 0
         }
         
-        # Create output directories
-        self.output_dir = Path('output')
-        self.output_dir.mkdir(exist_ok=True)
-        (self.output_dir / 'reports').mkdir(exist_ok=True)
-        (self.output_dir / 'logs').mkdir(exist_ok=True)
-        
         print("✅ System initialized successfully!\n")
     
     def process_application(self, application_data: Dict) -> Dict:
@@ -95,8 +151,9 @@ class EnrollmentAutomationSystem:
         print("-" * 70)
         
         document_files = application_data.get('documents', [])
+        duplicate_scope = application_data.get('student_email') or application_id
         for doc_file in document_files:
-            doc_result = self._process_document(doc_file)
+            doc_result = self._process_document(doc_file, duplicate_scope)
             result['documents'].append(doc_result)
             self.stats['documents_processed'] += 1
         
@@ -106,15 +163,19 @@ class EnrollmentAutomationSystem:
         print("🤖 STEP 2: AI Document Classification")
         print("-" * 70)
         
-        for doc in result['documents']:
-            if doc['ocr_status'] == 'success':
-                classification = self.classifier.classify_document(doc['extracted_text'])
-                doc['classification'] = classification
-                doc['document_type'] = classification['document_type']
-                
-                print(f"   📄 {doc['filename']}")
-                print(f"      Type: {classification['document_type']}")
-                print(f"      Confidence: {classification['confidence']:.0%}")
+        # One call for the whole application, so a model tier scores all its documents at once
+        ocr_docs = [doc for doc in result['documents'] if doc['ocr_status'] == 'success']
+        classifications = self.classifier.classify_batch(
+            [{'text': doc['extracted_text'], 'file': doc['filename']} for doc in ocr_docs]
+        )
+        for doc, classification in zip(ocr_docs, classifications):
+            classification.pop('file')
+            doc['classification'] = classification
+            doc['document_type'] = classification['document_type']
+            
+            print(f"   📄 {doc['filename']}")
+            print(f"      Type: {classification['document_type']}")
+            print(f"      Confidence: {classification['confidence']:.0%}")
         
         print()
         
@@ -125,11 +186,14 @@ class EnrollmentAutomationSystem:
         for doc in result['documents']:
             if doc.get('document_type') and doc['document_type'] != 'unknown':
                 structured = self.ocr.extract_structured_data(
-                    doc['file_path'],
+                    doc.get('ocr_document') or doc['file_path'],
                     doc['document_type']
                 )
                 doc['structured_data'] = structured
                 print(f"   ✓ {doc['filename']}: {len(structured)} fields extracted")
+            
+            # OCR results are no longer needed; release the preprocessed image
+            doc.pop('ocr_document', None)
         
         print()
         
@@ -176,7 +240,8 @@ class EnrollmentAutomationSystem:
             'validation_status': application_validation['application_status'],
             'documents': result['documents'],
             'missing_documents': application_validation.get('missing_documents', []),
-            'issues': application_validation.get('errors', [])
+            'issues': application_validation.get('errors', []),
+            'unreadable_documents': self._unreadable_documents(result)
         }
         
         routing = self.router.route_application(routing_data)
@@ -245,25 +310,35 @@ class EnrollmentAutomationSystem:
         
         return result
     
-    def _process_document(self, doc_file: Dict) -> Dict:
-        """Process a single document with OCR"""
+    def _process_document(self, doc_file: Dict, duplicate_scope: str = None) -> Dict:
+        """Process a single document with OCR (near-duplicates reused only within duplicate_scope)"""
         file_path = doc_file.get('path')
         filename = os.path.basename(file_path)
         
         print(f"   📄 Processing: {filename}")
         
         try:
-            # Extract text
-            text = self.ocr.extract_text(file_path)
-            
-            # Get confidence score
-            confidence = self.ocr.get_confidence_score(file_path)
+            if self.config.get('two_tier_ocr'):
+                ocr_document, ocr_tier = self._two_tier_ocr(file_path, duplicate_scope)
+            else:
+                # Single OCR pass: text, word data and confidence together
+                ocr_document = self.ocr.process_document(file_path, duplicate_scope=duplicate_scope)
+                ocr_tier = 'full'
+            self.stats['ocr_tiers'][ocr_tier] += 1
+            if ocr_document.reused:
+                self.stats['ocr_reused'] += 1
+                print("      ♻️  Near-duplicate of an earlier upload: OCR reused")
+            text = ocr_document.text
+            confidence = ocr_document.confidence
             
             # Quality assessment
-            quality = self.classifier.validate_document_quality(text, confidence)
+            quality = self.classifier.validate_document_quality(ocr_document)
             
             print(f"      OCR Confidence: {confidence:.1f}%")
             print(f"      Quality Score: {quality['quality_score']}/100")
+            if ocr_document.preprocessing:
+                stages = ocr_document.preprocessing.get('stages', [])
+                print(f"      Preprocessing ({ocr_document.preprocessing['profile']}): {', '.join(stages) or 'none'}")
             
             return {
                 'filename': filename,
@@ -271,7 +346,26 @@ class EnrollmentAutomationSystem:
                 'extracted_text': text,
                 'ocr_confidence': confidence,
                 'quality': quality,
-                'ocr_status': 'success'
+                'preprocessing': ocr_document.preprocessing,
+                'ocr_tier': ocr_tier,
+                'ocr_reused': ocr_document.reused,
+                'ocr_status': 'success',
+                'ocr_document': ocr_document
+            }
+        except UnreadableDocumentError as e:
+            # Rejected before OCR: the student is asked to upload it again
+            self.stats['unreadable_documents'] += 1
+            for reason in e.reasons:
+                self.stats['unreadable_reasons'][reason] = self.stats['unreadable_reasons'].get(reason, 0) + 1
+            print(f"      ⚠️  Unreadable ({', '.join(e.reasons)}): re-upload requested, OCR skipped")
+            return {
+                'filename': filename,
+                'file_path': file_path,
+                'extracted_text': '',
+                'ocr_confidence': 0,
+                'quality': {'quality_score': 0, 'is_acceptable': False},
+                'ocr_status': 'unreadable',
+                'readability': {'reasons': e.reasons, 'metrics': e.metrics}
             }
         except Exception as e:
             print(f"      ❌ Error: {str(e)}")
@@ -285,6 +379,34 @@ class EnrollmentAutomationSystem:
                 'error': str(e)
             }
     
+    def _two_tier_ocr(self, file_path: str, duplicate_scope: str = None):
+        """
+        Classify from a cheap header pass; run full OCR only for documents we extract from
+        
+        Returns:
+            (OCRDocument, tier) where tier is 'header_only' or 'full'
+        """
+        header = self.ocr.ocr_header(file_path)
+        header_class = self.classifier.classify_document(
+            header.text,
+            confidence_threshold=self.config.get('header_confidence_threshold', 0.05),
+            # The full result is classified again later; count each document once
+            record_stats=False
+        )
+        
+        if header_class['document_type'] == 'unknown' or not self.ocr.supports_extraction(header_class['document_type']):
+            print(f"      Header pass: {header_class['document_type']} (full OCR skipped)")
+            return header, 'header_only'
+        
+        # The header pass told us the type: the full pass uses that type's OCR settings
+        print(f"      Header pass: {header_class['document_type']} → full OCR")
+        full = self.ocr.process_document(
+            file_path,
+            duplicate_scope=duplicate_scope,
+            document_type=header_class['document_type']
+        )
+        return full, 'full'
+    
     def _send_student_notification(self, status: str, application_data: Dict, result: Dict) -> Dict:
         """Send notification to student"""
         student = {
@@ -299,6 +421,11 @@ class EnrollmentAutomationSystem:
             'requires_review': 'manual_review_required',
         }.get(status, 'application_received')
         
+        # Unreadable uploads are the first thing the student has to fix
+        unreadable = self._unreadable_documents(result)
+        if unreadable:
+            notification_type = 'document_reupload'
+        
         notification_data = {
             'application_id': result['application_id'],
             'program': application_data.get('program'),
@@ -306,6 +433,7 @@ class EnrollmentAutomationSystem:
             'documents': [doc['filename'] for doc in result['documents']],
             'missing_documents': result['validation'].get('missing_documents', []),
             'issues': result['validation'].get('errors', []),
+            'unreadable_documents': unreadable,
             'start_date': 'January 15, 2026',
             'payment_deadline': 'December 15, 2025',
             'orientation_date': 'January 10, 2026'
@@ -317,6 +445,18 @@ class EnrollmentAutomationSystem:
         
         return notif_result
     
+    @staticmethod
+    def _unreadable_documents(result: Dict) -> List[Dict]:
+        """Documents the readability gate rejected, with their reason codes"""
+        return [
+            {
+                'filename': doc['filename'],
+                'reasons': doc['readability']['reasons'],
+                'instructions': [READABILITY_REASONS[reason] for reason in doc['readability']['reasons']]
+            }
+            for doc in result['documents'] if doc['ocr_status'] == 'unreadable'
+        ]
+    
     def _send_staff_notification(self, routing: Dict, application_data: Dict, result: Dict) -> Dict:
         """Send notification to assigned staff"""
         staff = {
@@ -349,6 +489,24 @@ class EnrollmentAutomationSystem:
         
         return notif_result
     
+    def record_type_correction(self, doc: Dict, document_type: str):
+        """
+        Apply a staff override of a document's type from manual review
+        
+        The document is relabelled and the correction is queued for the
+        classifier, which learns it in its next micro-batch and checkpoints
+        to classifier_model_path for the other workers to pick up (merged with
+        any checkpoint another worker saved there meanwhile).
+        
+        Args:
+            doc: Processed document from process_application's result
+            document_type: Type assigned by staff
+        """
+        self.classifier.record_correction(doc['extracted_text'], document_type)
+        doc['document_type'] = document_type
+        doc.setdefault('classification', {})['corrected_by_staff'] = True
+        self.stats['type_corrections'] += 1
+    
     def _generate_application_report(self, result: Dict):
         """Generate detailed application report"""
         report_path = self.output_dir / 'reports' / f"{result['application_id']}_report.json"
@@ -367,11 +525,20 @@ class EnrollmentAutomationSystem:
         avg_time = (self.stats['total_processing_time'] / self.stats['applications_processed'] 
                    if self.stats['applications_processed'] > 0 else 0)
         
-        return {
+        statistics = {
             **self.stats,
             'average_processing_time': round(avg_time, 2),
             'automation_rate': round(self.stats['auto_approved'] / max(self.stats['applications_processed'], 1) * 100, 1)
         }
+        
+        if self.ocr_cache is not None:
+            statistics['ocr_cache'] = self.ocr_cache.get_stats()
+        if self.duplicate_index is not None:
+            statistics['duplicate_index'] = self.duplicate_index.get_stats()
+        if self.classifier.method == 'cascade':
+            statistics['classification_cascade'] = self.classifier.get_cascade_stats()
+        
+        return statistics
     
     def generate_summary_report(self):
         """Generate summary report of all processing"""
@@ -387,6 +554,21 @@ class EnrollmentAutomationSystem:
         print(f"Incomplete: {stats['incomplete']}")
         print(f"Average Processing Time: {stats['average_processing_time']:.2f} seconds")
         print(f"Automation Rate: {stats['automation_rate']:.1f}%")
+        if self.config.get('two_tier_ocr'):
+            tiers = stats['ocr_tiers']
+            print(f"OCR Tiers: {tiers['header_only']} header-only / {tiers['full']} full")
+        if 'ocr_cache' in stats:
+            cache_stats = stats['ocr_cache']
+            print(f"OCR Cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses ({cache_stats['hit_rate']:.1f}% hit rate)")
+        if 'duplicate_index' in stats:
+            print(f"Near-Duplicates Reused: {stats['ocr_reused']} ({stats['duplicate_index']['entries']} indexed)")
+        if 'classification_cascade' in stats:
+            cascade = stats['classification_cascade']
+            print(f"Classification: {cascade['rule_based_resolved']} by rules / {cascade['ml_documents']} sent to model "
+                  f"({cascade['escalation_rate']:.1f}% escalated, {cascade['ms_per_document']:.2f} ms per document)")
+        if stats['unreadable_documents']:
+            reasons = ', '.join(f"{reason} {count}" for reason, count in stats['unreadable_reasons'].items())
+            print(f"Unreadable (re-upload requested, OCR skipped): {stats['unreadable_documents']} ({reasons})")
         print("="*70)
         
         # Save to file
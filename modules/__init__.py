@@ -1,18 +1,49 @@
 """
 RPA/AI Automation Modules for Career College Enrollment Processing
+
+Exports are imported on first access (PEP 562), so importing one component
+(e.g. NotificationSystem) does not load the OCR stack or scikit-learn.
 """
 
-from .ocr_engine import OCREngine
-from .document_classifier import DocumentClassifier
-from .validator import EnrollmentValidator
-from .notification_system import NotificationSystem
-from .workflow_router import WorkflowRouter
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .ocr_engine import OCREngine, OCRDocument, UnreadableDocumentError, OCRCancelledError
+    from .ocr_cache import OCRCache
+    from .ocr_async import AsyncOCREngine
+    from .duplicate_index import PerceptualHashIndex
+    from .document_classifier import DocumentClassifier
+    from .validator import EnrollmentValidator
+    from .notification_system import NotificationSystem
+    from .workflow_router import WorkflowRouter
+
+# Exported name -> submodule defining it
+_EXPORTS = {
+    'OCREngine': 'ocr_engine',
+    'OCRDocument': 'ocr_engine',
+    'UnreadableDocumentError': 'ocr_engine',
+    'OCRCancelledError': 'ocr_engine',
+    'OCRCache': 'ocr_cache',
+    'AsyncOCREngine': 'ocr_async',
+    'PerceptualHashIndex': 'duplicate_index',
+    'DocumentClassifier': 'document_classifier',
+    'EnrollmentValidator': 'validator',
+    'NotificationSystem': 'notification_system',
+    'WorkflowRouter': 'workflow_router',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
 
-__all__ = [
-    'OCREngine',
-    'DocumentClassifier',
-    'EnrollmentValidator',
-    'NotificationSystem',
-    'WorkflowRouter'
-]
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,11 +4,64 @@ Identifies document types and validates completeness
 """
 
 import re
+import os
+import json
+import time
+from pathlib import Path
 from typing import Dict, List, Tuple
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.naive_bayes import MultinomialNB
 import pickle
-import numpy as np
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: concurrent checkpoints are not serialized
+    fcntl = None
+
+from .keyword_matcher import KeywordMatcher
+
+
+# How classify_document and classify_batch decide a document's type
+#   rule_based: keyword scores (no training needed)
+#   ml:         TF-IDF + Naive Bayes model from DocumentClassifier.train
+#   cascade:    keyword scores first; only documents they leave below the
+#               confidence threshold go to the model, batched per call
+CLASSIFICATION_METHODS = ['rule_based', 'ml', 'cascade']
+
+# Layout of saved model artifacts; artifacts with another version are refused
+MODEL_FORMAT_VERSION = 1
+
+# Hash buckets of the online model's HashingVectorizer (the model keeps one
+# count per bucket and type, so this sets its memory and artifact size)
+ONLINE_HASH_FEATURES = 2 ** 16
+
+
+def load_labeled_corpus(path: str) -> Tuple[List[str], List[str]]:
+    """
+    Read a labeled text corpus for DocumentClassifier.train
+    
+    Args:
+        path: A JSON Lines file with one {"text": ..., "label": ...} object per
+            line, or a directory with one subdirectory of .txt files per label
+            
+    Returns:
+        (texts, labels)
+    """
+    path = Path(path)
+    texts, labels = [], []
+    if path.is_dir():
+        for label_dir in sorted(p for p in path.iterdir() if p.is_dir()):
+            for text_file in sorted(label_dir.glob('*.txt')):
+                texts.append(text_file.read_text(encoding='utf-8', errors='replace'))
+                labels.append(label_dir.name)
+        return texts, labels
+    
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                texts.append(record['text'])
+                labels.append(record['label'])
+    return texts, labels
 
 
 class DocumentClassifier:
@@ -16,7 +69,19 @@ class DocumentClassifier:
     Classifies enrollment documents using rule-based + ML approach
     """
     
-    def __init__(self):
+    def __init__(self, whole_word_keywords: bool = False, method: str = 'rule_based', model_path: str = None):
+        """
+        Args:
+            whole_word_keywords: Count a keyword only as a whole word ('sex' no longer
+                matches 'Essex'); the default matches substrings, as the scores always have
+            method: Classification method from CLASSIFICATION_METHODS
+            model_path: Saved model artifact for the 'ml' and 'cascade' methods, loaded on
+                first use and reloaded when a newer checkpoint replaces it. Until a
+                model is trained or saved there, those methods use the keyword rules.
+        """
+        if method not in CLASSIFICATION_METHODS:
+            raise ValueError(f"Unknown classification method: {method} (available: {', '.join(CLASSIFICATION_METHODS)})")
+        
         self.document_types = [
             'government_id',
             'drivers_license', 
@@ -70,37 +135,70 @@ class DocumentClassifier:
             ]
         }
         
+        self.whole_word_keywords = whole_word_keywords
+        self.compile_keywords()
+        
+        self.method = method
+        self.model_path = model_path
         self.vectorizer = None
         self.model = None
+        self.model_info = {}
+        
+        # Online learning from staff corrections (see record_correction)
+        self.online_classes = [t for t in self.document_types if t != 'unknown']
+        self.correction_batch_size = 16   # Corrections applied per partial_fit
+        self.checkpoint_every = 64        # Applied corrections between saved checkpoints...
+        self.checkpoint_interval = 300.0  # ...or seconds, whichever comes first
+        self.reload_interval = 30.0       # Seconds between checks for a newer artifact (None = never)
+        self._pending_corrections = []
+        # Corrections learned but not yet saved, replayed onto a newer artifact (see checkpoint)
+        self._unsaved_corrections = []
+        self._last_checkpoint = time.monotonic()
+        self._model_mtime = None
+        self._last_reload_check = time.monotonic()
         
-    def classify_document(self, text: str, confidence_threshold: float = 0.6) -> Dict:
+        # Work done by each tier of the cascade (see get_cascade_stats)
+        self.cascade_stats = {
+            'documents': 0,
+            'rule_based_resolved': 0,
+            'rule_based_seconds': 0.0,
+            'ml_documents': 0,
+            'ml_calls': 0,
+            'ml_resolved': 0,
+            'ml_seconds': 0.0
+        }
+        
+    def compile_keywords(self):
+        """Rebuild the keyword matcher; call after changing self.keywords"""
+        self.keyword_matcher = KeywordMatcher(self.keywords, whole_words=self.whole_word_keywords)
+        
+    def classify_document(self, text: str, confidence_threshold: float = 0.6,
+                          record_stats: bool = True) -> Dict:
         """
         Classify document based on extracted text
         
         Args:
             text: Extracted text from OCR
             confidence_threshold: Minimum confidence for classification
+            record_stats: Count this call in cascade_stats; False for probes (e.g. a
+                header pass) of a document that is classified again afterwards
             
         Returns:
             Dictionary with document_type, confidence, and matched_keywords
         """
+        if self.method == 'ml':
+            return self.classify_ml([text], confidence_threshold)[0]
+        if self.method == 'cascade':
+            return self.classify_cascade([text], confidence_threshold, record_stats)[0]
+        return self.classify_rules(text, confidence_threshold)
+    
+    def classify_rules(self, text: str, confidence_threshold: float = 0.6) -> Dict:
+        """Keyword-score classification (classification_method 'rule_based')"""
         text_lower = text.lower()
         
-        # Rule-based classification (fast and accurate for known patterns)
-        scores = {}
-        matched_keywords = {}
-        
-        for doc_type, keywords in self.keywords.items():
-            matches = []
-            score = 0
-            for keyword in keywords:
-                if keyword in text_lower:
-                    matches.append(keyword)
-                    # Weight longer keywords more heavily
-                    score += len(keyword.split())
-            
-            scores[doc_type] = score
-            matched_keywords[doc_type] = matches
+        # Rule-based classification (fast and accurate for known patterns):
+        # one pass finds every keyword; longer keywords weigh more (one point per word)
+        scores, matched_keywords = self.keyword_matcher.match(text_lower)
         
         # Get best match
         if scores:
@@ -108,7 +206,7 @@ class DocumentClassifier:
             max_score = scores[best_type]
             
             # Calculate confidence based on keyword matches
-            total_possible_score = sum(len(kw.split()) for kw in self.keywords[best_type])
+            total_possible_score = self.keyword_matcher.max_scores[best_type]
             confidence = min(max_score / total_possible_score, 1.0) if total_possible_score > 0 else 0
             
             if confidence >= confidence_threshold:
@@ -126,17 +224,466 @@ class DocumentClassifier:
             'classification_method': 'rule_based'
         }
     
-    def validate_document_quality(self, text: str, ocr_confidence: float = None) -> Dict:
+    def classify_ml(self, texts: List[str], confidence_threshold: float = 0.6) -> List[Dict]:
+        """
+        Classify texts with the trained model in one vectorizer and predict_proba call
+        
+        Without a model (none trained, no model_path, or nothing saved there
+        yet) the keyword rules classify the texts instead, so a misconfigured
+        or not yet trained model never fails a whole application.
+        
+        Args:
+            texts: Extracted texts
+            confidence_threshold: Minimum class probability; below it the type is 'unknown'
+            
+        Returns:
+            One classify_document-style dictionary per text (classification_method 'ml',
+            no matched_keywords; 'rule_based' without a model)
+        """
+        if not texts:
+            return []
+        
+        if not self._ensure_model():
+            return [self.classify_rules(text, confidence_threshold) for text in texts]
+        # One consistent pair even if a newer checkpoint is swapped in meanwhile
+        vectorizer, model = self.vectorizer, self.model
+        probabilities = model.predict_proba(vectorizer.transform(texts))
+        best = probabilities.argmax(axis=1)
+        
+        results = []
+        for row, index in zip(probabilities, best):
+            confidence = float(row[index])
+            if confidence >= confidence_threshold:
+                results.append({
+                    'document_type': str(model.classes_[index]),
+                    'confidence': round(confidence, 2),
+                    'matched_keywords': [],
+                    'classification_method': 'ml'
+                })
+            else:
+                results.append({
+                    'document_type': 'unknown',
+                    'confidence': 0.0,
+                    'matched_keywords': [],
+                    'classification_method': 'ml'
+                })
+        return results
+    
+    def classify_cascade(self, texts: List[str], confidence_threshold: float = 0.6,
+                         record_stats: bool = True) -> List[Dict]:
+        """
+        Classify with the keyword rules, falling back to the model for what they can't decide
+        
+        Every text is scored by the rules; those left 'unknown' (below
+        confidence_threshold) are classified by the model in one classify_ml
+        call, or stay 'unknown' while there is no model. Counts and time per
+        tier accumulate in cascade_stats.
+        
+        Args:
+            texts: Extracted texts
+            confidence_threshold: Minimum confidence for both tiers; raising it
+                sends more documents to the slower model
+            record_stats: Accumulate this call in cascade_stats (default: True)
+            
+        Returns:
+            One classify_document-style dictionary per text; classification_method
+            tells which tier decided it
+        """
+        # Unrecorded calls count into a scratch copy that is thrown away
+        stats = self.cascade_stats if record_stats else dict(self.cascade_stats)
+        start = time.perf_counter()
+        results = [self.classify_rules(text, confidence_threshold) for text in texts]
+        stats['rule_based_seconds'] += time.perf_counter() - start
+        stats['documents'] += len(texts)
+        
+        undecided = [i for i, result in enumerate(results) if result['document_type'] == 'unknown']
+        stats['rule_based_resolved'] += len(texts) - len(undecided)
+        if not undecided or not self._ensure_model():
+            return results
+        
+        start = time.perf_counter()
+        fallback = self.classify_ml([texts[i] for i in undecided], confidence_threshold)
+        stats['ml_seconds'] += time.perf_counter() - start
+        stats['ml_documents'] += len(undecided)
+        stats['ml_calls'] += 1
+        
+        for i, result in zip(undecided, fallback):
+            if result['document_type'] != 'unknown':
+                stats['ml_resolved'] += 1
+            results[i] = result
+        return results
+    
+    def get_cascade_stats(self) -> Dict:
+        """Get per-tier counts and latency of the cascade"""
+        stats = self.cascade_stats
+        documents = stats['documents']
+        return {
+            **stats,
+            'escalation_rate': round(stats['ml_documents'] / documents * 100, 1) if documents else 0.0,
+            'rule_based_ms_per_document': round(stats['rule_based_seconds'] * 1000 / documents, 3) if documents else 0.0,
+            'ml_ms_per_document': (
+                round(stats['ml_seconds'] * 1000 / stats['ml_documents'], 3) if stats['ml_documents'] else 0.0
+            ),
+            'ms_per_document': (
+                round((stats['rule_based_seconds'] + stats['ml_seconds']) * 1000 / documents, 3) if documents else 0.0
+            )
+        }
+    
+    def train(self, texts: List[str], labels: List[str], model_path: str = None) -> Dict:
+        """
+        Fit the TF-IDF + Naive Bayes model on a labeled corpus
+        
+        Args:
+            texts: Document texts (OCR output)
+            labels: Document type of each text
+            model_path: Where to save the trained artifact (default: keep it in memory only)
+            
+        Returns:
+            Model info: versions, training date, document count, classes and vocabulary size
+            
+        Raises:
+            ValueError: If texts and labels differ in length or fewer than two types are given
+        """
+        if len(texts) != len(labels):
+            raise ValueError(f"Got {len(texts)} texts but {len(labels)} labels")
+        if len(set(labels)) < 2:
+            raise ValueError("Training needs examples of at least two document types")
+        
+        # scikit-learn takes about a second to import: only training and
+        # loading a model (through pickle) pay for it, never rule-based runs
+        import sklearn
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.naive_bayes import MultinomialNB
+        
+        # Word unigrams and bigrams, so phrases like 'photo card' count as features
+        vectorizer = TfidfVectorizer(ngram_range=(1, 2), sublinear_tf=True, max_features=50000)
+        model = MultinomialNB(alpha=0.1)
+        model.fit(vectorizer.fit_transform(texts), labels)
+        
+        self.vectorizer = vectorizer
+        self.model = model
+        self.model_info = {
+            'format_version': MODEL_FORMAT_VERSION,
+            'kind': 'tfidf',
+            'model_version': time.strftime('%Y%m%d%H%M%S', time.gmtime()),
+            'trained_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'sklearn_version': sklearn.__version__,
+            'documents': len(texts),
+            'classes': [str(label) for label in model.classes_],
+            'vocabulary_size': len(vectorizer.vocabulary_)
+        }
+        
+        if model_path:
+            self.save_model(model_path)
+        return dict(self.model_info)
+    
+    def partial_fit(self, texts: List[str], labels: List[str]) -> Dict:
+        """
+        Update the model with a micro-batch of labeled texts
+        
+        Without a model (none trained, configured or saved yet) this starts an
+        online one: a stateless HashingVectorizer, which needs no vocabulary
+        and so vectorizes any future text, and a MultinomialNB updated in place
+        by partial_fit. Each batch is learned without the earlier ones, so
+        neither a retrain nor the corpus is needed. A TF-IDF model from train()
+        can be updated too, but only learns from words already in its vocabulary.
+        The model is only replaced once the update succeeded, so a rejected
+        batch leaves the previous one (or none) in place.
+        
+        Args:
+            texts: Document texts
+            labels: Document type of each text
+            
+        Returns:
+            Model info after the update
+            
+        Raises:
+            ValueError: If texts and labels differ in length or a label is not a type the model knows
+        """
+        if len(texts) != len(labels):
+            raise ValueError(f"Got {len(texts)} texts but {len(labels)} labels")
+        
+        if self.model is None and self.model_path and os.path.exists(self.model_path):
+            self.load_model()
+        
+        known = self._known_classes()
+        unknown = sorted(set(labels) - set(known))
+        if unknown:
+            raise ValueError(f"Unknown document type(s): {', '.join(unknown)} (model knows: {', '.join(known)})")
+        if not texts:
+            return dict(self.model_info)
+        
+        if self.model is None:
+            vectorizer, model, info = self._new_online_model()
+            # The first update of a new model must name every class it will ever see
+            model.partial_fit(vectorizer.transform(texts), labels, classes=self.online_classes)
+            self.vectorizer, self.model, self.model_info = vectorizer, model, info
+        else:
+            self.model.partial_fit(self.vectorizer.transform(texts), labels)
+        
+        info = self.model_info
+        info['documents'] = info.get('documents', 0) + len(texts)
+        info['updates'] = info.get('updates', 0) + 1
+        info['updated_at'] = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+        return dict(info)
+    
+    def _known_classes(self) -> List[str]:
+        """Document types the current model can learn (any online class before its first update)"""
+        return [str(label) for label in getattr(self.model, 'classes_', self.online_classes)]
+    
+    def _new_online_model(self) -> Tuple:
+        """
+        Empty HashingVectorizer + MultinomialNB model for partial_fit
+        
+        Returns:
+            (vectorizer, model, model info)
+        """
+        import sklearn
+        from sklearn.feature_extraction.text import HashingVectorizer
+        from sklearn.naive_bayes import MultinomialNB
+        
+        # Counts must stay non-negative for Naive Bayes, hence no alternating signs
+        vectorizer = HashingVectorizer(
+            n_features=ONLINE_HASH_FEATURES, ngram_range=(1, 2), alternate_sign=False
+        )
+        # Uniform priors: the mix of types staff happen to correct says nothing
+        # about how common each type is among uploads
+        model = MultinomialNB(alpha=0.1, fit_prior=False)
+        info = {
+            'format_version': MODEL_FORMAT_VERSION,
+            'kind': 'online',
+            'model_version': time.strftime('%Y%m%d%H%M%S', time.gmtime()),
+            'trained_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'sklearn_version': sklearn.__version__,
+            'documents': 0,
+            'updates': 0,
+            'classes': list(self.online_classes),
+            'hash_features': ONLINE_HASH_FEATURES
+        }
+        return vectorizer, model, info
+    
+    def record_correction(self, text: str, document_type: str) -> int:
+        """
+        Queue a staff override of a document's type for the model
+        
+        Corrections are applied with partial_fit once correction_batch_size
+        have queued up, and the model is checkpointed to model_path every
+        checkpoint_every corrections or checkpoint_interval seconds, where
+        other processes' classifiers pick it up (see reload_interval).
+        
+        Args:
+            text: The document's extracted text
+            document_type: Type staff assigned in manual review
+            
+        Returns:
+            Number of corrections applied now (0 while the batch fills up)
+            
+        Raises:
+            ValueError: If document_type is not a type the model knows
+        """
+        # Validate against the configured artifact, not the defaults it may replace
+        if self.model is None and self.model_path and os.path.exists(self.model_path):
+            self.load_model()
+        if document_type not in self._known_classes():
+            raise ValueError(f"Unknown document type: {document_type}")
+        
+        self._pending_corrections.append((text, document_type))
+        if len(self._pending_corrections) < self.correction_batch_size:
+            return 0
+        return self.apply_corrections()
+    
+    def apply_corrections(self) -> int:
+        """
+        Apply queued corrections now (e.g. at shutdown), checkpointing if one is due
+        
+        Returns:
+            Number of corrections applied
+            
+        Raises:
+            ValueError: If the model rejects a label; the batch stays queued
+        """
+        pending, self._pending_corrections = self._pending_corrections, []
+        if pending:
+            texts, labels = zip(*pending)
+            try:
+                self.partial_fit(list(texts), list(labels))
+            except Exception:
+                self._pending_corrections = pending + self._pending_corrections
+                raise
+            self._unsaved_corrections += pending
+        
+        due = (len(self._unsaved_corrections) >= self.checkpoint_every or
+               time.monotonic() - self._last_checkpoint >= self.checkpoint_interval)
+        if due and self._unsaved_corrections and self.model_path:
+            self.checkpoint()
+        return len(pending)
+    
+    def checkpoint(self) -> Dict:
+        """
+        Save the updated model to model_path under a new model_version
+        
+        Several workers may learn corrections against the same model_path. If
+        another one saved a checkpoint since this model was loaded or saved,
+        that artifact is loaded and this worker's unsaved corrections are
+        replayed onto it before saving, so neither worker's corrections are
+        lost. Checkpoints are serialized with a lock file next to the artifact.
+        
+        Returns:
+            Model info of the checkpoint
+        """
+        with self._checkpoint_lock():
+            self._merge_saved_model()
+            info = self.model_info
+            info['model_version'] = f"{time.strftime('%Y%m%d%H%M%S', time.gmtime())}-{info.get('updates', 0)}"
+            self.save_model()
+        self._unsaved_corrections = []
+        self._last_checkpoint = time.monotonic()
+        return dict(info)
+    
+    @contextmanager
+    def _checkpoint_lock(self):
+        """Exclusive lock on model_path's '.lock' file (no-op without fcntl)"""
+        if fcntl is None:
+            yield
+            return
+        path = Path(self.model_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path.with_suffix(path.suffix + '.lock'), 'a') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+    
+    def _merge_saved_model(self):
+        """Load a newer artifact saved to model_path by another worker and replay unsaved corrections onto it"""
+        if not self._unsaved_corrections:
+            return
+        try:
+            mtime = os.stat(self.model_path).st_mtime_ns
+        except OSError:
+            return
+        if mtime == self._model_mtime:
+            return
+        
+        unsaved = self._unsaved_corrections
+        self.load_model()
+        # Types the saved model does not know cannot be learned by it
+        known = set(self._known_classes())
+        replay = [(text, label) for text, label in unsaved if label in known]
+        if replay:
+            texts, labels = zip(*replay)
+            self.partial_fit(list(texts), list(labels))
+    
+    def save_model(self, model_path: str = None):
+        """
+        Write the trained model to a pickle artifact (atomically, so readers never see half a file)
+        
+        Args:
+            model_path: Destination (default: self.model_path)
+        """
+        if self.model is None:
+            raise RuntimeError("No trained model to save")
+        path = Path(model_path or self.model_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'info': self.model_info, 'vectorizer': self.vectorizer, 'model': self.model}, f)
+        os.replace(tmp_path, path)
+        self.model_path = str(path)
+        self._model_mtime = path.stat().st_mtime_ns
+    
+    def load_model(self, model_path: str = None) -> Dict:
+        """
+        Load a model artifact written by save_model
+        
+        Artifacts are pickles: only load files this system trained.
+        
+        Args:
+            model_path: Artifact to load (default: self.model_path)
+            
+        Returns:
+            The artifact's model info
+            
+        Raises:
+            ValueError: If the artifact has a different MODEL_FORMAT_VERSION
+        """
+        path = model_path or self.model_path
+        with open(path, 'rb') as f:
+            mtime = os.fstat(f.fileno()).st_mtime_ns
+            artifact = pickle.load(f)
+        
+        info = artifact.get('info', {}) if isinstance(artifact, dict) else {}
+        if info.get('format_version') != MODEL_FORMAT_VERSION:
+            raise ValueError(
+                f"Model artifact {path} has format version {info.get('format_version')}, "
+                f"expected {MODEL_FORMAT_VERSION}; retrain the model"
+            )
+        
+        self.vectorizer = artifact['vectorizer']
+        self.model = artifact['model']
+        self.model_info = info
+        self.model_path = str(path)
+        self._model_mtime = mtime
+        return dict(info)
+    
+    def _ensure_model(self) -> bool:
+        """
+        Load the configured artifact on first ML use, and swap in newer checkpoints of it
+        
+        Returns:
+            True if a model can classify, False if none was trained or saved to
+            model_path yet, or it is an online model that has not yet learned
+            every type (it would only ever answer with the types it has seen)
+        """
+        if self.model is not None:
+            self._reload_if_changed()
+        elif not self.model_path or not os.path.exists(self.model_path):
+            return False
+        else:
+            self.load_model()
+        
+        if self.model_info.get('kind') == 'online':
+            return all(count > 0 for count in getattr(self.model, 'class_count_', [0]))
+        return True
+    
+    def _reload_if_changed(self):
+        """Load model_path again if another process saved a newer model there"""
+        if self.reload_interval is None or not self.model_path:
+            return
+        # Unsaved corrections of our own would be lost by a reload
+        if self._unsaved_corrections or self._pending_corrections:
+            return
+        now = time.monotonic()
+        if now - self._last_reload_check < self.reload_interval:
+            return
+        self._last_reload_check = now
+        
+        try:
+            mtime = os.stat(self.model_path).st_mtime_ns
+        except OSError:
+            return
+        if mtime != self._model_mtime:
+            self.load_model()
+    
+    def validate_document_quality(self, text, ocr_confidence: float = None) -> Dict:
         """
         Assess document quality and readability
         
         Args:
-            text: Extracted text
+            text: Extracted text, or an OCRDocument (its text and confidence are used)
             ocr_confidence: OCR confidence score (0-100)
             
         Returns:
             Quality assessment dictionary
         """
+        # Accept OCREngine.process_document results without importing the OCR stack
+        if hasattr(text, 'text') and hasattr(text, 'confidence'):
+            if ocr_confidence is None:
+                ocr_confidence = text.confidence
+            text = text.text
+        
         issues = []
         quality_score = 100
         
@@ -224,19 +771,31 @@ class DocumentClassifier:
             'completeness_percentage': round((len(required) - len(missing)) / len(required) * 100, 1)
         }
     
-    def classify_batch(self, documents: List[Dict]) -> List[Dict]:
+    def classify_batch(self, documents: List[Dict], confidence_threshold: float = 0.6) -> List[Dict]:
         """
         Classify multiple documents
         
+        With the 'ml' method the whole batch is vectorized into one sparse
+        matrix and scored with a single predict_proba call; with 'cascade' the
+        same happens for the documents the rules leave undecided.
+        
         Args:
             documents: List of dicts with 'text' and optionally 'file' keys
+            confidence_threshold: Minimum confidence for classification
             
         Returns:
             List of classification results
         """
+        texts = [doc.get('text', '') for doc in documents]
+        if self.method == 'ml':
+            classifications = self.classify_ml(texts, confidence_threshold)
+        elif self.method == 'cascade':
+            classifications = self.classify_cascade(texts, confidence_threshold)
+        else:
+            classifications = [self.classify_rules(text, confidence_threshold) for text in texts]
+        
         results = []
-        for doc in documents:
-            classification = self.classify_document(doc.get('text', ''))
+        for doc, classification in zip(documents, classifications):
             result = {
                 'file': doc.get('file', 'unknown'),
                 **classification
@@ -303,7 +862,33 @@ class DocumentClassifier:
         return base_requirements
 
 
+def main():
+    """Train the ML model from a labeled corpus (python -m modules.document_classifier --train CORPUS)"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Train the document classifier's TF-IDF + Naive Bayes model")
+    parser.add_argument('--train', metavar='CORPUS', required=True,
+                        help='JSON Lines file of {"text", "label"} records, or a directory per label of .txt files')
+    parser.add_argument('--model', metavar='PATH', default='models/document_classifier.pkl',
+                        help='Where to save the model artifact')
+    args = parser.parse_args()
+    
+    texts, labels = load_labeled_corpus(args.train)
+    info = DocumentClassifier(method='ml').train(texts, labels, model_path=args.model)
+    print(f"Trained model {info['model_version']} on {info['documents']} documents")
+    print(f"  Classes: {', '.join(info['classes'])}")
+    print(f"  Vocabulary: {info['vocabulary_size']} terms")
+    print(f"  Saved to: {args.model}")
+
+
 if __name__ == "__main__":
+    # Run as python -m modules.document_classifier [--train CORPUS] from the project
+    # root; the package-relative imports above fail when the file is run as a script
+    import sys
+    if len(sys.argv) > 1:
+        main()
+        sys.exit()
+    
     # Example usage
     classifier = DocumentClassifier()
     
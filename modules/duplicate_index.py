@@ -0,0 +1,235 @@
+"""
+Near-Duplicate Document Index
+Perceptual hashes of processed documents, so re-uploads of the same scan can reuse its OCR
+"""
+
+import base64
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+HASH_BITS = 64
+CHUNK_BITS = 16
+
+
+def dhash(gray: np.ndarray) -> int:
+    """
+    Difference hash of a grayscale image
+    
+    The image is shrunk to 9x8 and each bit records whether a pixel is brighter
+    than its right-hand neighbour, so renaming, recompression and rescaling
+    leave the hash (nearly) unchanged.
+    
+    Args:
+        gray: Grayscale image
+        
+    Returns:
+        64-bit hash
+    """
+    thumbnail = cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA)
+    bits = (thumbnail[:, 1:] > thumbnail[:, :-1]).flatten()
+    return int(np.packbits(bits).view('>u8')[0])
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count('1')
+
+
+def encode_thumbnail(thumbnail: np.ndarray) -> str:
+    """PNG + base64, for storing a thumbnail in a JSON cache entry"""
+    ok, buffer = cv2.imencode('.png', thumbnail)
+    return base64.b64encode(buffer.tobytes()).decode('ascii')
+
+
+def decode_thumbnail(encoded: str) -> np.ndarray:
+    return cv2.imdecode(np.frombuffer(base64.b64decode(encoded), dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+
+
+class PerceptualHashIndex:
+    """
+    Hamming-distance lookup over document dHashes (multi-index hashing)
+    
+    Each 64-bit hash is split into four 16-bit chunks with one hash table per
+    chunk. Two hashes within max_distance bits differ by at most
+    max_distance // 4 bits in at least one chunk, so a lookup only probes the
+    buckets near each of the query's chunks rather than every entry.
+    
+    A 64-bit hash only captures page layout: two students' cards of the same
+    design hash identically. So entries are scoped (e.g. per student) and only
+    match within their scope, and a hash match is confirmed by comparing
+    small thumbnails tile by tile (verify), which catches a different name
+    printed in the same place. Changes smaller than a tile's worth of pixels
+    (a single digit) can still pass, so reuse stays opt-in.
+    
+    Safe to share between threads; add and find hold a lock.
+    """
+    
+    def __init__(self, path: str = None, max_distance: int = 4, thumbnail_width: int = 128,
+                 tile_size: int = 4, max_tile_difference: float = 4.5):
+        """
+        Initialize index
+        
+        Args:
+            path: File the index is persisted to (appended on every add); None keeps it in memory
+            max_distance: Largest Hamming distance still treated as the same document
+            thumbnail_width: Width of the verification thumbnail
+            tile_size: Side of the thumbnail tiles compared by verify
+            max_tile_difference: Largest mean absolute gray-level difference allowed in any tile
+        """
+        self.path = Path(path) if path else None
+        self.max_distance = max_distance
+        self.thumbnail_width = thumbnail_width
+        self.tile_size = tile_size
+        self.max_tile_difference = max_tile_difference
+        self.chunks = HASH_BITS // CHUNK_BITS
+        
+        # Bit flips to probe per chunk: every mask with up to chunk_radius bits set
+        chunk_radius = max_distance // self.chunks
+        self._probe_masks = [0]
+        for _ in range(chunk_radius):
+            self._probe_masks = sorted(set(self._probe_masks) | {
+                mask | (1 << bit) for mask in self._probe_masks for bit in range(CHUNK_BITS)
+            })
+            
+        self._hashes = []
+        self._keys = []
+        # One table per chunk: (scope, chunk value) -> entry ids
+        self._tables = [{} for _ in range(self.chunks)]
+        self._lock = threading.Lock()
+        
+        self.stats = {
+            'lookups': 0,
+            'matches': 0,
+            'rejected': 0
+        }
+        
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._load()
+            
+    def _split(self, image_hash: int) -> List[int]:
+        mask = (1 << CHUNK_BITS) - 1
+        return [(image_hash >> (i * CHUNK_BITS)) & mask for i in range(self.chunks)]
+        
+    def _insert(self, image_hash: int, key: str, scope: str):
+        entry_id = len(self._hashes)
+        self._hashes.append(image_hash)
+        self._keys.append(key)
+        for table, chunk in zip(self._tables, self._split(image_hash)):
+            table.setdefault((scope, chunk), []).append(entry_id)
+            
+    def _load(self):
+        """Read entries persisted by previous runs"""
+        if not self.path.exists():
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                parts = line.rstrip('\n').split('\t')
+                if len(parts) != 3:
+                    continue
+                try:
+                    self._insert(int(parts[0], 16), parts[1], parts[2])
+                except ValueError:
+                    continue
+                    
+    def add(self, image_hash: int, key: str, scope: str):
+        """
+        Record a processed document
+        
+        Args:
+            image_hash: dhash() of the document image
+            key: Where its results live (an OCRCache key)
+            scope: Namespace lookups are restricted to (e.g. the student's email)
+        """
+        scope = ' '.join(str(scope).split())
+        with self._lock:
+            self._insert(image_hash, key, scope)
+            if self.path is not None:
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(f"{image_hash:016x}\t{key}\t{scope}\n")
+                
+    def find(self, image_hash: int, scope: str) -> Optional[Tuple[str, int]]:
+        """
+        Find the closest recorded document within max_distance
+        
+        Args:
+            image_hash: dhash() of the new document image
+            scope: Only entries added under this scope are considered
+            
+        Returns:
+            (key, Hamming distance) of the nearest match, or None
+        """
+        scope = ' '.join(str(scope).split())
+        with self._lock:
+            self.stats['lookups'] += 1
+            
+            best = None
+            seen = set()
+            for table, chunk in zip(self._tables, self._split(image_hash)):
+                for mask in self._probe_masks:
+                    for entry_id in table.get((scope, chunk ^ mask), ()):
+                        if entry_id in seen:
+                            continue
+                        seen.add(entry_id)
+                        distance = hamming_distance(image_hash, self._hashes[entry_id])
+                        if distance <= self.max_distance and (best is None or distance < best[1]):
+                            best = (self._keys[entry_id], distance)
+                            
+            if best is not None:
+                self.stats['matches'] += 1
+            return best
+        
+    def thumbnail(self, gray: np.ndarray) -> np.ndarray:
+        """Verification thumbnail of a grayscale image (aspect ratio kept)"""
+        (h, w) = gray.shape[:2]
+        height = max(1, round(self.thumbnail_width * h / w))
+        return cv2.resize(gray, (self.thumbnail_width, height), interpolation=cv2.INTER_AREA)
+        
+    def verify(self, thumbnail: np.ndarray, other: np.ndarray) -> bool:
+        """
+        Confirm a hash match: no tile of the thumbnails may differ by more than max_tile_difference
+        
+        Recompression noise is spread thinly over the page; a changed word is
+        concentrated in a few tiles, so the worst tile separates the two.
+        """
+        if other.shape != thumbnail.shape:
+            if abs(other.shape[0] - thumbnail.shape[0]) > 1:
+                with self._lock:
+                    self.stats['rejected'] += 1
+                return False
+            other = cv2.resize(other, (thumbnail.shape[1], thumbnail.shape[0]), interpolation=cv2.INTER_AREA)
+            
+        difference = cv2.absdiff(thumbnail, other).astype(np.float32)
+        t = self.tile_size
+        rows, cols = difference.shape[0] // t, difference.shape[1] // t
+        tiles = difference[:rows * t, :cols * t].reshape(rows, t, cols, t).mean(axis=(1, 3))
+        if float(tiles.max()) > self.max_tile_difference:
+            with self._lock:
+                self.stats['rejected'] += 1
+            return False
+        return True
+        
+    def __len__(self) -> int:
+        return len(self._hashes)
+        
+    def clear(self):
+        """Remove all entries (and the persisted file)"""
+        with self._lock:
+            self._hashes, self._keys = [], []
+            self._tables = [{} for _ in range(self.chunks)]
+            if self.path is not None and self.path.exists():
+                os.remove(self.path)
+            
+    def get_stats(self) -> Dict:
+        """Get lookup counters and size"""
+        with self._lock:
+            return {
+                **self.stats,
+                'entries': len(self._hashes),
+                'max_distance': self.max_distance
+            }
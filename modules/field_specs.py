@@ -0,0 +1,266 @@
+"""
+Declarative Field Extraction Specs
+Per-document-type regex rules for pulling structured fields out of OCR text
+"""
+
+import copy
+import re
+from itertools import islice
+from typing import Dict
+
+
+DATE_PATTERN = r'\b(\d{2}[-/]\d{2}[-/]\d{4}|\d{4}[-/]\d{2}[-/]\d{2})\b'
+
+# Named post-processing steps, applied in order to a matched value
+POSTPROCESSORS = {
+    'strip': str.strip,
+    'upper': str.upper,
+    'title': str.title,
+    'collapse_spaces': lambda value: ' '.join(value.split()),
+}
+
+# Extractor name -> spec. Per spec:
+#   document_type: Value of the result's 'document_type' field
+#   aliases:       Classifier document types handled by this extractor
+#   fields:        Output fields, in output order. Per field:
+#     patterns:    Regexes tried in order; the first match with a non-empty value wins
+#     flags:       re flags for the field's patterns (default none)
+#     group:       Group holding the value (default: 1, or the whole match if the pattern has no groups)
+#     occurrence:  Take the Nth non-overlapping match instead of the first (e.g. the second date)
+#     post:        POSTPROCESSORS names applied to the value
+#     default:     Value when nothing matches (default None; copied per document)
+FIELD_SPECS = {
+    'id': {
+        'document_type': 'government_id',
+        'aliases': ['government_id', 'drivers_license'],
+        'fields': {
+            # Names are usually in caps
+            'full_name': {
+                'patterns': [
+                    r'(?:NAME|SURNAME|GIVEN NAMES?)[\s:]+([A-Z\s]+)',
+                    r'([A-Z]{2,}\s+[A-Z]{2,}(?:\s+[A-Z]+)?)',
+                ],
+                'post': ['strip'],
+            },
+            'date_of_birth': {'patterns': [DATE_PATTERN]},
+            'id_number': {
+                'patterns': [
+                    r'(?:ID|LICENSE|CARD)\s*(?:NO|#|NUMBER)?[\s:]*([A-Z0-9\-]{6,})',
+                    r'\b([A-Z]\d{4}-\d{5}-\d{5})\b',  # Ontario format
+                ],
+            },
+            'expiry_date': {'patterns': [DATE_PATTERN], 'occurrence': 2},
+            'address': {
+                'patterns': [
+                    r'(\d+\s+[\w\s]+(?:STREET|ST|AVENUE|AVE|ROAD|RD|DRIVE|DR)[\s,]+[\w\s]+,?\s*[A-Z]{2}\s+[A-Z0-9\s]+)',
+                ],
+                'flags': re.IGNORECASE,
+                'post': ['strip'],
+            },
+        },
+    },
+    'transcript': {
+        'document_type': 'transcript',
+        'aliases': [],
+        'fields': {
+            'student_name': {
+                'patterns': [
+                    r'(?:STUDENT NAME|NAME)[\s:]+([A-Z][a-z]+\s+[A-Z][a-z]+)',
+                    r'([A-Z]{2,}\s+[A-Z]{2,})',
+                ],
+                'post': ['strip'],
+            },
+            'institution_name': {
+                'patterns': [
+                    r'([\w\s]+(?:HIGH SCHOOL|SECONDARY SCHOOL|COLLEGIATE))',
+                    r'(?:SCHOOL|INSTITUTION)[\s:]+(.+?)(?:\n|$)',
+                ],
+                'flags': re.IGNORECASE,
+                'post': ['strip'],
+            },
+            'graduation_date': {
+                'patterns': [r'(?:GRADUATED?|COMPLETION)[\s:]+(\w+\s+\d{4}|\d{2}/\d{2}/\d{4})'],
+                'flags': re.IGNORECASE,
+            },
+            'program': {},
+            'gpa': {
+                'patterns': [r'(?:GPA|AVERAGE)[\s:]+(\d+\.?\d*)'],
+                'flags': re.IGNORECASE,
+            },
+            'courses': {'default': []},
+        },
+    },
+    'proof_of_address': {
+        'document_type': 'proof_of_address',
+        'aliases': ['utility_bill', 'bank_statement'],
+        'fields': {
+            'name': {
+                'patterns': [r'(?:NAME|TO|FOR)[\s:]+([A-Z][a-z]+\s+[A-Z][a-z]+)'],
+                'post': ['strip'],
+            },
+            'address': {
+                'patterns': [r'(\d+\s+[\w\s]+(?:STREET|ST|AVENUE|AVE|ROAD|RD)[\s,]+[\w\s]+,?\s*ON\s+[A-Z0-9\s]+)'],
+                'flags': re.IGNORECASE,
+                'post': ['strip'],
+            },
+            'document_date': {
+                'patterns': [r'(?:DATE|BILL DATE)[\s:]+(\w+\s+\d{1,2},?\s+\d{4}|\d{2}/\d{2}/\d{4})'],
+                'flags': re.IGNORECASE,
+            },
+            # Utility company, bank, etc.
+            'issuer': {
+                'patterns': [
+                    r'((?:HYDRO|ENBRIDGE|ROGERS|BELL)[\w\s]*)',
+                    r'^([\w\s]+(?:UTILITY|ELECTRIC|GAS|TELECOM))',
+                ],
+                'flags': re.IGNORECASE,
+                'post': ['strip'],
+            },
+        },
+    },
+    'study_permit': {
+        'document_type': 'study_permit',
+        'aliases': [],
+        'fields': {
+            'full_name': {
+                'patterns': [r'(?:NAME|NOM)[\s:]+([A-Z][A-Za-z\-]+(?:[ \t]+[A-Z][A-Za-z\-]+)+)'],
+                'post': ['strip'],
+            },
+            'uci': {
+                'patterns': [r'(?:UCI|CLIENT ID)[\s:#]*(\d{4}-\d{4}(?:-\d{2})?|\d{8,10})'],
+                'flags': re.IGNORECASE,
+            },
+            'permit_number': {'patterns': [r'\b([A-Z]\d{9})\b']},
+            'institution_name': {
+                'patterns': [r'(?:INSTITUTION|SCHOOL)[\s:]+(.+?)(?:\n|$)'],
+                'flags': re.IGNORECASE,
+                'post': ['strip'],
+            },
+            'expiry_date': {
+                'patterns': [r'(?:EXPIRY|EXPIRES|VALID UNTIL)[^\n\d]*' + DATE_PATTERN],
+                'flags': re.IGNORECASE,
+            },
+        },
+    },
+}
+
+
+def register_field_spec(name: str, spec: Dict):
+    """
+    Add or replace an extractor spec (engines created afterwards pick it up)
+    
+    Args:
+        name: Extractor name
+        spec: Dictionary with document_type, aliases, fields (see FIELD_SPECS)
+    """
+    FIELD_SPECS[name] = spec
+
+
+def document_type_aliases(specs: Dict = None) -> Dict[str, str]:
+    """Map classifier document types to the extractor that handles them"""
+    specs = FIELD_SPECS if specs is None else specs
+    return {alias: name for name, spec in specs.items() for alias in spec.get('aliases', [])}
+
+
+class FieldExtractor:
+    """
+    One spec with its patterns compiled
+    
+    A pattern used by several fields (the dates on an ID) is scanned once per
+    document and its matches shared between them.
+    """
+    
+    def __init__(self, name: str, spec: Dict):
+        """
+        Compile a spec
+        
+        Args:
+            name: Extractor name
+            spec: Spec dictionary (see FIELD_SPECS)
+        """
+        self.name = name
+        self.document_type = spec.get('document_type', name)
+        
+        compiled = {}
+        fields = []
+        # Matches needed per pattern that some field reads past the first match of
+        scan_depth = {}
+        for field, field_spec in spec['fields'].items():
+            flags = field_spec.get('flags', 0)
+            occurrence = field_spec.get('occurrence', 1)
+            patterns = []
+            for pattern in field_spec.get('patterns', []):
+                key = (pattern, flags)
+                if key not in compiled:
+                    compiled[key] = re.compile(pattern, flags)
+                patterns.append(compiled[key])
+                if occurrence > 1:
+                    scan_depth[compiled[key]] = max(occurrence, scan_depth.get(compiled[key], 1))
+            fields.append((field, field_spec, patterns, occurrence))
+            
+        # Everything extract() would otherwise look up per document is resolved here:
+        # per field (name, readers, post steps, default), per reader (pattern, group,
+        # matches to scan or 0 for a plain search, occurrence)
+        self.fields = []
+        for field, field_spec, patterns, occurrence in fields:
+            group = field_spec.get('group')
+            readers = [
+                (pattern, group if group is not None else (1 if pattern.groups else 0),
+                 scan_depth.get(pattern, 0), occurrence)
+                for pattern in patterns
+            ]
+            post = [POSTPROCESSORS[step] for step in field_spec.get('post', [])]
+            self.fields.append((field, readers, post, field_spec.get('default')))
+            
+
+    def extract(self, text: str) -> Dict:
+        """
+        Extract fields from OCR text
+        
+        Args:
+            text: Document text
+            
+        Returns:
+            Dictionary with document_type, one entry per field, and raw_text
+        """
+        data = {'document_type': self.document_type}
+        scans = {}
+        
+        for field, readers, post, default in self.fields:
+            value = None
+            for pattern, group, depth, occurrence in readers:
+                if depth:
+                    matches = scans.get(pattern)
+                    if matches is None:
+                        matches = scans[pattern] = list(islice(pattern.finditer(text), depth))
+                    match = matches[occurrence - 1] if len(matches) >= occurrence else None
+                else:
+                    match = pattern.search(text)
+                    
+                if match:
+                    value = match.group(group)
+                    for step in post:
+                        value = step(value)
+                    if value:
+                        break
+                    
+            if value is None and default is not None:
+                value = copy.copy(default)
+            data[field] = value
+            
+        data['raw_text'] = text
+        return data
+
+
+def compile_field_specs(specs: Dict = None) -> Dict[str, FieldExtractor]:
+    """
+    Compile every spec
+    
+    Args:
+        specs: Specs to compile (default: FIELD_SPECS)
+        
+    Returns:
+        Extractor name -> FieldExtractor
+    """
+    specs = FIELD_SPECS if specs is None else specs
+    return {name: FieldExtractor(name, spec) for name, spec in specs.items()}
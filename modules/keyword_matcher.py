@@ -0,0 +1,109 @@
+"""
+Multi-Pattern Keyword Matcher
+Finds every keyword of a grouped keyword table in one pass over a text
+"""
+
+import re
+from typing import Dict, List, Set, Tuple
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+WORD_CHARACTER = re.compile(r'\w')
+
+
+class KeywordMatcher:
+    """
+    Keyword table compiled once into an Aho-Corasick automaton
+    
+    match() walks the text once and reports, per group, the keywords found
+    and a score (each keyword counts its number of words). Without the
+    optional pyahocorasick package the matcher falls back to one substring
+    scan per distinct keyword: CPython's C substring search is faster than
+    an automaton stepped in pure Python, so that is the better fallback.
+    """
+    
+    def __init__(self, keywords: Dict[str, List[str]], whole_words: bool = False):
+        """
+        Compile a keyword table
+        
+        Args:
+            keywords: Group name -> lowercase keywords (e.g. DocumentClassifier.keywords)
+            whole_words: Only count keywords with no letter, digit or underscore
+                directly before or after them ('term' no longer matches 'determine');
+                False matches plain substrings
+        """
+        self.keywords = {group: list(words) for group, words in keywords.items()}
+        self.whole_words = whole_words
+        self.distinct = sorted({word for words in self.keywords.values() for word in words})
+        # Highest score each group can reach (every keyword found)
+        self.max_scores = {
+            group: sum(len(word.split()) for word in words)
+            for group, words in self.keywords.items()
+        }
+        
+        self._automaton = None
+        if ahocorasick is not None and self.distinct:
+            self._automaton = ahocorasick.Automaton()
+            for word in self.distinct:
+                self._automaton.add_word(word, (word, len(word)))
+            self._automaton.make_automaton()
+        self._bounded = {
+            word: re.compile(r'(?<!\w)' + re.escape(word) + r'(?!\w)') for word in self.distinct
+        } if whole_words else {}
+        
+    @property
+    def backend(self) -> str:
+        """'aho-corasick' or 'substring' (pyahocorasick not installed)"""
+        return 'aho-corasick' if self._automaton is not None else 'substring'
+        
+    def find(self, text: str) -> Set[str]:
+        """
+        Distinct keywords that occur in text
+        
+        Args:
+            text: Text to search (already lowercased, like the keywords)
+            
+        Returns:
+            Set of matched keywords
+        """
+        if self._automaton is None:
+            if self.whole_words:
+                return {word for word, pattern in self._bounded.items() if pattern.search(text)}
+            return {word for word in self.distinct if word in text}
+            
+        found = set()
+        for end, (word, length) in self._automaton.iter(text):
+            if self.whole_words and not self._at_word_boundaries(text, end - length + 1, end + 1):
+                continue
+            found.add(word)
+        return found
+        
+    @staticmethod
+    def _at_word_boundaries(text: str, start: int, end: int) -> bool:
+        if start > 0 and WORD_CHARACTER.match(text, start - 1):
+            return False
+        return not (end < len(text) and WORD_CHARACTER.match(text, end))
+        
+    def match(self, text: str) -> Tuple[Dict[str, int], Dict[str, List[str]]]:
+        """
+        Score every group against text
+        
+        Args:
+            text: Text to search (already lowercased, like the keywords)
+            
+        Returns:
+            (group -> score, group -> matched keywords in table order), with
+            groups in table order
+        """
+        found = self.find(text)
+        scores = {}
+        matched = {}
+        for group, words in self.keywords.items():
+            matches = [word for word in words if word in found]
+            matched[group] = matches
+            scores[group] = sum(len(word.split()) for word in matches)
+        return scores, matched
@@ -5,8 +5,6 @@ Sends emails and notifications to students and staff
 
 from datetime import datetime
 from typing import Dict, List
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 import json
 
 
@@ -30,6 +28,7 @@ class NotificationSystem:
             'application_received': self._template_application_received,
             'application_approved': self._template_application_approved,
             'documents_incomplete': self._template_documents_incomplete,
+            'document_reupload': self._template_document_reupload,
             'manual_review_required': self._template_manual_review,
             'staff_new_application': self._template_staff_notification,
             'staff_review_needed': self._template_staff_review_needed
@@ -185,6 +184,43 @@ Need help? Our admissions team is here to assist:
 
 We look forward to completing your application!
 
+Best regards,
+Admissions Team
+Career College Ontario
+"""
+        
+        return {'subject': subject, 'body': body}
+    
+    def _template_document_reupload(self, recipient: Dict, data: Dict) -> Dict:
+        """Template for uploads that could not be read"""
+        subject = "Action Required: Please Re-upload Your Documents"
+        
+        body = f"""
+Dear {recipient['name']},
+
+Thank you for your application to Career College Ontario. We could not read some of 
+the documents you uploaded, so they have not been reviewed yet.
+
+Application ID: {data.get('application_id', 'N/A')}
+
+DOCUMENTS TO RE-UPLOAD:
+{self._format_unreadable_documents(data.get('unreadable_documents', []))}
+
+TIPS FOR A READABLE PHOTO OR SCAN:
+- Place the document on a dark, flat surface in even light
+- Fill the frame with the document and keep the camera steady
+- Avoid flash and reflections on glossy cards
+
+HOW TO SUBMIT:
+1. Log in to your application portal: https://careercollege.ca/applications
+2. Upload the documents listed above again
+3. You'll receive a confirmation email once submitted
+
+Need help? Our admissions team is here to assist:
+📧 admissions@careercollege.ca
+📞 1-800-555-0123
+⏰ Mon-Fri, 9am-5pm EST
+
 Best regards,
 Admissions Team
 Career College Ontario
@@ -306,6 +342,15 @@ Automated by Brukd RPA System
             return "  None - all documents received!"
         return "\n".join(f"  ❌ {doc}" for doc in documents)
     
+    def _format_unreadable_documents(self, documents: List[Dict]) -> str:
+        """Format unreadable uploads with what to fix in each"""
+        lines = []
+        for doc in documents:
+            lines.append(f"  ❌ {doc.get('filename', 'Unknown')}")
+            for instruction in doc.get('instructions') or doc.get('reasons', []):
+                lines.append(f"     - {instruction}")
+        return "\n".join(lines)
+    
     def _format_issues(self, issues: List[str]) -> str:
         """Format list of issues"""
         if not issues:
@@ -0,0 +1,182 @@
+"""
+Asyncio Front End for the OCR Engine
+Runs blocking OCR on a bounded thread pool so an event loop can keep many uploads in flight
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Union
+
+from .ocr_engine import ImageSource, OCRDocument, OCREngine
+
+
+class AsyncOCREngine:
+    """
+    Async wrapper around an OCREngine
+    
+    At most max_concurrency documents are OCR'd at once, on the same number of
+    threads; further calls wait on a semaphore without holding a thread. Each
+    document gets a timeout: Tesseract itself is told the deadline so a stuck
+    process is killed, and the awaiting call raises asyncio.TimeoutError.
+    A call that times out or is cancelled sets the document's cancel event, so
+    its thread stops at the next page, band or preprocessing stage, and keeps
+    its slot until that thread is free; a call still queued never starts.
+    """
+    
+    def __init__(self, engine: OCREngine = None, max_concurrency: int = 4, timeout: float = 60.0):
+        """
+        Initialize async engine
+        
+        Args:
+            engine: OCREngine to run (default: a new OCREngine())
+            max_concurrency: Maximum documents being OCR'd at the same time
+            timeout: Default seconds allowed per document (None = no limit)
+        """
+        self.engine = engine or OCREngine()
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+        
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                            thread_name_prefix='ocr')
+        self._semaphore = None
+        
+    def _limit(self) -> asyncio.Semaphore:
+        # Created lazily so the semaphore binds to the running loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+        
+    async def process_document(self, image_path: ImageSource, lang: str = 'eng',
+                               timeout: float = None, document_type: str = None) -> OCRDocument:
+        """
+        Preprocess and OCR a document without blocking the event loop
+        
+        Args:
+            image_path: Path, image bytes or image array (as for OCREngine.process_document)
+            lang: Language code (default: 'eng')
+            timeout: Seconds allowed for this document (default: the engine's timeout)
+            document_type: Known document type, selecting its OCR_CONFIGS settings
+            
+        Returns:
+            OCRDocument
+            
+        Raises:
+            asyncio.TimeoutError: If the document did not finish in time
+        """
+        timeout = self.timeout if timeout is None else timeout
+        loop = asyncio.get_running_loop()
+        
+        async with self._limit():
+            cancel = threading.Event()
+            work = loop.run_in_executor(
+                self._executor,
+                lambda: self.engine.process_document(image_path, lang=lang, timeout=timeout,
+                                                     document_type=document_type, cancel=cancel)
+            )
+            try:
+                # Shielded so a timeout does not detach the future from its still running thread
+                return await asyncio.wait_for(asyncio.shield(work), timeout)
+            except RuntimeError as e:
+                # Tesseract killed at the deadline before wait_for noticed
+                if 'timeout' in str(e).lower():
+                    raise asyncio.TimeoutError(str(e)) from e
+                raise
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                cancel.set()
+                await self._finished(work)
+                raise
+                
+    @staticmethod
+    async def _finished(work: asyncio.Future):
+        """Wait until an abandoned document's thread has stopped, discarding its outcome"""
+        await asyncio.wait([work])
+        if not work.cancelled():
+            work.exception()
+                
+    async def extract_text(self, image_path: Union[ImageSource, OCRDocument], lang: str = 'eng',
+                           timeout: float = None) -> str:
+        """
+        Extract all text from document
+        
+        Args:
+            image_path: Path, image bytes/array, or an already processed OCRDocument
+            lang: Language code (default: 'eng')
+            timeout: Seconds allowed for this document (default: the engine's timeout)
+            
+        Returns:
+            Extracted text as string (an error message if OCR failed)
+            
+        Raises:
+            asyncio.TimeoutError: If the document did not finish in time
+        """
+        if isinstance(image_path, OCRDocument):
+            return image_path.text
+            
+        try:
+            return (await self.process_document(image_path, lang=lang, timeout=timeout)).text
+        except asyncio.TimeoutError:
+            raise
+        except Exception as e:
+            return f"Error extracting text: {str(e)}"
+            
+    async def get_confidence_score(self, image_path: Union[ImageSource, OCRDocument],
+                                   timeout: float = None) -> float:
+        """
+        Get OCR confidence score for a document
+        
+        Args:
+            image_path: Path, image bytes/array, or an already processed OCRDocument
+            timeout: Seconds allowed for this document (default: the engine's timeout)
+            
+        Returns:
+            Confidence score (0-100), 0.0 if OCR failed
+            
+        Raises:
+            asyncio.TimeoutError: If the document did not finish in time
+        """
+        if isinstance(image_path, OCRDocument):
+            return image_path.confidence
+            
+        try:
+            return (await self.process_document(image_path, timeout=timeout)).confidence
+        except asyncio.TimeoutError:
+            raise
+        except Exception:
+            return 0.0
+            
+    async def process_batch(self, file_paths: List[ImageSource], timeout: float = None) -> List[Dict]:
+        """
+        Process multiple documents concurrently
+        
+        Args:
+            file_paths: List of document paths (or in-memory image bytes/arrays)
+            timeout: Seconds allowed per document (default: the engine's timeout)
+            
+        Returns:
+            List of result dictionaries in the same order as file_paths (as
+            OCREngine.process_batch; timed out documents get an error entry)
+        """
+        async def process(file_path):
+            try:
+                return self.engine._batch_result(await self.process_document(file_path, timeout=timeout))
+            except asyncio.TimeoutError:
+                seconds = self.timeout if timeout is None else timeout
+                return self.engine._batch_error(
+                    self.engine._source_label(file_path),
+                    TimeoutError(f"OCR timed out after {seconds}s")
+                )
+            except Exception as e:
+                return self.engine._batch_error(self.engine._source_label(file_path), e)
+                
+        return list(await asyncio.gather(*(process(file_path) for file_path in file_paths)))
+        
+    def close(self):
+        """Shut down the worker threads (running documents are allowed to finish)"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        
+    async def __aenter__(self) -> 'AsyncOCREngine':
+        return self
+        
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,379 @@
+"""
+Tesseract Backends for the OCR Engine
+Subprocess (pytesseract), list-file batch and persistent in-process (tesserocr) implementations
+"""
+
+import os
+import shlex
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Tuple, Union
+
+import cv2
+import numpy as np
+import pytesseract
+from PIL import Image
+
+
+# Column layout of pytesseract.image_to_data(..., output_type=Output.DICT)
+DATA_KEYS = [
+    'level', 'page_num', 'block_num', 'par_num', 'line_num', 'word_num',
+    'left', 'top', 'width', 'height', 'conf', 'text'
+]
+
+
+class SubprocessTesseractBackend:
+    """
+    Runs the tesseract executable once per call via pytesseract
+    Every call pays process startup, model load and temp file I/O
+    """
+    
+    name = 'subprocess'
+    
+    def image_to_data(self, image: np.ndarray, lang: str, config: str, timeout: float = None) -> Dict:
+        """
+        OCR an image and return word-level data
+        
+        Args:
+            image: Preprocessed grayscale/binary image
+            lang: Language code
+            config: Tesseract command-line flags (e.g. '--oem 3 --psm 6')
+            timeout: Seconds before the tesseract process is killed (None = no limit)
+            
+        Returns:
+            pytesseract Output.DICT style dictionary
+            
+        Raises:
+            RuntimeError: If the timeout expired
+        """
+        return pytesseract.image_to_data(
+            Image.fromarray(image), lang=lang, config=config,
+            output_type=pytesseract.Output.DICT, timeout=timeout or 0
+        )
+        
+    def close(self):
+        pass
+
+
+class TesserocrBackend:
+    """
+    Long-lived libtesseract instances via tesserocr
+    Instances are pooled per (lang, config): each call leases one, and returns
+    it for the next call on any thread, so the language model is loaded once
+    per concurrent use instead of once per thread. Images are passed in memory,
+    so no process is launched and no temp files are written
+    """
+    
+    name = 'tesserocr'
+    
+    def __init__(self, tessdata_path: str = None, max_idle: int = 8):
+        """
+        Args:
+            tessdata_path: Directory containing *.traineddata (default: tesserocr's built-in path)
+            max_idle: Idle instances kept across all (lang, config) pairs; the
+                least recently used is released beyond this
+        """
+        try:
+            import tesserocr
+        except ImportError as e:
+            raise ImportError(
+                "The 'tesserocr' backend requires the tesserocr package (pip install tesserocr)"
+            ) from e
+            
+        self._tesserocr = tesserocr
+        self.tessdata_path = tessdata_path
+        self.max_idle = max_idle
+        
+        # libtesseract API objects are not thread safe: a leased instance is used
+        # by one call at a time. Idle ones are (key, api), least recently used first.
+        self._idle = []
+        self._all_apis = []
+        self._lock = threading.Lock()
+        self.stats = {
+            'created': 0,
+            'reused': 0,
+            'released': 0
+        }
+        
+    @staticmethod
+    def parse_config(config: str) -> Tuple[int, int, Dict[str, str]]:
+        """
+        Translate tesseract command-line flags into API settings
+        
+        Args:
+            config: Flags such as '--oem 3 --psm 6 -c tessedit_char_whitelist=0123456789'
+                (--dpi and --user-words become the equivalent variables)
+            
+        Returns:
+            (oem, psm, variables)
+        """
+        oem, psm = 3, 3
+        variables = {}
+        # Split the way pytesseract does: POSIX rules would eat the backslashes of Windows paths
+        tokens = shlex.split(config or '', posix=os.name != 'nt')
+        i = 0
+        while i < len(tokens):
+            token = tokens[i]
+            if token == '--oem' and i + 1 < len(tokens):
+                oem = int(tokens[i + 1])
+                i += 1
+            elif token == '--psm' and i + 1 < len(tokens):
+                psm = int(tokens[i + 1])
+                i += 1
+            elif token == '--dpi' and i + 1 < len(tokens):
+                variables['user_defined_dpi'] = tokens[i + 1]
+                i += 1
+            elif token == '--user-words' and i + 1 < len(tokens):
+                variables['user_words_file'] = tokens[i + 1]
+                i += 1
+            elif token == '-c' and i + 1 < len(tokens):
+                key, _, value = tokens[i + 1].partition('=')
+                variables[key] = value
+                i += 1
+            i += 1
+        return oem, psm, variables
+        
+    @contextmanager
+    def _lease(self, lang: str, config: str):
+        """Use an idle API instance for lang/config (creating one if none is free) for the block"""
+        key = (lang, config)
+        api = None
+        with self._lock:
+            for i in range(len(self._idle) - 1, -1, -1):
+                if self._idle[i][0] == key:
+                    api = self._idle.pop(i)[1]
+                    self.stats['reused'] += 1
+                    break
+                    
+        if api is None:
+            oem, psm, variables = self.parse_config(config)
+            kwargs = {'lang': lang, 'oem': oem, 'psm': psm, 'variables': variables}
+            if self.tessdata_path:
+                kwargs['path'] = self.tessdata_path
+            api = self._tesserocr.PyTessBaseAPI(**kwargs)
+            with self._lock:
+                self._all_apis.append(api)
+                self.stats['created'] += 1
+                
+        try:
+            yield api
+        finally:
+            released = None
+            with self._lock:
+                if api in self._all_apis:  # Not ended by close() meanwhile
+                    self._idle.append((key, api))
+                    if len(self._idle) > self.max_idle:
+                        released = self._idle.pop(0)[1]
+                        self._all_apis.remove(released)
+                        self.stats['released'] += 1
+            if released is not None:
+                released.End()
+        
+    def image_to_data(self, image: np.ndarray, lang: str, config: str, timeout: float = None) -> Dict:
+        """
+        OCR an image and return word-level data
+        
+        Args:
+            image: Preprocessed grayscale/binary image
+            lang: Language code
+            config: Tesseract command-line flags (e.g. '--oem 3 --psm 6')
+            timeout: Seconds before recognition is aborted (None = no limit)
+            
+        Returns:
+            pytesseract Output.DICT style dictionary (word rows only)
+            
+        Raises:
+            RuntimeError: If the timeout expired
+        """
+        tesserocr = self._tesserocr
+        RIL = tesserocr.RIL
+        
+        data = {key: [] for key in DATA_KEYS}
+        with self._lease(lang, config) as api:
+            api.SetImage(Image.fromarray(image))
+            if not api.Recognize(timeout=int(timeout * 1000) if timeout else 0) and timeout:
+                raise RuntimeError('Tesseract process timeout')
+            
+            iterator = api.GetIterator()
+            if iterator is None:
+                return data
+                
+            block_num = par_num = line_num = word_num = 0
+            for word in tesserocr.iterate_level(iterator, RIL.WORD):
+                if word.IsAtBeginningOf(RIL.BLOCK):
+                    block_num += 1
+                    par_num = 0
+                if word.IsAtBeginningOf(RIL.PARA):
+                    par_num += 1
+                    line_num = 0
+                if word.IsAtBeginningOf(RIL.TEXTLINE):
+                    line_num += 1
+                    word_num = 0
+                word_num += 1
+                
+                box = word.BoundingBox(RIL.WORD)
+                if box is None:
+                    continue
+                x1, y1, x2, y2 = box
+                
+                row = (5, 1, block_num, par_num, line_num, word_num,
+                       x1, y1, x2 - x1, y2 - y1,
+                       word.Confidence(RIL.WORD), word.GetUTF8Text(RIL.WORD) or '')
+                for key, value in zip(DATA_KEYS, row):
+                    data[key].append(value)
+                    
+        return data
+        
+    def get_stats(self) -> Dict:
+        """Get instance counters (created = model loads)"""
+        with self._lock:
+            return {**self.stats, 'idle': len(self._idle), 'instances': len(self._all_apis)}
+        
+    def close(self):
+        """Release all libtesseract instances"""
+        with self._lock:
+            apis, self._all_apis, self._idle = self._all_apis, [], []
+        for api in apis:
+            api.End()
+
+
+class BatchTesseractBackend(SubprocessTesseractBackend):
+    """
+    Runs one tesseract process per chunk of images via a list file
+    Tesseract OCRs every image named in the list in a single run, so process
+    startup and model load are paid once per chunk instead of once per image;
+    each image comes back as its own page of the TSV output
+    """
+    
+    name = 'batch'
+    
+    def __init__(self, batch_size: int = 16):
+        """
+        Args:
+            batch_size: Images per tesseract run
+        """
+        self.batch_size = batch_size
+        
+    def images_to_data(self, images: List[np.ndarray], lang: str, config: str,
+                       timeout: float = None) -> List[Union[Dict, Exception]]:
+        """
+        OCR several images in one tesseract run and return word-level data per image
+        
+        A failed run (an image tesseract cannot read, a crash, a timeout) is
+        retried as two halves until the failing images are isolated, so one bad
+        image only fails itself.
+        
+        Args:
+            images: Preprocessed grayscale/binary images
+            lang: Language code
+            config: Tesseract command-line flags, shared by all images
+            timeout: Seconds allowed per image; a run may take len(images) times this
+            
+        Returns:
+            One entry per image, in order: a pytesseract Output.DICT style
+            dictionary, or the exception that image failed with
+        """
+        if not images:
+            return []
+        
+        try:
+            return self._run_list(images, lang, config, timeout)
+        except (RuntimeError, ValueError) as e:
+            # TesseractError and the timeout are RuntimeErrors
+            if len(images) == 1:
+                return [e]
+        
+        middle = len(images) // 2
+        return (self.images_to_data(images[:middle], lang, config, timeout) +
+                self.images_to_data(images[middle:], lang, config, timeout))
+        
+    def _run_list(self, images: List[np.ndarray], lang: str, config: str, timeout: float = None) -> List[Dict]:
+        """Single tesseract run over a list file; raises if the run fails"""
+        with tempfile.TemporaryDirectory(prefix='ocr_batch_') as directory:
+            paths = []
+            for i, image in enumerate(images):
+                path = os.path.join(directory, f"{i:05d}.png")
+                if not cv2.imwrite(path, image):
+                    raise ValueError(f"Could not write image {i} of the batch")
+                paths.append(path)
+            list_path = os.path.join(directory, 'images.txt')
+            with open(list_path, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(paths) + '\n')
+            
+            output_base = os.path.join(directory, 'output')
+            pytesseract.pytesseract.run_tesseract(
+                list_path, output_base, 'tsv', lang,
+                config=f"-c tessedit_create_tsv=1 {config or ''}".strip(),
+                timeout=timeout * len(images) if timeout else 0
+            )
+            with open(f"{output_base}.tsv", encoding='utf-8') as f:
+                table = pytesseract.pytesseract.file_to_dict(f.read(), '\t', -1)
+        
+        return self.split_pages(table, len(images))
+        
+    @staticmethod
+    def split_pages(table: Dict, pages: int) -> List[Dict]:
+        """
+        Split multi-page TSV data into one dictionary per page
+        
+        Args:
+            table: Output.DICT style dictionary whose page_num counts input images from 1
+            pages: Number of images in the run
+            
+        Returns:
+            List of per-image dictionaries with page_num reset to 1
+            
+        Raises:
+            ValueError: If the output does not cover every image (tesseract stopped early)
+        """
+        data = [{key: [] for key in DATA_KEYS} for _ in range(pages)]
+        page_numbers = table.get('page_num', [])
+        seen = set()
+        for row, page_num in enumerate(page_numbers):
+            if not 1 <= page_num <= pages:
+                raise ValueError(f"Tesseract output has page {page_num} for a batch of {pages}")
+            seen.add(page_num)
+            page = data[page_num - 1]
+            for key in DATA_KEYS:
+                page[key].append(1 if key == 'page_num' else table[key][row])
+        
+        if len(seen) < pages:
+            raise ValueError(f"Tesseract returned {len(seen)} of {pages} pages")
+        return data
+
+
+BACKENDS = {
+    SubprocessTesseractBackend.name: SubprocessTesseractBackend,
+    TesserocrBackend.name: TesserocrBackend,
+    BatchTesseractBackend.name: BatchTesseractBackend,
+}
+
+
+def create_backend(name: str = 'subprocess', **kwargs):
+    """
+    Build a Tesseract backend by name
+    
+    Args:
+        name: 'subprocess' (pytesseract, default), 'tesserocr' (persistent in-process)
+            or 'batch' (one tesseract run per chunk of images)
+        **kwargs: Backend-specific options (e.g. tessdata_path for tesserocr,
+            batch_size for batch)
+        
+    Returns:
+        Backend instance exposing image_to_data(image, lang, config)
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown OCR backend: {name} (available: {', '.join(BACKENDS)})")
+    return BACKENDS[name](**kwargs)
+
+
+def available_backends() -> List[str]:
+    """Names of backends whose dependencies are importable here"""
+    names = [SubprocessTesseractBackend.name, BatchTesseractBackend.name]
+    try:
+        import tesserocr  # noqa: F401
+        names.append(TesserocrBackend.name)
+    except ImportError:
+        pass
+    return names
@@ -0,0 +1,188 @@
+"""
+On-Disk OCR Result Cache
+Content-addressed store so identical uploads are never OCR'd twice
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+
+
+class OCRCache:
+    """
+    Size-bounded LRU cache of OCR results, keyed by file content + OCR config
+    Entries are JSON files named by their key; file mtime records last use.
+    Safe to share between threads (e.g. AsyncOCREngine's pool).
+    """
+    
+    def __init__(self, cache_dir: str = 'output/ocr_cache', max_bytes: int = 256 * 1024 * 1024):
+        """
+        Initialize cache
+        
+        Args:
+            cache_dir: Directory holding cached results
+            max_bytes: Byte budget; least recently used entries are evicted beyond it
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0
+        }
+        
+        # key -> entry size in bytes, ordered from least to most recently used
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._load_index()
+        
+    def _load_index(self):
+        """Rebuild the LRU order from entries left by previous runs"""
+        files = []
+        for path in self.cache_dir.glob('*.json'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, path.stem, stat.st_size))
+            
+        for _, key, size in sorted(files):
+            self._entries[key] = size
+            self._total_bytes += size
+            
+        self._evict()
+        
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+        
+    @staticmethod
+    def make_key(content: bytes, config: Dict) -> str:
+        """
+        Build a cache key
+        
+        Args:
+            content: Raw document bytes
+            config: OCR settings that affect the result (language, Tesseract flags, preprocessing)
+            
+        Returns:
+            Hex digest identifying this content under this configuration
+        """
+        digest = hashlib.sha256(content)
+        digest.update(json.dumps(config, sort_keys=True).encode('utf-8'))
+        return digest.hexdigest()
+        
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up a cached result
+        
+        Args:
+            key: Key from make_key
+            
+        Returns:
+            Cached result dictionary, or None on a miss
+        """
+        with self._lock:
+            if key not in self._entries:
+                self.stats['misses'] += 1
+                return None
+                
+            path = self._path(key)
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    value = json.load(f)
+                os.utime(path)
+            except (OSError, ValueError):
+                # Entry vanished or is corrupt; treat as a miss
+                self._discard(key)
+                self.stats['misses'] += 1
+                return None
+                
+            self._entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return value
+        
+    def put(self, key: str, value: Dict):
+        """
+        Store a result, evicting least recently used entries if over budget
+        
+        Args:
+            key: Key from make_key
+            value: JSON-serializable result dictionary
+        """
+        payload = json.dumps(value).encode('utf-8')
+        if len(payload) > self.max_bytes:
+            return
+            
+        path = self._path(key)
+        # Unique per writing thread, so concurrent puts of one key never share a temp file
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        
+        with self._lock:
+            os.replace(tmp_path, path)
+            if key in self._entries:
+                self._total_bytes -= self._entries.pop(key)
+            self._entries[key] = len(payload)
+            self._total_bytes += len(payload)
+            
+            self._evict()
+        
+    def update(self, key: str, fields: Dict):
+        """
+        Merge fields into an existing entry (not counted as a lookup)
+        
+        Args:
+            key: Key from make_key
+            fields: JSON-serializable fields to add or replace; ignored if the entry was evicted
+        """
+        with self._lock:
+            if key not in self._entries:
+                return
+            try:
+                with open(self._path(key), 'r', encoding='utf-8') as f:
+                    value = json.load(f)
+            except (OSError, ValueError):
+                return
+        value.update(fields)
+        self.put(key, value)
+        
+    def _evict(self):
+        """Drop least recently used entries until within the byte budget"""
+        while self._total_bytes > self.max_bytes and self._entries:
+            key = next(iter(self._entries))
+            self._discard(key)
+            self.stats['evictions'] += 1
+            
+    def _discard(self, key: str):
+        """Remove an entry from the index and from disk"""
+        self._total_bytes -= self._entries.pop(key, 0)
+        try:
+            self._path(key).unlink()
+        except OSError:
+            pass
+            
+    def clear(self):
+        """Remove all cached results"""
+        with self._lock:
+            for key in list(self._entries):
+                self._discard(key)
+            
+    def get_stats(self) -> Dict:
+        """Get hit/miss counters and current usage"""
+        with self._lock:
+            lookups = self.stats['hits'] + self.stats['misses']
+            return {
+                **self.stats,
+                'hit_rate': round(self.stats['hits'] / lookups * 100, 1) if lookups else 0.0,
+                'entries': len(self._entries),
+                'bytes_used': self._total_bytes,
+                'max_bytes': self.max_bytes
+            }
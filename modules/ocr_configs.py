@@ -0,0 +1,127 @@
+"""
+Per-Document-Type Tesseract Configurations
+OCR settings for the extraction pass once a document's type is known
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+# Extractor name -> Tesseract settings. The first (classification) pass always
+# uses the engine's generic tesseract_config; these apply once the type is known.
+#   psm:            Page segmentation mode for the full page
+#   dpi:            Resolution hint passed as --dpi (arrays carry no DPI, and
+#                   Tesseract otherwise assumes 70) and used to render PDF pages
+#   user_words:     Words added to Tesseract's dictionary (course codes, issuers)
+#   preserve_spaces: Keep runs of spaces between words (table columns)
+#   numeric_fields: Layout field -> character whitelist; the field's value box
+#                   is re-read with that whitelist as a single text line
+OCR_CONFIGS = {
+    # Cards: short labels and values scattered around a photo
+    'id': {
+        'psm': 11,
+        'dpi': 300,
+        'user_words': [
+            'ONTARIO', 'PHOTO', 'CARD', 'SURNAME', 'GIVEN', 'NAMES', 'DRIVER', 'LICENCE',
+            'PRÉNOMS', 'NOM', 'FAMILLE', 'EXPIRY', 'BIRTH',
+        ],
+        'numeric_fields': {
+            'date_of_birth': '0123456789-/',
+            'expiry_date': '0123456789-/',
+            'id_number': 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-',
+        },
+    },
+    # Course tables: one uniform block so each row stays one line
+    'transcript': {
+        'psm': 6,
+        'dpi': 300,
+        'preserve_spaces': True,
+        'user_words': [
+            'OSSD', 'ENG4U', 'ENG3U', 'MHF4U', 'MCV4U', 'MDM4U', 'SCH4U', 'SBI4U', 'SPH4U',
+            'CGW4U', 'CHY4U', 'HHS4U', 'HSB4U', 'ICS4U', 'BBB4M', 'BOH4M', 'FSF4U',
+        ],
+        'numeric_fields': {
+            'gpa': '0123456789.',
+        },
+    },
+    # Bills and statements: logos, address blocks and tables side by side
+    'proof_of_address': {
+        'psm': 3,
+        'dpi': 300,
+        'user_words': [
+            'HYDRO', 'ENBRIDGE', 'ROGERS', 'BELL', 'TORONTO', 'ONTARIO', 'KWH', 'HST',
+        ],
+    },
+    # Permits: single column of mixed-size text
+    'study_permit': {
+        'psm': 4,
+        'dpi': 300,
+        'user_words': ['IRCC', 'UCI', 'DLI'],
+    },
+}
+
+
+def register_ocr_config(name: str, config: Dict):
+    """
+    Add or replace the OCR settings for an extractor type
+    
+    Args:
+        name: Extractor name (as in FIELD_SPECS)
+        config: Dictionary with psm, dpi, user_words, numeric_fields (see OCR_CONFIGS)
+    """
+    OCR_CONFIGS[name] = config
+
+
+def user_words_file(words: List[str]) -> str:
+    """
+    Write a user-words list to a file Tesseract can read
+    
+    The file is named after its content, so every engine and batch worker
+    with the same list shares one file and it is written only once.
+    
+    Returns:
+        Path of the file
+    """
+    content = '\n'.join(words) + '\n'
+    digest = hashlib.sha1(content.encode('utf-8')).hexdigest()[:16]
+    path = Path(tempfile.gettempdir()) / 'ocr_user_words' / f"{digest}.txt"
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique per writer: engines in other threads or processes may write it too
+        temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        temp_path.write_text(content, encoding='utf-8')
+        temp_path.replace(path)
+    return str(path)
+
+
+def build_tesseract_config(config: Optional[Dict], base: str = '--oem 3 --psm 6') -> str:
+    """
+    Tesseract command-line flags for a type's settings
+    
+    Args:
+        config: OCR_CONFIGS entry (None returns base unchanged)
+        base: Generic flags whose --psm the entry overrides
+        
+    Returns:
+        Flags such as '--oem 3 --psm 11 --dpi 300 --user-words /tmp/...'
+    """
+    if not config:
+        return base
+        
+    tokens = base.split()
+    if 'psm' in config:
+        if '--psm' in tokens:
+            tokens[tokens.index('--psm') + 1] = str(config['psm'])
+        else:
+            tokens += ['--psm', str(config['psm'])]
+    if config.get('dpi'):
+        tokens += ['--dpi', str(config['dpi'])]
+    if config.get('user_words'):
+        tokens += ['--user-words', user_words_file(config['user_words'])]
+    if config.get('preserve_spaces'):
+        tokens += ['-c', 'preserve_interword_spaces=1']
+    return ' '.join(tokens)
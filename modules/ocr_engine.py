@@ -4,14 +4,181 @@ Extracts text from student enrollment documents
 """
 
 import pytesseract
-from PIL import Image
 import cv2
 import numpy as np
 import re
+import os
+import time
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 import json
 
+from .ocr_cache import OCRCache
+from .ocr_backends import create_backend
+from .pdf_pages import PDFPageSource
+from .ocr_templates import (
+    candidate_templates, field_value, match_template, region_text, scale_box, templates_for
+)
+from .ocr_layout import LAYOUT_FIELDS, build_lines, extract_layout_fields, find_label
+from .ocr_configs import OCR_CONFIGS, build_tesseract_config
+from .field_specs import FIELD_SPECS, compile_field_specs, document_type_aliases
+from .duplicate_index import PerceptualHashIndex, decode_thumbnail, dhash, encode_thumbnail
+
+
+# Named preprocessing pipelines
+#   denoise:   None, 'median' (3x3 median blur) or 'nlmeans' (cv2.fastNlMeansDenoising)
+#   threshold: 'otsu' (global) or 'adaptive' (Gaussian adaptive)
+#   deskew:    estimate and correct page rotation
+# A value of 'auto' picks the stage per image from measure_image_quality()
+PREPROCESSING_PROFILES = {
+    # Clean digital uploads (generated PDFs/PNGs, flatbed scans)
+    'fast': {'denoise': None, 'threshold': 'otsu', 'deskew': False},
+    # Reasonable scans with light noise
+    'balanced': {'denoise': 'median', 'threshold': 'otsu', 'deskew': True},
+    # Phone photos and poor scans (the original pipeline)
+    'quality': {'denoise': 'nlmeans', 'threshold': 'adaptive', 'deskew': True},
+    # Decide per image from cheap quality metrics on a thumbnail
+    'auto': {'denoise': 'auto', 'threshold': 'auto', 'deskew': 'auto'},
+}
+
+# Metric limits used by the 'auto' profile
+ADAPTIVE_THRESHOLDS = {
+    'median_noise': 1.0,       # Estimated noise sigma above which a median blur is applied
+    'nlmeans_noise': 5.0,      # ...and above which full non-local means denoising is needed
+    'lighting_variation': 40,  # Background brightness spread that calls for adaptive thresholding
+    'min_contrast': 80,        # Low contrast also calls for adaptive thresholding
+    'skew_degrees': 0.5,       # Rotation below this is left alone
+}
+
+# Limits used by the pre-OCR readability gate (see OCREngine.assess_readability)
+READABILITY_THRESHOLDS = {
+    'min_side': 400,           # Shorter image side in pixels below which text is too small to read
+    'min_sharpness': 300,      # Laplacian variance around ink on the thumbnail; lower = blurry
+    'min_fill': 0.002,         # Share of thumbnail pixels that are ink; lower = blank page
+    'min_background': 60,      # Median paper brightness; lower = photo too dark
+    'glare_background': 235,   # Only pages with paper darker than this can show glare...
+    'max_glare': 0.05,         # ...and then at most this share of pixels may be blown out (>= 250)
+}
+
+# Reason codes reported by the readability gate, with the fix asked of the student
+READABILITY_REASONS = {
+    'low_resolution': 'Image resolution is too low; upload a larger scan or photo',
+    'too_dark': 'Image is too dark; retake the photo in better light',
+    'blank': 'No text was found on the page; check the right file was uploaded',
+    'blurry': 'Image is out of focus; hold the camera steady and retake the photo',
+    'glare': 'Glare hides part of the document; retake the photo without flash or direct light',
+}
+
+# Tiled OCR: Tesseract block numbers of band i are offset by i * TILE_BLOCK_STRIDE
+# so lines from different bands never share a (block, paragraph, line) key
+TILE_BLOCK_STRIDE = 1000
+
+# Anything OCREngine entry points accept as a document: a file path, encoded
+# image/PDF bytes (bytes, bytearray, memoryview) or an already decoded image array
+ImageSource = Union[str, Path, bytes, bytearray, memoryview, np.ndarray]
+
+
+class UnreadableDocumentError(ValueError):
+    """
+    Raised instead of running OCR on an image the readability gate rejected
+    
+    Attributes:
+        source: Document the image came from
+        reasons: READABILITY_REASONS codes, most severe first
+        metrics: Measurements behind the decision (see OCREngine.assess_readability)
+    """
+    
+    def __init__(self, source: str, reasons: List[str], metrics: Dict):
+        super().__init__(f"Unreadable document {source}: {', '.join(reasons)}")
+        self.source = source
+        self.reasons = reasons
+        self.metrics = metrics
+    
+    def __reduce__(self):
+        # Rebuilt from its fields when raised inside a batch worker process
+        return (self.__class__, (self.source, self.reasons, self.metrics))
+
+
+class OCRCancelledError(Exception):
+    """Raised when a document's cancel event was set before its OCR finished"""
+
+
+class OCRDocument:
+    """
+    Result of a single OCR pass over one document
+    Holds everything later pipeline steps need so the file is never re-read
+    """
+    
+    def __init__(self, source: str, image: np.ndarray, text: str, data: Dict, confidence: float,
+                 from_cache: bool = False, preprocessing: Dict = None, pages: List[Dict] = None,
+                 size: Tuple[int, int] = None, rereads: Dict = None):
+        """
+        Args:
+            source: Path of the document the result came from (a '<bytes>'-style
+                label for in-memory input)
+            image: Preprocessed (binarized, deskewed) image that was OCR'd
+                (None when the result was served from the OCR cache)
+            text: Extracted text, rebuilt line by line from the word data
+            data: Word-level output of pytesseract.image_to_data (Output.DICT)
+            confidence: Mean word confidence (0-100), excluding -1 entries
+            from_cache: True if no OCR was run because the result was cached
+            preprocessing: Report of the preprocessing stages that ran (see OCREngine._preprocess)
+            pages: Per-page summaries for multi-page (PDF) documents
+            size: (width, height) of the page the word boxes refer to (default:
+                the image's; None for multi-page and tiled documents)
+            rereads: Values of field crops OCR'd after the page pass (see
+                OCREngine._crop_reread), kept so a cached result needs no page image
+        """
+        self.source = source
+        self.image = image
+        self.text = text
+        self.data = data
+        self.confidence = confidence
+        self.from_cache = from_cache
+        self.preprocessing = preprocessing or {}
+        self.pages = pages or []
+        if size is None and image is not None:
+            size = (image.shape[1], image.shape[0])
+        self.size = tuple(size) if size else None
+        self.rereads = dict(rereads or {})
+        # Set when the result was copied from a near-duplicate document (see PerceptualHashIndex)
+        self.reused = False
+        # OCRCache entry holding this result, if any (crop re-reads are added to it)
+        self.cache_key = None
+    
+    def to_payload(self) -> Dict:
+        """JSON-serializable OCR result (everything except the image), for caching and worker transfer"""
+        return {
+            'text': self.text,
+            'data': self.data,
+            'confidence': self.confidence,
+            'preprocessing': self.preprocessing,
+            'pages': self.pages,
+            'size': self.size,
+            'rereads': self.rereads
+        }
+    
+    @classmethod
+    def from_payload(cls, source: str, payload: Dict, from_cache: bool = False) -> 'OCRDocument':
+        """Rebuild a document (without image) from to_payload() output"""
+        return cls(
+            source=source,
+            image=None,
+            text=payload['text'],
+            data=payload['data'],
+            confidence=payload['confidence'],
+            from_cache=from_cache,
+            preprocessing=payload.get('preprocessing'),
+            pages=payload.get('pages'),
+            size=payload.get('size'),
+            rereads=payload.get('rereads')
+        )
+    
+    def __repr__(self) -> str:
+        return f"OCRDocument(source={self.source!r}, chars={len(self.text)}, confidence={self.confidence:.1f})"
+
 
 class OCREngine:
     """
@@ -19,305 +186,1469 @@ class OCREngine:
     Handles ID cards, transcripts, proof of address documents
     """
     
-    def __init__(self, tesseract_path: str = None):
+    def __init__(self, tesseract_path: str = None, cache: OCRCache = None, backend: str = 'subprocess',
+                 profile: str = 'quality', pdf_dpi: int = 200, pdf_workers: int = None,
+                 duplicate_index: PerceptualHashIndex = None, tile_height: int = None,
+                 tile_overlap: int = 160, readability_gate: bool = False):
         """
         Initialize OCR engine
         
         Args:
             tesseract_path: Path to Tesseract executable (Windows: C:/Program Files/Tesseract-OCR/tesseract.exe)
+            cache: Optional OCRCache; identical documents are then OCR'd only once
+            backend: 'subprocess' (one tesseract process per call), 'tesserocr'
+                (persistent in-process Tesseract that loads the model once) or
+                'batch' (process_batch OCRs chunks of images in one tesseract process)
+            profile: Preprocessing profile name from PREPROCESSING_PROFILES
+            pdf_dpi: Resolution PDF pages are rendered at
+            pdf_workers: Pages of one PDF OCR'd concurrently (default: up to 4);
+                also the number of pages rasterized at any time. process_batch
+                workers use their share of the cores instead.
+            duplicate_index: Optional PerceptualHashIndex; near-duplicates of earlier
+                documents (same duplicate_scope) then reuse their cached OCR.
+                Requires a cache.
+            tile_height: Pages taller than 1.5x this many pixels are OCR'd as
+                horizontal bands of this height in parallel (default: never tile)
+            tile_overlap: Pixels shared by neighbouring bands; must exceed the
+                tallest text line (160 covers 12pt text at 600 DPI)
+            readability_gate: Check each image with assess_readability before OCR and
+                raise UnreadableDocumentError instead of OCRing blurry, tiny, blank,
+                dark or glare-covered images (PDF pages are not gated)
         """
+        if profile not in PREPROCESSING_PROFILES:
+            raise ValueError(f"Unknown preprocessing profile: {profile} (available: {', '.join(PREPROCESSING_PROFILES)})")
+        if duplicate_index is not None and cache is None:
+            raise ValueError("duplicate_index needs an OCRCache to hold the reusable results")
+        
         if tesseract_path:
             pytesseract.pytesseract.tesseract_cmd = tesseract_path
+        self.tesseract_path = tesseract_path
+        self.backend = create_backend(backend)
         
         self.supported_formats = ['.png', '.jpg', '.jpeg', '.tiff', '.bmp', '.pdf']
+        self.tesseract_config = r'--oem 3 --psm 6'  # LSTM OCR Engine, assume uniform text block
+        self.preprocessing_profile = profile
+        self.deskew_max_side = 1024  # Longest side used when estimating skew
+        self.metrics_max_side = 512  # Thumbnail size for the 'auto' profile's quality metrics
+        self.pdf_dpi = pdf_dpi
+        self.header_fraction = 0.25  # Top share of the first page read by ocr_header
+        self.header_scale = 0.5      # Downscale factor for the header pass
+        self.pdf_workers = pdf_workers or min(4, os.cpu_count() or 1)
+        self.cache = cache
+        self.duplicate_index = duplicate_index
+        self.tile_height = tile_height
+        self.tile_overlap = tile_overlap
+        self.tile_workers = self.pdf_workers  # Bands of one page OCR'd concurrently
+        self.readability_gate = readability_gate
+        
+        # Field extraction rules, compiled once per engine from the specs registered
+        # by now, with the classifier document types each extractor handles
+        specs = dict(FIELD_SPECS)
+        self.field_extractors = compile_field_specs(specs)
+        self.document_type_aliases = document_type_aliases(specs)
+        self.extractable_document_types = set(specs) | set(self.document_type_aliases)
+        # Per-document-type Tesseract flags, built on first use (see OCR_CONFIGS);
+        # the lock keeps concurrent threads from writing the same user-words file
+        self._type_configs = {}
+        self._type_configs_lock = threading.Lock()
         
-    def preprocess_image(self, image_path: str) -> np.ndarray:
+    def preprocess_image(self, image_path: ImageSource, profile: str = None) -> np.ndarray:
         """
         Enhance image quality for better OCR accuracy
         
         Args:
-            image_path: Path to image file
+            image_path: Path to image file, encoded image bytes, or a decoded image array
+            profile: Preprocessing profile (default: the engine's profile)
             
         Returns:
             Preprocessed image as numpy array
         """
-        # Read image
-        img = cv2.imread(image_path)
+        processed, _ = self._preprocess(self._decode_gray(self._read_source(image_path)), profile)
+        return processed
+    
+    @staticmethod
+    def _read_source(source: ImageSource):
+        """
+        Get a document's content exactly once
         
-        # Convert to grayscale
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        Paths are read into bytes; bytes-like objects and arrays are returned as
+        they are (no copy), so the same buffer feeds the cache key and decoding.
+        """
+        if isinstance(source, (str, Path)):
+            return Path(source).read_bytes()
+        if isinstance(source, (bytes, bytearray, memoryview, np.ndarray)):
+            return source
+        raise TypeError(f"Unsupported document source: {type(source).__name__}")
+    
+    @staticmethod
+    def _decode_gray(content) -> np.ndarray:
+        """Decode encoded image bytes (once, straight to grayscale) or convert an array to grayscale"""
+        if isinstance(content, np.ndarray):
+            if content.ndim == 2:
+                return content
+            if content.shape[2] == 4:
+                return cv2.cvtColor(content, cv2.COLOR_BGRA2GRAY)
+            return cv2.cvtColor(content, cv2.COLOR_BGR2GRAY)
+        
+        # np.frombuffer wraps the bytes without copying
+        gray = cv2.imdecode(np.frombuffer(content, dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+        if gray is None:
+            raise ValueError("Could not decode image data")
+        return gray
+    
+    @staticmethod
+    def _source_label(source: ImageSource) -> str:
+        """Name used for a document in results: its path, or its in-memory type"""
+        if isinstance(source, (str, Path)):
+            return str(source)
+        return f"<{type(source).__name__}>"
+    
+    @staticmethod
+    def _check_cancelled(cancel: Optional[threading.Event]):
+        """Raise OCRCancelledError if a document's cancel event is set"""
+        if cancel is not None and cancel.is_set():
+            raise OCRCancelledError("OCR cancelled")
+    
+    def _preprocess(self, gray: np.ndarray, profile: str = None, deskew: bool = True,
+                    cancel: threading.Event = None) -> Tuple[np.ndarray, Dict]:
+        """
+        Run a preprocessing profile on a grayscale image
+        
+        Args:
+            gray: Grayscale image
+            profile: Preprocessing profile (default: the engine's profile)
+            deskew: False skips deskewing whatever the profile says (tiles of a page)
+            cancel: Event checked before each stage (see process_document)
+            
+        Returns:
+            (binarized image, report) where the report lists the stages that ran,
+            their timings and, for 'auto', the quality metrics behind each choice
+            
+        Raises:
+            OCRCancelledError: If cancel was set
+        """
+        profile = profile or self.preprocessing_profile
+        settings = dict(PREPROCESSING_PROFILES[profile])
+        report = {'profile': profile, 'stages': [], 'timings_ms': {}}
+        
+        skew_angle = None
+        if 'auto' in settings.values():
+            start = time.perf_counter()
+            metrics = self.measure_image_quality(gray)
+            report['timings_ms']['measure'] = round((time.perf_counter() - start) * 1000, 2)
+            report['metrics'] = metrics
+            settings = self._choose_stages(settings, metrics)
+            skew_angle = metrics['skew_angle']
+        if not deskew:
+            settings['deskew'] = False
+        
+        def run(stage, func, *args, **kwargs):
+            self._check_cancelled(cancel)
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            report['stages'].append(stage)
+            report['timings_ms'][stage] = round((time.perf_counter() - start) * 1000, 2)
+            return result
         
         # Apply denoising
-        denoised = cv2.fastNlMeansDenoising(gray)
+        if settings['denoise'] == 'nlmeans':
+            denoised = run('denoise_nlmeans', cv2.fastNlMeansDenoising, gray)
+        elif settings['denoise'] == 'median':
+            denoised = run('denoise_median', cv2.medianBlur, gray, 3)
+        else:
+            denoised = gray
         
-        # Apply adaptive thresholding for better contrast
-        thresh = cv2.adaptiveThreshold(
-            denoised, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
-            cv2.THRESH_BINARY, 11, 2
-        )
+        # Binarize: adaptive copes with uneven lighting, Otsu is a single cheap global pass
+        if settings['threshold'] == 'adaptive':
+            thresh = run('threshold_adaptive', cv2.adaptiveThreshold,
+                denoised, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
+                cv2.THRESH_BINARY, 11, 2
+            )
+        else:
+            _, thresh = run('threshold_otsu', cv2.threshold,
+                            denoised, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        
+        if not settings['deskew']:
+            return thresh, report
+        
+        # Deskew if needed ('auto' already estimated the angle on the thumbnail)
+        angle = skew_angle if skew_angle is not None else run('skew_estimate', self.estimate_skew_angle, thresh)
+        if abs(angle) > ADAPTIVE_THRESHOLDS['skew_degrees']:  # Only deskew if needed
+            thresh = run('deskew', self._rotate, thresh, angle)
+        
+        return thresh, report
+    
+    @staticmethod
+    def _rotate(image: np.ndarray, angle: float) -> np.ndarray:
+        """Rotate an image about its centre, keeping its size"""
+        (h, w) = image.shape[:2]
+        center = (w // 2, h // 2)
+        M = cv2.getRotationMatrix2D(center, angle, 1.0)
+        return cv2.warpAffine(image, M, (w, h), 
+                              flags=cv2.INTER_CUBIC, 
+                              borderMode=cv2.BORDER_REPLICATE)
+    
+    def measure_image_quality(self, gray: np.ndarray) -> Dict:
+        """
+        Cheap image-quality metrics used to decide which preprocessing stages are needed
         
-        # Deskew if needed
-        coords = np.column_stack(np.where(thresh > 0))
-        angle = cv2.minAreaRect(coords)[-1]
+        Everything except the noise estimate is computed on a thumbnail of at most
+        metrics_max_side pixels; noise is measured on a full-resolution centre crop
+        because downsampling averages it away.
+        
+        Args:
+            gray: Grayscale image
+            
+        Returns:
+            Dictionary with noise_sigma, sharpness, contrast, lighting_variation and skew_angle
+        """
+        (h, w) = gray.shape[:2]
+        scale = self.metrics_max_side / max(h, w)
+        thumb = gray
+        if scale < 1.0:
+            thumb = cv2.resize(gray, (max(1, round(w * scale)), max(1, round(h * scale))),
+                               interpolation=cv2.INTER_AREA)
+        
+        # Noise sigma: robust spread (MAD) of the high-pass residual on a centre crop
+        half = 128
+        cy, cx = h // 2, w // 2
+        crop = gray[max(0, cy - half):cy + half, max(0, cx - half):cx + half]
+        residual = crop.astype(np.float32) - cv2.GaussianBlur(crop, (5, 5), 0).astype(np.float32)
+        noise_sigma = float(np.median(np.abs(residual - np.median(residual))) * 1.4826)
+        
+        # Sharpness: variance of the Laplacian (low = blurry)
+        sharpness = float(cv2.Laplacian(thumb, cv2.CV_64F).var())
+        
+        # Contrast: gap between mean ink and mean paper brightness, split by Otsu
+        otsu_level, thumb_binary = cv2.threshold(thumb, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        ink = thumb[thumb <= otsu_level]
+        paper = thumb[thumb > otsu_level]
+        contrast = float(paper.mean() - ink.mean()) if ink.size and paper.size else 0.0
+        
+        # Lighting: brightness spread of the background once text is removed by dilation
+        background = cv2.dilate(thumb, np.ones((15, 15), np.uint8))
+        b5, b95 = np.percentile(background, [5, 95])
+        
+        return {
+            'width': w,
+            'height': h,
+            'noise_sigma': round(noise_sigma, 2),
+            'sharpness': round(sharpness, 1),
+            'contrast': round(contrast, 1),
+            'lighting_variation': float(b95 - b5),
+            'skew_angle': round(float(self.estimate_skew_angle(thumb_binary)), 2)
+        }
+    
+    @staticmethod
+    def _choose_stages(settings: Dict, metrics: Dict) -> Dict:
+        """Resolve 'auto' profile entries from measured image quality"""
+        chosen = dict(settings)
+        
+        if chosen['denoise'] == 'auto':
+            if metrics['noise_sigma'] >= ADAPTIVE_THRESHOLDS['nlmeans_noise']:
+                chosen['denoise'] = 'nlmeans'
+            elif metrics['noise_sigma'] >= ADAPTIVE_THRESHOLDS['median_noise']:
+                chosen['denoise'] = 'median'
+            else:
+                chosen['denoise'] = None
+        
+        if chosen['threshold'] == 'auto':
+            uneven = metrics['lighting_variation'] >= ADAPTIVE_THRESHOLDS['lighting_variation']
+            flat = metrics['contrast'] < ADAPTIVE_THRESHOLDS['min_contrast']
+            chosen['threshold'] = 'adaptive' if uneven or flat else 'otsu'
+        
+        if chosen['deskew'] == 'auto':
+            chosen['deskew'] = abs(metrics['skew_angle']) > ADAPTIVE_THRESHOLDS['skew_degrees']
+        
+        return chosen
+    
+    def assess_readability(self, gray: np.ndarray) -> Dict:
+        """
+        Quick pre-OCR check that an image can be read at all
+        
+        Measured on a thumbnail of at most metrics_max_side pixels (a few ms even
+        for phone photos): ink is whatever is clearly darker than the local paper
+        brightness, so fill ratio and sharpness are unaffected by uneven lighting,
+        and sharpness (Laplacian variance) is taken only around the ink so a
+        sparse page doesn't read as blurry.
+        
+        Args:
+            gray: Grayscale image
+            
+        Returns:
+            Dictionary with readable, reasons (READABILITY_REASONS codes, most
+            severe first) and metrics (min_side, sharpness, fill_ratio,
+            background, glare_ratio)
+        """
+        (h, w) = gray.shape[:2]
+        scale = self.metrics_max_side / max(h, w)
+        thumb = gray
+        if scale < 1.0:
+            thumb = cv2.resize(gray, (max(1, round(w * scale)), max(1, round(h * scale))),
+                               interpolation=cv2.INTER_AREA)
+        
+        # Paper brightness: text removed by dilation, then smoothed
+        background = cv2.blur(cv2.dilate(thumb, np.ones((5, 5), np.uint8)), (15, 15))
+        ink = cv2.subtract(background, thumb) > 40
+        fill_ratio = float(ink.mean())
+        
+        near_ink = cv2.dilate(ink.astype(np.uint8), np.ones((3, 3), np.uint8)).astype(bool)
+        sharpness = float(cv2.Laplacian(thumb, cv2.CV_64F)[near_ink].var()) if near_ink.any() else 0.0
+        
+        # Glare: blown-out pixels on paper that is otherwise not white (white scans are all >= 250)
+        paper = float(np.median(background))
+        glare_ratio = float((thumb >= 250).mean()) if paper < READABILITY_THRESHOLDS['glare_background'] else 0.0
+        
+        limits = READABILITY_THRESHOLDS
+        reasons = []
+        if min(h, w) < limits['min_side']:
+            reasons.append('low_resolution')
+        if paper < limits['min_background']:
+            reasons.append('too_dark')
+        elif fill_ratio < limits['min_fill']:
+            reasons.append('blank')
+        elif sharpness < limits['min_sharpness']:
+            reasons.append('blurry')
+        if glare_ratio > limits['max_glare']:
+            reasons.append('glare')
+        
+        return {
+            'readable': not reasons,
+            'reasons': reasons,
+            'metrics': {
+                'min_side': min(h, w),
+                'sharpness': round(sharpness, 1),
+                'fill_ratio': round(fill_ratio, 4),
+                'background': paper,
+                'glare_ratio': round(glare_ratio, 4)
+            }
+        }
+    
+    def _check_readable(self, source: str, gray: np.ndarray):
+        """Raise UnreadableDocumentError if the gate is on and the image fails assess_readability"""
+        if not self.readability_gate:
+            return
+        assessment = self.assess_readability(gray)
+        if not assessment['readable']:
+            raise UnreadableDocumentError(source, assessment['reasons'], assessment['metrics'])
+    
+    def estimate_skew_angle(self, binary: np.ndarray) -> float:
+        """
+        Estimate the rotation (degrees) that straightens a binarized page
+        
+        The angle comes from the minimum-area rectangle around the non-zero
+        pixels. Those are collected with cv2.findNonZero on a copy downsampled
+        to at most deskew_max_side pixels, instead of materializing every
+        foreground coordinate of the full page as int64 pairs.
+        
+        Args:
+            binary: Thresholded single-channel image
+            
+        Returns:
+            Rotation angle to pass to cv2.getRotationMatrix2D
+        """
+        (h, w) = binary.shape[:2]
+        scale = self.deskew_max_side / max(h, w)
+        if scale < 1.0:
+            # INTER_AREA keeps any cell containing foreground non-zero, so the hull is preserved
+            binary = cv2.resize(binary, (max(1, round(w * scale)), max(1, round(h * scale))),
+                                interpolation=cv2.INTER_AREA)
+        
+        points = cv2.findNonZero(binary)
+        if points is None:
+            return 0.0
+        
+        # findNonZero yields (x, y); the angle convention below expects (row, col) points
+        angle = cv2.minAreaRect(np.ascontiguousarray(points.reshape(-1, 2)[:, ::-1]))[-1]
         if angle < -45:
-            angle = -(90 + angle)
+            return -(90 + angle)
+        return -angle
+    
+    def process_document(self, image_path: ImageSource, lang: str = 'eng', timeout: float = None,
+                         duplicate_scope: str = None, document_type: str = None,
+                         cancel: threading.Event = None) -> OCRDocument:
+        """
+        Preprocess and OCR a document exactly once
+        
+        A single image_to_data pass yields the words, their boxes and their
+        confidences; the plain text is rebuilt from those words, so callers that
+        need text, confidence and structured fields share one Tesseract run.
+        
+        Args:
+            image_path: Path to document image or PDF, encoded image/PDF bytes
+                (bytes, bytearray, memoryview), or a decoded image array
+            lang: Language code (default: 'eng')
+            timeout: Seconds each Tesseract call may run before it is killed
+                (per page for PDFs; default: no limit)
+            duplicate_scope: Namespace for near-duplicate reuse, e.g. the student's
+                email; without it (or without a duplicate_index) every new file is OCR'd
+            document_type: Known document type for an extraction pass; OCR then uses
+                its OCR_CONFIGS settings instead of the generic tesseract_config
+            cancel: Event another thread sets to abandon the document; it is checked
+                between pages, bands and preprocessing stages (a Tesseract call
+                already running finishes or hits its timeout first)
+            
+        Returns:
+            OCRDocument with preprocessed image, text, word data and confidence
+            (reused=True if copied from a near-duplicate)
+            
+        Raises:
+            RuntimeError: If Tesseract hit the timeout
+            UnreadableDocumentError: If the readability gate rejected the image
+            OCRCancelledError: If cancel was set before the document finished
+        """
+        source = self._source_label(image_path)
+        content = self._read_source(image_path)
+        config = self.tesseract_config_for(document_type)
+        
+        cache_key, cached = self._cache_lookup(source, content, lang, config)
+        if cached is not None:
+            return cached
+        
+        if PDFPageSource.is_pdf(image_path) or PDFPageSource.is_pdf(content):
+            return self._process_pdf(source, image_path, content, cache_key, lang, timeout,
+                                     document_type, cancel)
+        
+        gray = self._decode_gray(content)
+        self._check_readable(source, gray)
+        
+        image_hash = thumbnail = None
+        if self.duplicate_index is not None and duplicate_scope is not None and cache_key is not None:
+            image_hash = dhash(gray)
+            thumbnail = self.duplicate_index.thumbnail(gray)
+            reused = self._reuse_near_duplicate(source, image_hash, thumbnail, duplicate_scope)
+            if reused is not None:
+                return reused
+        
+        processed_img, data, preprocessing = self._ocr_gray(gray, lang, timeout, config, cancel)
+        
+        document = OCRDocument(
+            source=source,
+            image=processed_img,
+            text=self._text_from_data(data),
+            data=data,
+            confidence=self._mean_confidence(data),
+            preprocessing=preprocessing
+        )
+        
+        if image_hash is not None:
+            # The thumbnail rides along in the cache entry for verifying later matches
+            self._cache_store(cache_key, document, {'thumbnail': encode_thumbnail(thumbnail)})
+            self.duplicate_index.add(image_hash, cache_key, duplicate_scope)
         else:
-            angle = -angle
+            self._cache_store(cache_key, document)
+        
+        return document
+    
+    def _process_pdf(self, source: str, image_path: ImageSource, content, cache_key: Optional[str],
+                     lang: str, timeout: float = None, document_type: str = None,
+                     cancel: threading.Event = None) -> OCRDocument:
+        """OCR every page of a PDF whose cache lookup already missed, and cache the merged result"""
+        pdf = image_path if isinstance(image_path, (str, Path)) else content
+        pages = self.iter_pdf_pages(pdf, lang=lang, timeout=timeout, document_type=document_type,
+                                    cancel=cancel)
+        document = self._merge_pages(source, list(pages))
+        self._cache_store(cache_key, document)
+        return document
+    
+    def ocr_header(self, image_path: ImageSource, lang: str = 'eng') -> OCRDocument:
+        """
+        Cheap first-tier OCR of a downscaled header strip
+        
+        Reads only the top header_fraction of the (first) page at header_scale
+        resolution with the 'fast' profile: enough for classification keywords
+        at a small fraction of full-page OCR cost.
+        
+        Args:
+            image_path: Document path, bytes or image array (as for process_document)
+            lang: Language code (default: 'eng')
+            
+        Returns:
+            OCRDocument for the header strip (preprocessing profile 'header')
+            
+        Raises:
+            UnreadableDocumentError: If the readability gate rejected the (whole) image
+        """
+        content = self._read_source(image_path)
+        if PDFPageSource.is_pdf(image_path) or PDFPageSource.is_pdf(content):
+            pdf = image_path if isinstance(image_path, (str, Path)) else content
+            gray = PDFPageSource(pdf, dpi=max(1, int(self.pdf_dpi * self.header_scale))).render_page(1)
+            scale = 1.0
+        else:
+            gray = self._decode_gray(content)
+            self._check_readable(self._source_label(image_path), gray)
+            scale = self.header_scale
+        
+        (h, w) = gray.shape[:2]
+        strip = gray[:max(1, int(h * self.header_fraction))]
+        if scale < 1.0:
+            strip = cv2.resize(strip, (max(1, int(w * scale)), max(1, int(strip.shape[0] * scale))),
+                               interpolation=cv2.INTER_AREA)
+        
+        processed_img, preprocessing = self._preprocess(strip, 'fast')
+        preprocessing['profile'] = 'header'
+        data = self.backend.image_to_data(processed_img, lang, self.tesseract_config)
+        
+        return OCRDocument(
+            source=self._source_label(image_path),
+            image=processed_img,
+            text=self._text_from_data(data),
+            data=data,
+            confidence=self._mean_confidence(data),
+            preprocessing=preprocessing
+        )
+    
+    def supports_extraction(self, document_type: str) -> bool:
+        """True if extract_structured_data has an extractor for this document type"""
+        return document_type in self.extractable_document_types
+    
+    def ocr_settings_for(self, document_type: str = None) -> Dict:
+        """OCR_CONFIGS entry for a document type (classifier types resolve to their extractor); {} if none"""
+        if not document_type:
+            return {}
+        return OCR_CONFIGS.get(self.document_type_aliases.get(document_type, document_type), {})
+    
+    def tesseract_config_for(self, document_type: str = None) -> str:
+        """
+        Tesseract flags for an OCR pass over a document of a known type
+        
+        Args:
+            document_type: Document type, or None for the generic first pass
+            
+        Returns:
+            The type's flags from OCR_CONFIGS, or tesseract_config if the type has none
+        """
+        settings = self.ocr_settings_for(document_type)
+        if not settings:
+            return self.tesseract_config
+        
+        key = (document_type, self.tesseract_config)
+        with self._type_configs_lock:
+            if key not in self._type_configs:
+                self._type_configs[key] = build_tesseract_config(settings, self.tesseract_config)
+            return self._type_configs[key]
+    
+    def iter_pdf_pages(self, pdf_path: Union[str, bytes], lang: str = 'eng', timeout: float = None,
+                       document_type: str = None, cancel: threading.Event = None) -> Iterator[OCRDocument]:
+        """
+        OCR a PDF page by page, yielding each page's result in page order
+        
+        Pages are rendered lazily and OCR'd on a thread pool of pdf_workers
+        threads. A page is only rendered once a worker slot is free, so at most
+        pdf_workers rasters exist at once and finished pages are streamed out
+        without waiting for the rest of the document.
+        
+        Args:
+            pdf_path: Path to PDF file, or the PDF's bytes
+            lang: Language code (default: 'eng')
+            timeout: Seconds each page's Tesseract call may run (default: no limit)
+            document_type: Known document type; its OCR_CONFIGS settings (including
+                the DPI pages are rendered at) replace the generic ones
+            cancel: Event checked before each page is rendered (see process_document)
+            
+        Yields:
+            OCRDocument per page (source is '<path>#page=<n>', image is not kept)
+            
+        Raises:
+            OCRCancelledError: If cancel was set
+        """
+        config = self.tesseract_config_for(document_type)
+        dpi = self.ocr_settings_for(document_type).get('dpi') or self.pdf_dpi
+        pdf = PDFPageSource(pdf_path, dpi=dpi)
+        page_count = pdf.page_count
+        label = self._source_label(pdf_path)
+        
+        def ocr_page(page_number: int) -> OCRDocument:
+            self._check_cancelled(cancel)
+            _, data, preprocessing = self._ocr_gray(pdf.render_page(page_number), lang, timeout, config, cancel)
+            data['page_num'] = [page_number] * len(data['text'])
+            return OCRDocument(
+                source=f"{label}#page={page_number}",
+                image=None,
+                text=self._text_from_data(data),
+                data=data,
+                confidence=self._mean_confidence(data),
+                preprocessing=preprocessing
+            )
+        
+        with ThreadPoolExecutor(max_workers=self.pdf_workers) as pool:
+            pending = {}
+            next_page = 1
+            next_to_yield = 1
+            finished = {}
+            while next_to_yield <= page_count:
+                while next_page <= page_count and len(pending) + len(finished) < self.pdf_workers:
+                    pending[pool.submit(ocr_page, next_page)] = next_page
+                    next_page += 1
+                
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    finished[pending.pop(future)] = future.result()
+                
+                while next_to_yield in finished:
+                    yield finished.pop(next_to_yield)
+                    next_to_yield += 1
+    
+    def _ocr_gray(self, gray: np.ndarray, lang: str, timeout: float = None,
+                  config: str = None, cancel: threading.Event = None) -> Tuple[Optional[np.ndarray], Dict, Dict]:
+        """
+        Preprocess and OCR one grayscale page, in bands if it is too tall
+        
+        Args:
+            config: Tesseract flags (default: the generic tesseract_config)
+            cancel: Event checked between stages and before Tesseract (see process_document)
+        
+        Returns:
+            (preprocessed image, or None for a tiled page; word data; preprocessing report)
+        """
+        config = config or self.tesseract_config
+        if self.tile_height and gray.shape[0] > self.tile_height * 1.5:
+            data, preprocessing = self._ocr_tiled(gray, lang, timeout, config, cancel)
+            return None, data, preprocessing
+        
+        processed_img, preprocessing = self._preprocess(gray, cancel=cancel)
+        self._check_cancelled(cancel)
+        data = self.backend.image_to_data(processed_img, lang, config, timeout=timeout)
+        return processed_img, data, preprocessing
+    
+    def _ocr_tiled(self, gray: np.ndarray, lang: str, timeout: float = None,
+                   config: str = None, cancel: threading.Event = None) -> Tuple[Dict, Dict]:
+        """
+        OCR a tall page as overlapping horizontal bands on a thread pool
+        
+        Every band is preprocessed and OCR'd on its own, so intermediate arrays
+        are band-sized instead of page-sized. Word boxes are shifted back into
+        page coordinates and each word is kept by exactly one band: the one
+        whose core (the band less half the overlap at each inner edge) holds
+        the word's vertical centre. Bands are concatenated top to bottom, so a
+        paragraph crossing a band edge is split into two.
+        
+        Returns:
+            (word data in page coordinates, preprocessing report with a 'tiles' count)
+        """
+        (h, w) = gray.shape[:2]
+        report = {'profile': self.preprocessing_profile, 'stages': [], 'timings_ms': {}}
+        
+        # Deskew the whole page once (per-band angles would tear lines apart),
+        # estimating the angle from a binarized thumbnail
+        if PREPROCESSING_PROFILES[self.preprocessing_profile]['deskew']:
+            start = time.perf_counter()
+            scale = min(1.0, self.deskew_max_side / max(h, w))
+            small = cv2.resize(gray, (max(1, round(w * scale)), max(1, round(h * scale))),
+                               interpolation=cv2.INTER_AREA)
+            _, small = cv2.threshold(small, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+            angle = self.estimate_skew_angle(small)
+            report['stages'].append('skew_estimate')
+            report['timings_ms']['skew_estimate'] = round((time.perf_counter() - start) * 1000, 2)
+            if abs(angle) > ADAPTIVE_THRESHOLDS['skew_degrees']:
+                start = time.perf_counter()
+                gray = self._rotate(gray, angle)
+                report['stages'].append('deskew')
+                report['timings_ms']['deskew'] = round((time.perf_counter() - start) * 1000, 2)
+        
+        bands = []
+        top = 0
+        while True:
+            bottom = min(h, top + self.tile_height)
+            bands.append((top, bottom))
+            if bottom >= h:
+                break
+            top += self.tile_height - self.tile_overlap
+        half_overlap = self.tile_overlap // 2
+        
+        def ocr_band(index: int) -> Tuple[Dict, Dict]:
+            top, bottom = bands[index]
+            self._check_cancelled(cancel)
+            processed_img, band_report = self._preprocess(gray[top:bottom], deskew=False, cancel=cancel)
+            self._check_cancelled(cancel)
+            data = self.backend.image_to_data(processed_img, lang, config or self.tesseract_config, timeout=timeout)
             
-        if abs(angle) > 0.5:  # Only deskew if needed
-            (h, w) = thresh.shape[:2]
-            center = (w // 2, h // 2)
-            M = cv2.getRotationMatrix2D(center, angle, 1.0)
-            thresh = cv2.warpAffine(thresh, M, (w, h), 
-                                   flags=cv2.INTER_CUBIC, 
-                                   borderMode=cv2.BORDER_REPLICATE)
+            core_top = top + half_overlap if index > 0 else 0
+            core_bottom = bottom - half_overlap if index < len(bands) - 1 else h
+            kept = {key: [] for key in data}
+            for i in range(len(data['text'])):
+                centre = top + int(data['top'][i]) + int(data['height'][i]) / 2
+                if core_top <= centre < core_bottom:
+                    for key in data:
+                        kept[key].append(data[key][i])
+            kept['top'] = [int(value) + top for value in kept['top']]
+            kept['block_num'] = [int(value) + index * TILE_BLOCK_STRIDE for value in kept['block_num']]
+            return kept, band_report
+        
+        with ThreadPoolExecutor(max_workers=self.tile_workers) as pool:
+            results = list(pool.map(ocr_band, range(len(bands))))
+        
+        data = {}
+        for band_data, band_report in results:
+            for key, values in band_data.items():
+                data.setdefault(key, []).extend(values)
+            for stage in band_report['stages']:
+                if stage not in report['stages']:
+                    report['stages'].append(stage)
+            for stage, ms in band_report['timings_ms'].items():
+                report['timings_ms'][stage] = round(report['timings_ms'].get(stage, 0) + ms, 2)
+        report['tiles'] = len(bands)
+        
+        return data, report
+    
+    def _merge_pages(self, source: str, pages: List[OCRDocument]) -> OCRDocument:
+        """Combine per-page results into one document (pages separated by a blank line)"""
+        data = {}
+        for page in pages:
+            for key, values in page.data.items():
+                data.setdefault(key, []).extend(values)
+        
+        stages = []
+        for page in pages:
+            stages.extend(stage for stage in page.preprocessing.get('stages', []) if stage not in stages)
+        
+        return OCRDocument(
+            source=source,
+            image=None,
+            text='\n\n'.join(page.text for page in pages if page.text),
+            data=data,
+            confidence=self._mean_confidence(data) if data else 0.0,
+            preprocessing={'profile': self.preprocessing_profile, 'stages': stages},
+            pages=[
+                {
+                    'page': number,
+                    'confidence': page.confidence,
+                    'characters': len(page.text),
+                    'stages': page.preprocessing.get('stages', [])
+                }
+                for number, page in enumerate(pages, start=1)
+            ]
+        )
+    
+    def _cache_lookup(self, source: str, content, lang: str,
+                      tesseract_config: str = None) -> Tuple[Optional[str], Optional[OCRDocument]]:
+        """Return (cache key, cached OCRDocument or None); the key is None when caching is off"""
+        if self.cache is None:
+            return None, None
+        
+        config = self._cache_config(lang, tesseract_config)
+        if isinstance(content, np.ndarray):
+            # Hash the pixels themselves; shape and dtype disambiguate equal buffers
+            config['array'] = [list(content.shape), str(content.dtype)]
+            content = np.ascontiguousarray(content)
+        
+        cache_key = self.cache.make_key(content, config)
+        cached = self.cache.get(cache_key)
+        if cached is None:
+            return cache_key, None
+        
+        document = OCRDocument.from_payload(source, cached, from_cache=True)
+        document.cache_key = cache_key
+        return cache_key, document
+    
+    def _reuse_near_duplicate(self, source: str, image_hash: int, thumbnail: np.ndarray,
+                              scope: str) -> Optional[OCRDocument]:
+        """Cached result of an earlier near-identical document in the same scope, if any"""
+        match = self.duplicate_index.find(image_hash, scope)
+        if match is None:
+            return None
+        
+        payload = self.cache.get(match[0])
+        if payload is None or 'thumbnail' not in payload:
+            # Original result was evicted
+            return None
+        if not self.duplicate_index.verify(thumbnail, decode_thumbnail(payload['thumbnail'])):
+            return None
         
-        return thresh
+        document = OCRDocument.from_payload(source, payload, from_cache=True)
+        document.reused = True
+        document.cache_key = match[0]
+        return document
     
-    def extract_text(self, image_path: str, lang: str = 'eng') -> str:
+    def _cache_store(self, cache_key: Optional[str], document: OCRDocument, extra: Dict = None):
+        """Save a fresh OCR result (plus any extra payload fields) under its cache key"""
+        if cache_key is None:
+            return
+        self.cache.put(cache_key, {**document.to_payload(), **(extra or {})})
+        document.cache_key = cache_key
+    
+    def _cache_rereads(self, document: OCRDocument):
+        """Add a document's crop re-reads to its cache entry, so a later hit needs no page image"""
+        if self.cache is not None and document.cache_key is not None:
+            self.cache.update(document.cache_key, {'rereads': document.rereads})
+    
+    def _cache_config(self, lang: str, tesseract_config: str = None) -> Dict:
+        """OCR settings that change the result and therefore belong in the cache key"""
+        config = {
+            'lang': lang,
+            'tesseract_config': tesseract_config or self.tesseract_config,
+            'preprocessing': self.preprocessing_profile,
+            'pdf_dpi': self.pdf_dpi,
+            # Entries from before payloads recorded the page size are not reused
+            'payload_version': 2
+        }
+        if self.tile_height:
+            config['tiling'] = [self.tile_height, self.tile_overlap]
+        return config
+    
+    @staticmethod
+    def _text_from_data(data: Dict) -> str:
+        """Rebuild page text from image_to_data words (one line per OCR line, blank line between paragraphs)"""
+        lines = []
+        current_line = None
+        current_par = None
+        for i, word in enumerate(data['text']):
+            if not word or not word.strip():
+                continue
+            par_key = (data['page_num'][i], data['block_num'][i], data['par_num'][i])
+            line_key = par_key + (data['line_num'][i],)
+            if line_key != current_line:
+                if current_par is not None and par_key != current_par:
+                    lines.append('')
+                lines.append([])
+                current_line = line_key
+                current_par = par_key
+            lines[-1].append(word.strip())
+        
+        return '\n'.join(' '.join(line) if line else '' for line in lines).strip()
+    
+    @staticmethod
+    def _mean_confidence(data: Dict) -> float:
+        """Average word confidence, excluding Tesseract's -1 (non-word) entries"""
+        confidences = [float(conf) for conf in data['conf'] if float(conf) != -1]
+        if confidences:
+            return sum(confidences) / len(confidences)
+        return 0.0
+    
+    def extract_text(self, image_path: Union[ImageSource, OCRDocument], lang: str = 'eng') -> str:
         """
         Extract all text from document
         
         Args:
-            image_path: Path to document image
+            image_path: Path to document image, image bytes/array, or an already processed OCRDocument
             lang: Language code (default: 'eng')
             
         Returns:
             Extracted text as string
         """
+        if isinstance(image_path, OCRDocument):
+            return image_path.text
+        
         try:
-            # Preprocess image
-            processed_img = self.preprocess_image(image_path)
-            
-            # Convert back to PIL Image for pytesseract
-            pil_img = Image.fromarray(processed_img)
-            
-            # Extract text with configuration
-            custom_config = r'--oem 3 --psm 6'  # LSTM OCR Engine, assume uniform text block
-            text = pytesseract.image_to_string(pil_img, lang=lang, config=custom_config)
-            
-            return text.strip()
+            return self.process_document(image_path, lang=lang).text
         except Exception as e:
             return f"Error extracting text: {str(e)}"
     
-    def extract_structured_data(self, image_path: str, document_type: str) -> Dict:
+    def extract_structured_data(self, image_path: Union[ImageSource, OCRDocument], document_type: str) -> Dict:
         """
         Extract structured data based on document type
         
+        Fields are read from the OCR pass's word boxes first: the value printed
+        next to (or under) its label, e.g. 'DATE OF BIRTH'. Values of the type's
+        numeric_fields (OCR_CONFIGS) are then re-read from their box with a
+        character whitelist. For layouts with a registered OCR template the
+        template's field regions take precedence (see extract_template_fields);
+        given a file rather than an OCRDocument, a known layout is read from its
+        field crops alone, without a full-page pass. Regex extraction over the
+        full-page text fills any field none of these produced.
+        
         Args:
-            image_path: Path to document
-            document_type: Type of document (id, transcript, proof_of_address)
+            image_path: Path to document, image bytes/array (OCR'd with the type's
+                OCR_CONFIGS settings), or an OCRDocument from process_document
+                (avoids running OCR a second time)
+            document_type: Type of document (a FIELD_SPECS extractor such as id,
+                transcript or proof_of_address, or a classifier type such as
+                government_id or utility_bill)
             
         Returns:
             Dictionary with extracted fields
         """
-        text = self.extract_text(image_path)
+        extractor = self.document_type_aliases.get(document_type, document_type)
+        document = image_path if isinstance(image_path, OCRDocument) else None
+        if document is None and extractor in self.field_extractors:
+            try:
+                cropped = self._extract_template_only(image_path, document_type)
+            except Exception:
+                cropped = None
+            if cropped is not None:
+                text, template_fields = cropped
+                data = self.field_extractors[extractor].extract(text)
+                data.update({field: value for field, value in template_fields.items() if value})
+                data['extraction_method'] = 'template'
+                return data
         
-        if document_type == 'id':
-            return self._extract_id_data(text)
-        elif document_type == 'transcript':
-            return self._extract_transcript_data(text)
-        elif document_type == 'proof_of_address':
-            return self._extract_address_data(text)
-        else:
+        if document is None:
+            try:
+                document = self.process_document(image_path, document_type=document_type)
+            except Exception as e:
+                text = f"Error extracting text: {str(e)}"
+        if document is not None:
+            text = document.text
+        
+        if extractor not in self.field_extractors:
             return {'raw_text': text}
+        data = self.field_extractors[extractor].extract(text)
+        
+        data['extraction_method'] = 'text'
+        if document is not None:
+            rereads_before = len(document.rereads)
+            # Template values win, so numeric fields they provide are not re-read
+            template_fields = {field: value for field, value in
+                               (self.extract_template_fields(document, document_type) or {}).items() if value}
+            boxes = {}
+            layout_fields = extract_layout_fields(document.data, extractor, boxes)
+            layout_fields.update(self._reread_numeric_fields(document, extractor, boxes, skip=set(template_fields)))
+            if layout_fields:
+                data.update(layout_fields)
+                data['extraction_method'] = 'layout'
+            
+            if template_fields:
+                data.update(template_fields)
+                data['extraction_method'] = 'template'
+            
+            if len(document.rereads) > rereads_before:
+                self._cache_rereads(document)
+        
+        return data
     
-    def _extract_id_data(self, text: str) -> Dict:
-        """Extract data from government-issued ID"""
-        data = {
-            'document_type': 'government_id',
-            'full_name': None,
-            'date_of_birth': None,
-            'id_number': None,
-            'expiry_date': None,
-            'address': None,
-            'raw_text': text
-        }
+    def _page_image(self, document: OCRDocument) -> Optional[np.ndarray]:
+        """
+        Preprocessed image of a single-page document, for crop re-reads
         
-        # Extract name patterns (usually in caps)
-        name_patterns = [
-            r'(?:NAME|SURNAME|GIVEN NAMES?)[\s:]+([A-Z\s]+)',
-            r'([A-Z]{2,}\s+[A-Z]{2,}(?:\s+[A-Z]+)?)'
-        ]
-        for pattern in name_patterns:
-            match = re.search(pattern, text)
-            if match and not data['full_name']:
-                data['full_name'] = match.group(1).strip()
-        
-        # Extract dates (DOB, expiry)
-        date_pattern = r'\b(\d{2}[-/]\d{2}[-/]\d{4}|\d{4}[-/]\d{2}[-/]\d{2})\b'
-        dates = re.findall(date_pattern, text)
-        if len(dates) >= 1:
-            data['date_of_birth'] = dates[0]
-        if len(dates) >= 2:
-            data['expiry_date'] = dates[1]
-        
-        # Extract ID number (various formats)
-        id_patterns = [
-            r'(?:ID|LICENSE|CARD)\s*(?:NO|#|NUMBER)?[\s:]*([A-Z0-9\-]{6,})',
-            r'\b([A-Z]\d{4}-\d{5}-\d{5})\b'  # Ontario format
-        ]
-        for pattern in id_patterns:
-            match = re.search(pattern, text)
-            if match:
-                data['id_number'] = match.group(1)
-                break
+        Cached and near-duplicate results carry no image. It is rebuilt from the
+        source file with the same preprocessing (and scaled to the size the
+        cached word boxes refer to), so re-reads, and therefore the extracted
+        fields, are the same with or without the OCR cache. None for PDFs,
+        tiled pages and in-memory sources, whose image cannot be rebuilt.
+        """
+        if document.image is not None:
+            return document.image
+        if document.pages or document.size is None or document.source.startswith('<'):
+            return None
+        path = Path(document.source)
+        if PDFPageSource.is_pdf(path) or not path.is_file():
+            return None
         
-        # Extract address
-        address_pattern = r'(\d+\s+[\w\s]+(?:STREET|ST|AVENUE|AVE|ROAD|RD|DRIVE|DR)[\s,]+[\w\s]+,?\s*[A-Z]{2}\s+[A-Z0-9\s]+)'
-        match = re.search(address_pattern, text, re.IGNORECASE)
-        if match:
-            data['address'] = match.group(1).strip()
+        image, _ = self._preprocess(self._decode_gray(path.read_bytes()))
+        if (image.shape[1], image.shape[0]) != document.size:
+            # A near-duplicate re-upload at another resolution
+            image = cv2.resize(image, document.size, interpolation=cv2.INTER_AREA)
+        document.image = image
+        return image
+    
+    def _reread_numeric_fields(self, document: OCRDocument, extractor: str, boxes: Dict,
+                               lang: str = 'eng', skip: set = frozenset()) -> Dict:
+        """
+        Re-OCR the value boxes of numeric layout fields as single lines with a whitelist
         
-        return data
+        A full-page pass may read '0' as 'O' or '1' as 'l' inside a date; a
+        whitelisted re-read of just the value cannot. Each box is read once per
+        document: cached results reuse the stored value (see _crop_reread).
+        Not possible for tiled or PDF results, which keep no page image.
+        
+        Args:
+            skip: Fields not to re-read (already read from a template region)
+        
+        Returns:
+            Field -> re-read value, for the fields whose re-read matched their pattern
+        """
+        numeric_fields = {field: whitelist for field, whitelist in
+                          self.ocr_settings_for(extractor).get('numeric_fields', {}).items() if field not in skip}
+        if not numeric_fields:
+            return {}
+        
+        layout_spec = LAYOUT_FIELDS.get(extractor, {}).get('fields', {})
+        values = {}
+        for field, whitelist in numeric_fields.items():
+            if field not in boxes:
+                continue
+            pattern = layout_spec.get(field, {}).get('pattern')
+            value = self._crop_reread(
+                document, f"{extractor}:numeric:{field}",
+                lambda image: self._read_numeric_box(image, boxes[field], whitelist, pattern, lang)
+            )
+            if value:
+                values[field] = value
+        
+        return values
     
-    def _extract_transcript_data(self, text: str) -> Dict:
-        """Extract data from educational transcript"""
-        data = {
-            'document_type': 'transcript',
-            'student_name': None,
-            'institution_name': None,
-            'graduation_date': None,
-            'program': None,
-            'gpa': None,
-            'courses': [],
-            'raw_text': text
-        }
+    def _read_numeric_box(self, image: np.ndarray, box: Tuple, whitelist: str, pattern: Optional[str],
+                          lang: str = 'eng') -> Optional[str]:
+        """OCR one layout value box (a boxes entry of extract_layout_fields) as a whitelisted single line"""
+        (h, w) = image.shape[:2]
+        _, left, top, right, bottom = box
+        pad = max(2, (bottom - top) // 4)
+        crop = image[max(0, top - pad):min(h, bottom + pad), max(0, left - pad):min(w, right + pad)]
+        if crop.size == 0:
+            return None
         
-        # Extract student name
-        name_patterns = [
-            r'(?:STUDENT NAME|NAME)[\s:]+([A-Z][a-z]+\s+[A-Z][a-z]+)',
-            r'([A-Z]{2,}\s+[A-Z]{2,})'
-        ]
-        for pattern in name_patterns:
+        config = f"--oem 3 --psm 7 -c tessedit_char_whitelist={whitelist}"
+        text = ' '.join(self._text_from_data(self.backend.image_to_data(crop, lang, config)).split())
+        if pattern:
             match = re.search(pattern, text)
-            if match:
-                data['student_name'] = match.group(1).strip()
-                break
+            text = (match.group(1) if match.groups() else match.group(0)) if match else ''
+        return text or None
+    
+    def extract_template_fields(self, document: OCRDocument, document_type: str, lang: str = 'eng') -> Optional[Dict]:
+        """
+        Read the fields of a known layout from their template regions
+        
+        A template only applies when the page's aspect ratio matches and its
+        anchor labels were read inside their boxes, so another card of the same
+        size is not read with its crops. Each field first takes the words the
+        OCR pass already read inside its box, if they fit the field's whitelist
+        and pattern; only the remaining fields are OCR'd as crops (field-specific
+        PSM and whitelist), so a cleanly read page costs no further Tesseract call.
+        
+        Args:
+            document: Processed single-page document
+            document_type: Classified document type used to look up templates
+            lang: Language code (default: 'eng')
+            
+        Returns:
+            Field values, or None if no template matches this document
+        """
+        if document.size is None or document.pages or not document.data:
+            return None
         
-        # Extract institution
-        institution_patterns = [
-            r'([\w\s]+(?:HIGH SCHOOL|SECONDARY SCHOOL|COLLEGIATE))',
-            r'(?:SCHOOL|INSTITUTION)[\s:]+(.+?)(?:\n|$)'
-        ]
-        for pattern in institution_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                data['institution_name'] = match.group(1).strip()
+        lines = build_lines(document.data)
+        template = None
+        for name in dict.fromkeys([document_type, self.document_type_aliases.get(document_type, document_type)]):
+            template = match_template(name, *document.size, lines)
+            if template is not None:
                 break
+        if template is None:
+            return None
         
-        # Extract graduation date
-        date_pattern = r'(?:GRADUATED?|COMPLETION)[\s:]+(\w+\s+\d{4}|\d{2}/\d{2}/\d{4})'
-        match = re.search(date_pattern, text, re.IGNORECASE)
-        if match:
-            data['graduation_date'] = match.group(1)
+        values = {}
+        missing = []
+        for field, spec in template['fields'].items():
+            values[field] = field_value(spec, region_text(lines, scale_box(template, spec['box'], *document.size)))
+            if values[field] is None:
+                missing.append(field)
         
-        # Extract GPA
-        gpa_pattern = r'(?:GPA|AVERAGE)[\s:]+(\d+\.?\d*)'
-        match = re.search(gpa_pattern, text, re.IGNORECASE)
-        if match:
-            data['gpa'] = match.group(1)
+        extractor = self.document_type_aliases.get(document_type, document_type)
+        for field in missing:
+            spec = template['fields'][field]
+            values[field] = self._crop_reread(
+                document, f"{extractor}:template:{field}",
+                lambda image: field_value(spec, self._template_box_text(image, template, spec, lang))
+            )
         
-        return data
+        return self._finish_template_values(template, values)
     
-    def _extract_address_data(self, text: str) -> Dict:
-        """Extract data from proof of address document"""
-        data = {
-            'document_type': 'proof_of_address',
-            'name': None,
-            'address': None,
-            'document_date': None,
-            'issuer': None,
-            'raw_text': text
-        }
+    def _crop_reread(self, document: OCRDocument, key: str, read) -> Optional[str]:
+        """
+        Value of a field crop OCR'd after the page pass, read once per document
         
-        # Extract name
-        name_pattern = r'(?:NAME|TO|FOR)[\s:]+([A-Z][a-z]+\s+[A-Z][a-z]+)'
-        match = re.search(name_pattern, text)
-        if match:
-            data['name'] = match.group(1).strip()
-        
-        # Extract full address
-        address_pattern = r'(\d+\s+[\w\s]+(?:STREET|ST|AVENUE|AVE|ROAD|RD)[\s,]+[\w\s]+,?\s*ON\s+[A-Z0-9\s]+)'
-        match = re.search(address_pattern, text, re.IGNORECASE)
-        if match:
-            data['address'] = match.group(1).strip()
-        
-        # Extract date
-        date_pattern = r'(?:DATE|BILL DATE)[\s:]+(\w+\s+\d{1,2},?\s+\d{4}|\d{2}/\d{2}/\d{4})'
-        match = re.search(date_pattern, text, re.IGNORECASE)
-        if match:
-            data['document_date'] = match.group(1)
-        
-        # Extract issuer (utility company, bank, etc.)
-        issuer_patterns = [
-            r'((?:HYDRO|ENBRIDGE|ROGERS|BELL)[\w\s]*)',
-            r'^([\w\s]+(?:UTILITY|ELECTRIC|GAS|TELECOM))'
-        ]
-        for pattern in issuer_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                data['issuer'] = match.group(1).strip()
-                break
+        The value is kept in document.rereads (and with it in the cache entry),
+        so a cached or near-duplicate result reuses it instead of rebuilding and
+        re-preprocessing the page image (see _page_image).
         
-        return data
+        Args:
+            document: Processed single-page document
+            key: Identifies the crop within the document (extractor, kind, field)
+            read: Function of the page image returning the value (or None)
+            
+        Returns:
+            The value, or None if it was not found or no page image can be had
+        """
+        if key not in document.rereads:
+            image = self._page_image(document)
+            if image is None:
+                return None
+            document.rereads[key] = read(image)
+        return document.rereads[key]
     
-    def process_batch(self, file_paths: List[str]) -> List[Dict]:
+    def _extract_template_only(self, image_path: ImageSource, document_type: str,
+                               lang: str = 'eng') -> Optional[Tuple[str, Dict]]:
+        """
+        Read a document of a known layout from its template crops alone, without full-page OCR
+        
+        The image is preprocessed as usual; each candidate template (by aspect
+        ratio) is confirmed by OCRing its anchor boxes before its field crops
+        are read.
+        
+        Returns:
+            (text of the crops, field values), or None if no template matches
+            (the caller then runs the full-page pass)
+        """
+        names = list(dict.fromkeys([document_type, self.document_type_aliases.get(document_type, document_type)]))
+        if not any(templates_for(name) for name in names):
+            return None
+        content = self._read_source(image_path)
+        if PDFPageSource.is_pdf(image_path) or PDFPageSource.is_pdf(content):
+            return None
+        gray = self._decode_gray(content)
+        (h, w) = gray.shape[:2]
+        candidates = []
+        for name in names:
+            candidates += [t for t in candidate_templates(name, w, h) if t not in candidates]
+        if not candidates:
+            return None
+        
+        self._check_readable(self._source_label(image_path), gray)
+        image, _ = self._preprocess(gray)
+        for template in candidates:
+            anchored = True
+            for anchor in template.get('anchors', []):
+                crop_lines = build_lines(self._ocr_template_box(image, template, {'box': anchor['box']}, lang))
+                if not any(find_label(crop_lines, label) for label in anchor['labels']):
+                    anchored = False
+                    break
+            if not anchored:
+                continue
+            
+            texts = []
+            values = {}
+            for field, spec in template['fields'].items():
+                text = self._template_box_text(image, template, spec, lang)
+                texts.append(text)
+                values[field] = field_value(spec, text)
+            return '\n'.join(text for text in texts if text), self._finish_template_values(template, values)
+        return None
+    
+    def _ocr_template_box(self, image: np.ndarray, template: Dict, spec: Dict, lang: str = 'eng') -> Dict:
+        """OCR one template box of a page image with the box's PSM and whitelist (word data; empty for an empty crop)"""
+        (h, w) = image.shape[:2]
+        left, top, right, bottom = scale_box(template, spec['box'], w, h)
+        crop = image[max(0, top):min(h, bottom), max(0, left):min(w, right)]
+        if crop.size == 0:
+            return {'text': [], 'conf': []}
+        
+        config = f"--oem 3 --psm {spec.get('psm', 7)}"
+        if spec.get('whitelist'):
+            config += f" -c tessedit_char_whitelist={spec['whitelist']}"
+        return self.backend.image_to_data(crop, lang, config)
+    
+    def _template_box_text(self, image: np.ndarray, template: Dict, spec: Dict, lang: str = 'eng') -> str:
+        """Text of one template box (see _ocr_template_box), on a single line"""
+        data = self._ocr_template_box(image, template, spec, lang)
+        return ' '.join(self._text_from_data(data).split()) if data['text'] else ''
+    
+    @staticmethod
+    def _finish_template_values(template: Dict, values: Dict) -> Dict:
+        """Apply a template's 'combine' and drop its 'internal_fields'"""
+        for field, parts in template.get('combine', {}).items():
+            joined = ' '.join(values[part] for part in parts if values.get(part))
+            values[field] = joined or None
+        
+        for field in template.get('internal_fields', []):
+            values.pop(field, None)
+        
+        return values
+    
+    def process_batch(self, file_paths: List[ImageSource], workers: int = 1, max_in_flight: int = None) -> List[Dict]:
         """
         Process multiple documents in batch
         
         Args:
-            file_paths: List of document paths
+            file_paths: List of document paths (or in-memory image bytes/arrays)
+            workers: Number of OCR worker processes (1 = process sequentially in this process)
+            max_in_flight: Upper bound on files (chunks of batch_size files with the
+                'batch' backend) submitted but not yet finished (default: 2 per
+                worker), which caps memory on very large batches
             
         Returns:
-            List of extracted data dictionaries
+            List of extracted data dictionaries, in the same order as file_paths
+        """
+        if workers is None or workers <= 1 or len(file_paths) <= 1:
+            batch_size = getattr(self.backend, 'batch_size', 1)
+            if batch_size > 1:
+                results = []
+                for start in range(0, len(file_paths), batch_size):
+                    chunk = file_paths[start:start + batch_size]
+                    results.extend(map(self._chunk_result, chunk, self._process_chunk(chunk)))
+                return results
+            return [self._process_batch_item(file_path) for file_path in file_paths]
+        
+        return self._process_batch_parallel(file_paths, workers, max_in_flight or workers * 2)
+    
+    def _process_batch_item(self, file_path: ImageSource) -> Dict:
+        """OCR one batch entry, turning failures into an error result"""
+        try:
+            return self._batch_result(self.process_document(file_path))
+        except Exception as e:
+            return self._batch_error(self._source_label(file_path), e)
+    
+    def _chunk_result(self, file_path: ImageSource, outcome: Union[OCRDocument, Exception]) -> Dict:
+        if isinstance(outcome, Exception):
+            return self._batch_error(self._source_label(file_path), outcome)
+        return self._batch_result(outcome)
+    
+    def _process_chunk(self, file_paths: List[ImageSource], lang: str = 'eng') -> List[Union[OCRDocument, Exception]]:
         """
-        results = []
-        for file_path in file_paths:
+        OCR a chunk of batch entries with a single Tesseract run
+        
+        Every entry is read, gated and preprocessed first; the preprocessed
+        pages then go to the backend's images_to_data together. Cache hits,
+        PDFs and pages tall enough to tile are handled one by one as usual.
+        Backends without images_to_data process every entry on its own.
+        
+        Returns:
+            One entry per file, in order: its OCRDocument, or the exception it failed with
+        """
+        outcomes = [None] * len(file_paths)
+        if not hasattr(self.backend, 'images_to_data'):
+            for index, file_path in enumerate(file_paths):
+                try:
+                    outcomes[index] = self.process_document(file_path, lang)
+                except Exception as e:
+                    outcomes[index] = e
+            return outcomes
+        
+        pending = []  # (index, source, cache key, preprocessed image, preprocessing report)
+        for index, file_path in enumerate(file_paths):
             try:
-                text = self.extract_text(file_path)
-                results.append({
-                    'file': file_path,
-                    'text': text,
-                    'status': 'success'
-                })
+                source = self._source_label(file_path)
+                content = self._read_source(file_path)
+                cache_key, cached = self._cache_lookup(source, content, lang)
+                if cached is not None:
+                    outcomes[index] = cached
+                    continue
+                
+                if PDFPageSource.is_pdf(file_path) or PDFPageSource.is_pdf(content):
+                    # The lookup above already counted this document's miss
+                    outcomes[index] = self._process_pdf(source, file_path, content, cache_key, lang)
+                    continue
+                
+                gray = self._decode_gray(content)
+                self._check_readable(source, gray)
+                if self.tile_height and gray.shape[0] > self.tile_height * 1.5:
+                    _, data, preprocessing = self._ocr_gray(gray, lang)
+                    outcomes[index] = self._new_document(source, cache_key, None, data, preprocessing)
+                    continue
+                
+                processed_img, preprocessing = self._preprocess(gray)
+                pending.append((index, source, cache_key, processed_img, preprocessing))
             except Exception as e:
-                results.append({
-                    'file': file_path,
-                    'text': '',
-                    'status': 'error',
-                    'error': str(e)
-                })
+                outcomes[index] = e
+        
+        if not pending:
+            return outcomes
+        
+        try:
+            results = self.backend.images_to_data([entry[3] for entry in pending], lang, self.tesseract_config)
+        except Exception as e:
+            results = [e] * len(pending)
+        
+        for (index, source, cache_key, processed_img, preprocessing), data in zip(pending, results):
+            if isinstance(data, Exception):
+                outcomes[index] = data
+            else:
+                outcomes[index] = self._new_document(source, cache_key, processed_img, data, preprocessing)
+        return outcomes
+    
+    def _new_document(self, source: str, cache_key: Optional[str], image: Optional[np.ndarray],
+                      data: Dict, preprocessing: Dict) -> OCRDocument:
+        """Wrap fresh OCR output in an OCRDocument and cache it"""
+        document = OCRDocument(
+            source=source,
+            image=image,
+            text=self._text_from_data(data),
+            data=data,
+            confidence=self._mean_confidence(data),
+            preprocessing=preprocessing
+        )
+        self._cache_store(cache_key, document)
+        return document
+    
+    @staticmethod
+    def _batch_result(document: OCRDocument) -> Dict:
+        return {
+            'file': document.source,
+            'text': document.text,
+            'confidence': document.confidence,
+            'preprocessing_stages': document.preprocessing.get('stages', []),
+            'status': 'success'
+        }
+    
+    @staticmethod
+    def _batch_error(file_path: str, error: Exception) -> Dict:
+        if isinstance(error, UnreadableDocumentError):
+            return {
+                'file': file_path,
+                'text': '',
+                'status': 'unreadable',
+                'reasons': error.reasons,
+                'error': str(error)
+            }
+        return {
+            'file': file_path,
+            'text': '',
+            'status': 'error',
+            'error': str(error)
+        }
+    
+    def _process_batch_parallel(self, file_paths: List[ImageSource], workers: int, max_in_flight: int) -> List[Dict]:
+        """
+        OCR a batch on a process pool
+        
+        Cache lookups and stores stay in this process; only misses are sent to
+        workers. At most max_in_flight files are submitted at any time, and
+        results are slotted back by index so output order matches input order.
+        """
+        results = [None] * len(file_paths)
+        cache_keys = {}
+        pending = {}
+        # Misses are sent in chunks a batching backend OCRs in one Tesseract run
+        batch_size = getattr(self.backend, 'batch_size', 1)
+        chunk = []
+        
+        # Split the machine's cores between workers so OpenCV and Tesseract
+        # threads inside each worker don't oversubscribe the CPU
+        threads_per_worker = max(1, (os.cpu_count() or 1) // workers)
+        
+        def collect(futures):
+            for future in futures:
+                indexes = pending.pop(future)
+                try:
+                    outcomes = future.result()
+                except Exception as e:
+                    outcomes = [e] * len(indexes)
+                
+                for index, outcome in zip(indexes, outcomes):
+                    file_path = self._source_label(file_paths[index])
+                    if isinstance(outcome, dict) and 'error_type' in outcome:
+                        outcome = _error_from_record(outcome)
+                    if isinstance(outcome, Exception):
+                        results[index] = self._batch_error(file_path, outcome)
+                        continue
+                    document = OCRDocument.from_payload(file_path, outcome)
+                    self._cache_store(cache_keys.get(index), document)
+                    results[index] = self._batch_result(document)
+        
+        def submit(pool):
+            if len(pending) >= max_in_flight:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            
+            # memoryviews can't be pickled to a worker
+            chunk_paths = [
+                file_paths[index].tobytes() if isinstance(file_paths[index], memoryview) else file_paths[index]
+                for index in chunk
+            ]
+            pending[pool.submit(_ocr_batch_worker, chunk_paths)] = list(chunk)
+            chunk.clear()
+        
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_batch_worker,
+            initargs=(self._worker_settings(), threads_per_worker)
+        ) as pool:
+            for index, file_path in enumerate(file_paths):
+                # Without a cache the file is only read by the worker
+                if self.cache is not None:
+                    try:
+                        cache_key, cached = self._cache_lookup(
+                            self._source_label(file_path), self._read_source(file_path), 'eng'
+                        )
+                    except Exception as e:
+                        results[index] = self._batch_error(self._source_label(file_path), e)
+                        continue
+                    if cached is not None:
+                        results[index] = self._batch_result(cached)
+                        continue
+                    cache_keys[index] = cache_key
+                
+                chunk.append(index)
+                if len(chunk) >= batch_size:
+                    submit(pool)
+            
+            if chunk:
+                submit(pool)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+        
         return results
     
-    def get_confidence_score(self, image_path: str) -> float:
+    def _worker_settings(self) -> Dict:
+        """Settings a batch worker process needs to build an equivalent engine"""
+        return {
+            'tesseract_path': self.tesseract_path,
+            'backend': self.backend.name,
+            'tesseract_config': self.tesseract_config,
+            'preprocessing_profile': self.preprocessing_profile,
+            'pdf_dpi': self.pdf_dpi,
+            'tile_height': self.tile_height,
+            'tile_overlap': self.tile_overlap,
+            'readability_gate': self.readability_gate
+        }
+    
+    def get_confidence_score(self, image_path: Union[ImageSource, OCRDocument]) -> float:
         """
         Get OCR confidence score for a document
         
         Args:
-            image_path: Path to document
+            image_path: Path to document, image bytes/array, or an already processed OCRDocument
             
         Returns:
             Confidence score (0-100)
         """
+        if isinstance(image_path, OCRDocument):
+            return image_path.confidence
+        
         try:
-            processed_img = self.preprocess_image(image_path)
-            pil_img = Image.fromarray(processed_img)
-            
-            # Get detailed OCR data with confidence
-            data = pytesseract.image_to_data(pil_img, output_type=pytesseract.Output.DICT)
-            
-            # Calculate average confidence (excluding -1 values)
-            confidences = [int(conf) for conf in data['conf'] if int(conf) != -1]
-            if confidences:
-                return sum(confidences) / len(confidences)
-            return 0.0
+            return self.process_document(image_path).confidence
         except:
             return 0.0
 
 
+# Engine owned by each batch worker process (set up by _init_batch_worker)
+_worker_engine = None
+
+
+def _init_batch_worker(settings: Dict, threads: int):
+    """Process pool initializer: cap per-worker threading and build the worker's engine"""
+    global _worker_engine
+    
+    # Tesseract (OpenMP) reads this from the environment of each subprocess it is launched in
+    os.environ['OMP_THREAD_LIMIT'] = str(threads)
+    cv2.setNumThreads(threads)
+    
+    # Each worker keeps its own backend, so a persistent backend loads the model once per process
+    _worker_engine = OCREngine(
+        tesseract_path=settings['tesseract_path'],
+        backend=settings['backend'],
+        profile=settings['preprocessing_profile'],
+        pdf_dpi=settings['pdf_dpi'],
+        # Pages (and bands, which follow pdf_workers) OCR'd at once stay within the
+        # worker's share of the cores, not the parent's whole-machine setting
+        pdf_workers=threads,
+        tile_height=settings['tile_height'],
+        tile_overlap=settings['tile_overlap'],
+        readability_gate=settings['readability_gate']
+    )
+    _worker_engine.tesseract_config = settings['tesseract_config']
+
+
+def _ocr_batch_worker(file_paths: List[ImageSource]) -> List[Dict]:
+    """Run OCR for a chunk of batch entries inside a worker process (a payload or error record per entry)"""
+    return [
+        _error_record(outcome) if isinstance(outcome, Exception) else outcome.to_payload()
+        for outcome in _worker_engine._process_chunk(file_paths)
+    ]
+
+
+def _error_record(error: Exception) -> Dict:
+    """
+    Picklable description of an exception raised in a batch worker
+    
+    Exceptions are not sent back as themselves: some (pytesseract's
+    TesseractNotFoundError) cannot be unpickled, which breaks the whole pool.
+    """
+    record = {'error_type': type(error).__name__, 'message': str(error)}
+    if isinstance(error, UnreadableDocumentError):
+        record.update(source=error.source, reasons=error.reasons, metrics=error.metrics)
+    return record
+
+
+def _error_from_record(record: Dict) -> Exception:
+    """Rebuild a worker's exception from its _error_record"""
+    if record['error_type'] == 'UnreadableDocumentError':
+        return UnreadableDocumentError(record['source'], record['reasons'], record['metrics'])
+    return RuntimeError(record['message'])
+
+
 if __name__ == "__main__":
-    # Example usage
+    # Example usage: python -m modules.ocr_engine (from the project root; the
+    # package-relative imports above fail when the file is run as a script)
     ocr = OCREngine()
     
     print("OCR Engine initialized successfully!")
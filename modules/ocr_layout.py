@@ -0,0 +1,274 @@
+"""
+Layout-Aware Field Extraction
+Reads labelled fields from the word boxes of an OCR pass instead of the flattened text
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+
+DATE_PATTERN = r'(\d{4}[-/]\d{2}[-/]\d{2}|\d{2}[-/]\d{2}[-/]\d{4})'
+
+# Per extractor type, the fields found next to a printed label. Per field:
+#   labels:    Label phrases to look for, tried in order (case and punctuation insensitive)
+#   pattern:   Optional regex; its first group (or whole match) becomes the value
+#   max_lines: Lines a value may span when it sits below its label (default 1)
+# 'combine' and 'internal_fields' work as in OCR_TEMPLATES
+LAYOUT_FIELDS = {
+    'id': {
+        'fields': {
+            'surname': {'labels': ['SURNAME', 'LAST NAME', 'FAMILY NAME']},
+            'given_names': {'labels': ['GIVEN NAMES', 'GIVEN NAME', 'FIRST NAME']},
+            'date_of_birth': {
+                'labels': ['DATE OF BIRTH', 'BIRTH DATE', 'DOB'],
+                'pattern': DATE_PATTERN,
+            },
+            'id_number': {
+                'labels': ['CARD NUMBER', 'LICENCE NUMBER', 'LICENSE NUMBER', 'ID NUMBER', 'CARD NO'],
+                'pattern': r'([A-Z0-9][A-Z0-9\-]{5,})',
+            },
+            'expiry_date': {
+                'labels': ['EXPIRY DATE', 'EXPIRY', 'EXPIRES'],
+                'pattern': DATE_PATTERN,
+            },
+        },
+        'combine': {
+            'full_name': ['given_names', 'surname'],
+        },
+        'internal_fields': ['surname', 'given_names'],
+    },
+    'transcript': {
+        'fields': {
+            'student_name': {'labels': ['STUDENT NAME', 'NAME']},
+            'graduation_date': {'labels': ['GRADUATION DATE', 'COMPLETION DATE', 'GRADUATED']},
+            'gpa': {
+                'labels': ['OVERALL AVERAGE', 'GPA', 'AVERAGE'],
+                'pattern': r'(\d+\.?\d*)',
+            },
+        },
+    },
+    'proof_of_address': {
+        'fields': {
+            'name': {'labels': ['CUSTOMER NAME', 'ACCOUNT HOLDER', 'NAME']},
+            'address': {'labels': ['SERVICE ADDRESS', 'MAILING ADDRESS', 'ADDRESS'], 'max_lines': 3},
+            'document_date': {'labels': ['BILL DATE', 'STATEMENT DATE', 'ISSUE DATE']},
+        },
+    },
+}
+
+
+def _normalize(token: str) -> str:
+    """Uppercase a word and drop punctuation, so 'Name:' and 'NAME' compare equal"""
+    return re.sub(r'[^\w]', '', token.upper())
+
+
+def build_lines(data: Dict) -> List[Dict]:
+    """
+    Group image_to_data words into text lines
+    
+    Args:
+        data: Word-level output of image_to_data (Output.DICT)
+        
+    Returns:
+        Lines in reading order; each has page, left/top/right/bottom and its
+        words (text, norm, left, top, right, bottom) sorted left to right
+    """
+    grouped = {}
+    for i, text in enumerate(data['text']):
+        text = (text or '').strip()
+        if not text or float(data['conf'][i]) == -1:
+            continue
+        key = (data['page_num'][i], data['block_num'][i], data['par_num'][i], data['line_num'][i])
+        left, top = int(data['left'][i]), int(data['top'][i])
+        grouped.setdefault(key, []).append({
+            'text': text,
+            'norm': _normalize(text),
+            'left': left,
+            'top': top,
+            'right': left + int(data['width'][i]),
+            'bottom': top + int(data['height'][i]),
+        })
+        
+    lines = []
+    for key, words in grouped.items():
+        words.sort(key=lambda word: word['left'])
+        lines.append({
+            'page': key[0],
+            'words': words,
+            'left': min(word['left'] for word in words),
+            'top': min(word['top'] for word in words),
+            'right': max(word['right'] for word in words),
+            'bottom': max(word['bottom'] for word in words),
+        })
+        
+    lines.sort(key=lambda line: (line['page'], line['top'], line['left']))
+    return lines
+
+
+def find_label(lines: List[Dict], label: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Locate a label phrase
+    
+    Args:
+        lines: Output of build_lines
+        label: Label phrase such as 'DATE OF BIRTH'
+        
+    Returns:
+        (line index, index of the label's first word, index of its last word),
+        or None if not present
+    """
+    wanted = [token for token in (_normalize(t) for t in label.split()) if token]
+    if not wanted:
+        return None
+        
+    for line_index, line in enumerate(lines):
+        norms = [word['norm'] for word in line['words']]
+        for start in range(len(norms) - len(wanted) + 1):
+            if norms[start:start + len(wanted)] == wanted:
+                return line_index, start, start + len(wanted) - 1
+    return None
+
+
+def value_after_label(lines: List[Dict], line_index: int, label_start: int, label_end: int,
+                      max_lines: int = 1, gap_factor: float = 2.5) -> Optional[str]:
+    """
+    Read the value printed to the right of a label, or else below it
+    
+    Args and matching rules as for value_words_after_label
+        
+    Returns:
+        Value text (lines below the label joined with ', '), or None if nothing is found
+    """
+    return _join_rows(value_words_after_label(lines, line_index, label_start, label_end, max_lines, gap_factor))
+
+
+def _join_rows(rows: List[List[Dict]]) -> Optional[str]:
+    """Value text from its word rows: words joined by spaces, rows by ', '"""
+    if not rows:
+        return None
+    return ', '.join(' '.join(word['text'] for word in row) for row in rows)
+
+
+def value_words_after_label(lines: List[Dict], line_index: int, label_start: int, label_end: int,
+                            max_lines: int = 1, gap_factor: float = 2.5) -> List[List[Dict]]:
+    """
+    Find the words of the value printed to the right of a label, or else below it
+    
+    A bilingual label ('GIVEN NAMES / PRÉNOMS:') runs on past the slash up to
+    the next word ending in a colon. Words to the right are collected until a
+    horizontal gap wider than gap_factor line heights; with nothing to the
+    right, the nearest line(s) below that overlap the label horizontally are
+    used instead.
+    
+    Args:
+        lines: Output of build_lines
+        line_index: Line holding the label
+        label_start: Index of the label's first word in that line
+        label_end: Index of the label's last word in that line
+        max_lines: Lines the value may span when it is below the label
+        gap_factor: Gap (in line heights) that ends a same-row value
+        
+    Returns:
+        The value's words, one list per line (empty if nothing is found)
+    """
+    line = lines[line_index]
+    words = line['words']
+    height = max(1, line['bottom'] - line['top'])
+    
+    # Skip the second language of a bilingual label ('SURNAME / NOM DE FAMILLE:')
+    end = label_end
+    if end + 1 < len(words) and words[end + 1]['text'].startswith('/'):
+        for i in range(end + 1, len(words)):
+            if words[i]['text'].endswith(':'):
+                end = i
+                break
+    label_left, label_right = words[label_start]['left'], words[end]['right']
+    
+    # Same row: the rest of this line plus any line Tesseract split off to the right
+    middle = (line['top'] + line['bottom']) / 2
+    row = list(words[end + 1:])
+    for other in lines:
+        if other is not line and other['page'] == line['page'] \
+                and other['top'] <= middle <= other['bottom'] and other['left'] >= label_right:
+            row.extend(other['words'])
+    row.sort(key=lambda word: word['left'])
+    
+    value = []
+    for word in row:
+        if value and word['left'] - value[-1]['right'] > gap_factor * height:
+            break
+        value.append(word)
+    if value:
+        return [value]
+        
+    # Below: nearest lines that start under the label
+    collected = []
+    previous = line
+    for other in lines[line_index + 1:]:
+        if len(collected) >= max_lines:
+            break
+        if other['page'] != line['page'] or other['top'] < previous['bottom'] - height / 2:
+            continue
+        if other['top'] - previous['bottom'] > 1.5 * height:
+            break
+        if other['right'] < label_left or other['left'] > label_right + gap_factor * height:
+            continue
+        collected.append(other)
+        previous = other
+        
+    return [other['words'] for other in collected]
+
+
+def extract_layout_fields(data: Dict, document_type: str, boxes: Dict = None) -> Dict:
+    """
+    Extract labelled fields for a document type from word-level OCR data
+    
+    Args:
+        data: Word-level output of image_to_data (Output.DICT)
+        document_type: Extractor type ('id', 'transcript', 'proof_of_address')
+        boxes: Optional dictionary that receives field -> (page, left, top, right,
+            bottom) of each value's words (before 'combine'; also for values
+            that failed their pattern)
+        
+    Returns:
+        Field values found (fields whose label or value is missing are left out)
+    """
+    spec = LAYOUT_FIELDS.get(document_type)
+    if spec is None or not data or not data.get('text'):
+        return {}
+        
+    lines = build_lines(data)
+    values = {}
+    for field, field_spec in spec['fields'].items():
+        for label in field_spec['labels']:
+            found = find_label(lines, label)
+            if found is None:
+                continue
+            rows = value_words_after_label(lines, *found, max_lines=field_spec.get('max_lines', 1))
+            value = _join_rows(rows)
+            if value and field_spec.get('pattern'):
+                match = re.search(field_spec['pattern'], value)
+                value = (match.group(1) if match.groups() else match.group(0)) if match else None
+            if rows and boxes is not None and (value or field not in boxes):
+                # Kept even when the value failed its pattern, so it can be re-read
+                words = [word for row in rows for word in row]
+                boxes[field] = (
+                    lines[found[0]]['page'],
+                    min(word['left'] for word in words),
+                    min(word['top'] for word in words),
+                    max(word['right'] for word in words),
+                    max(word['bottom'] for word in words),
+                )
+            if value:
+                values[field] = value
+                break
+                
+    for field, parts in spec.get('combine', {}).items():
+        joined = ' '.join(values[part] for part in parts if values.get(part))
+        if joined:
+            values[field] = joined
+            
+    for field in spec.get('internal_fields', []):
+        values.pop(field, None)
+        
+    return values
@@ -0,0 +1,200 @@
+"""
+Region-of-Interest OCR Templates
+Field bounding boxes for known document layouts, so only the field crops are OCR'd
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+from .ocr_layout import find_label
+
+
+# Boxes are (left, top, right, bottom) in the template's reference_size pixel space
+# and are scaled to the actual image size. Per field:
+#   psm:       Tesseract page segmentation mode for the crop (7 = single text line)
+#   whitelist: Characters Tesseract may output (no spaces; spaces separate words anyway)
+#   pattern:   Optional regex; its first group (or whole match) becomes the value
+# anchors: printed labels that must be read inside their box before the template
+# is trusted, since many unrelated cards share an aspect ratio (ID-1 is 1.586)
+OCR_TEMPLATES = {
+    # Layout of SampleDocumentGenerator.generate_ontario_id
+    'ontario_photo_card': {
+        'document_types': ['id', 'government_id'],
+        'reference_size': (800, 500),
+        'aspect_tolerance': 0.05,
+        'anchors': [
+            {'labels': ['SURNAME', 'NOM DE FAMILLE'], 'box': (250, 110, 640, 150)},
+            {'labels': ['DATE OF BIRTH', 'DATE DE NAISSANCE'], 'box': (250, 270, 720, 310)},
+        ],
+        'fields': {
+            'surname': {
+                'box': (270, 145, 790, 190),
+                'psm': 7,
+                'whitelist': 'ABCDEFGHIJKLMNOPQRSTUVWXYZ-',
+            },
+            'given_names': {
+                'box': (270, 225, 790, 270),
+                'psm': 7,
+                'whitelist': 'ABCDEFGHIJKLMNOPQRSTUVWXYZ-',
+            },
+            'date_of_birth': {
+                'box': (270, 305, 560, 350),
+                'psm': 7,
+                'whitelist': '0123456789-/',
+                'pattern': r'(\d{4}[-/]\d{2}[-/]\d{2}|\d{2}[-/]\d{2}[-/]\d{4})',
+            },
+            'id_number': {
+                'box': (20, 415, 460, 440),
+                'psm': 7,
+                'whitelist': 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-:',
+                'pattern': r'([A-Z]\d{4}-\d{5}-\d{5})',
+            },
+            'expiry_date': {
+                'box': (20, 455, 460, 480),
+                'psm': 7,
+                'whitelist': 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-/:',
+                'pattern': r'(\d{4}[-/]\d{2}[-/]\d{2}|\d{2}[-/]\d{2}[-/]\d{4})',
+            },
+        },
+        # Output fields assembled from several crops, joined with a space
+        'combine': {
+            'full_name': ['given_names', 'surname'],
+        },
+        # Crops that only feed 'combine' and are not returned themselves
+        'internal_fields': ['surname', 'given_names'],
+    },
+}
+
+
+def register_template(name: str, template: Dict):
+    """
+    Add or replace a layout template
+    
+    Args:
+        name: Template name
+        template: Dictionary with document_types, reference_size, anchors, fields (see OCR_TEMPLATES)
+    """
+    OCR_TEMPLATES[name] = template
+
+
+def templates_for(document_type: str) -> List[Dict]:
+    """Templates registered for a document type"""
+    return [t for t in OCR_TEMPLATES.values() if document_type in t['document_types']]
+
+
+def candidate_templates(document_type: str, width: int, height: int) -> List[Dict]:
+    """
+    Templates for the document type whose aspect ratio matches the image
+    
+    The aspect ratio alone does not identify a layout; anchors still have to be
+    checked (match_template with the page's lines, or an OCR of each anchor box).
+    
+    Args:
+        document_type: Classified document type
+        width: Image width in pixels
+        height: Image height in pixels
+        
+    Returns:
+        Candidate templates, in registration order
+    """
+    if not width or not height:
+        return []
+    aspect = width / height
+    candidates = []
+    for template in templates_for(document_type):
+        ref_w, ref_h = template['reference_size']
+        ref_aspect = ref_w / ref_h
+        if abs(aspect - ref_aspect) / ref_aspect <= template.get('aspect_tolerance', 0.05):
+            candidates.append(template)
+    return candidates
+
+
+def match_template(document_type: str, width: int, height: int, lines: List[Dict]) -> Optional[Dict]:
+    """
+    Find the template for a page whose aspect ratio matches and whose anchors were read in place
+    
+    Args:
+        document_type: Classified document type
+        width: Image width in pixels
+        height: Image height in pixels
+        lines: build_lines() output of the page's OCR
+    
+    Returns:
+        Matching template, or None if the layout is not a known one
+    """
+    for template in candidate_templates(document_type, width, height):
+        if anchors_found(template, lines, width, height):
+            return template
+    return None
+
+
+def scale_box(template: Dict, box: Tuple[int, int, int, int], width: int, height: int) -> Tuple[int, int, int, int]:
+    """A template box in the pixel space of a width x height image"""
+    ref_w, ref_h = template['reference_size']
+    sx, sy = width / ref_w, height / ref_h
+    left, top, right, bottom = box
+    return int(left * sx), int(top * sy), int(right * sx), int(bottom * sy)
+
+
+def anchors_found(template: Dict, lines: List[Dict], width: int, height: int) -> bool:
+    """
+    True if every anchor's label was read with its centre inside the anchor's box
+    
+    Args:
+        template: Template with anchors (a template without any always passes)
+        lines: build_lines() output of the page's OCR
+        width: Page width in pixels
+        height: Page height in pixels
+    """
+    for anchor in template.get('anchors', []):
+        left, top, right, bottom = scale_box(template, anchor['box'], width, height)
+        found = False
+        for line in lines:
+            for label in anchor['labels']:
+                position = find_label([line], label)
+                if position is None:
+                    continue
+                words = line['words'][position[1]:position[2] + 1]
+                x = (words[0]['left'] + words[-1]['right']) / 2
+                y = (min(word['top'] for word in words) + max(word['bottom'] for word in words)) / 2
+                if left <= x <= right and top <= y <= bottom:
+                    found = True
+                    break
+            if found:
+                break
+        if not found:
+            return False
+    return True
+
+
+def region_text(lines: List[Dict], box: Tuple[int, int, int, int]) -> str:
+    """Words of a page whose centre lies inside a box (pixel space), in reading order"""
+    left, top, right, bottom = box
+    words = []
+    for line in lines:
+        for word in line['words']:
+            x = (word['left'] + word['right']) / 2
+            y = (word['top'] + word['bottom']) / 2
+            if left <= x <= right and top <= y <= bottom:
+                words.append(word['text'])
+    return ' '.join(words)
+
+
+def field_value(spec: Dict, text: str) -> Optional[str]:
+    """
+    A field's value from the text read in its box
+    
+    Text with characters outside the field's whitelist is rejected (None), so
+    a misread from an unconstrained pass is re-read with the whitelist instead
+    of being kept; the pattern, if any, then picks the value out.
+    """
+    text = ' '.join(text.split())
+    whitelist = spec.get('whitelist')
+    if not text or (whitelist and any(ch not in whitelist for ch in text.replace(' ', ''))):
+        return None
+    if spec.get('pattern'):
+        match = re.search(spec['pattern'], text)
+        if not match:
+            return None
+        text = match.group(1) if match.groups() else match.group(0)
+    return text or None
@@ -0,0 +1,78 @@
+"""
+Lazy PDF Page Rendering
+Rasterizes one page at a time so multi-page documents never sit fully in memory
+"""
+
+from pathlib import Path
+from typing import Iterator, Union
+
+import numpy as np
+from pdf2image import convert_from_bytes, convert_from_path, pdfinfo_from_bytes, pdfinfo_from_path
+
+
+class PDFPageSource:
+    """
+    Renders pages of a PDF on demand (via poppler's pdftoppm)
+    """
+    
+    def __init__(self, pdf_path: Union[str, bytes], dpi: int = 200, poppler_path: str = None):
+        """
+        Args:
+            pdf_path: Path to PDF file, or the PDF's bytes
+            dpi: Rendering resolution
+            poppler_path: Directory containing poppler binaries (Windows), if not on PATH
+        """
+        if isinstance(pdf_path, (bytearray, memoryview)):
+            pdf_path = bytes(pdf_path)
+        self.pdf_path = pdf_path if isinstance(pdf_path, bytes) else str(pdf_path)
+        self.dpi = dpi
+        self.poppler_path = poppler_path
+        self._page_count = None
+        
+    @staticmethod
+    def is_pdf(source) -> bool:
+        """True for a path with a .pdf extension or bytes starting with the PDF signature"""
+        if isinstance(source, (str, Path)):
+            return str(source).lower().endswith('.pdf')
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return bytes(source[:5]) == b'%PDF-'
+        return False
+        
+    @property
+    def page_count(self) -> int:
+        """Number of pages (read from the PDF info dictionary, no rendering)"""
+        if self._page_count is None:
+            if isinstance(self.pdf_path, bytes):
+                info = pdfinfo_from_bytes(self.pdf_path, poppler_path=self.poppler_path)
+            else:
+                info = pdfinfo_from_path(self.pdf_path, poppler_path=self.poppler_path)
+            self._page_count = int(info['Pages'])
+        return self._page_count
+        
+    def render_page(self, page_number: int) -> np.ndarray:
+        """
+        Rasterize a single page
+        
+        Args:
+            page_number: 1-based page number
+            
+        Returns:
+            Grayscale page image
+        """
+        convert = convert_from_bytes if isinstance(self.pdf_path, bytes) else convert_from_path
+        pages = convert(
+            self.pdf_path,
+            dpi=self.dpi,
+            first_page=page_number,
+            last_page=page_number,
+            grayscale=True,
+            poppler_path=self.poppler_path
+        )
+        if not pages:
+            raise ValueError(f"Could not render page {page_number} of the PDF")
+        return np.asarray(pages[0])
+        
+    def iter_pages(self) -> Iterator[np.ndarray]:
+        """Render pages one after another"""
+        for page_number in range(1, self.page_count + 1):
+            yield self.render_page(page_number)
@@ -91,6 +91,9 @@ class WorkflowRouter:
         if self._has_financial_aid(application):
             routing_decision = self._add_financial_aid_tasks(routing_decision, application)
         
+        if application.get('unreadable_documents'):
+            routing_decision = self._add_reupload_tasks(routing_decision, application)
+        
         # Assign priority
         routing_decision['priority'] = self._calculate_priority(application)
         
@@ -269,6 +272,26 @@ class WorkflowRouter:
         
         return routing
     
+    def _add_reupload_tasks(self, routing: Dict, application: Dict) -> Dict:
+        """Add a follow-up for documents rejected as unreadable before OCR"""
+        unreadable = application.get('unreadable_documents', [])
+        files = ', '.join(f"{doc['filename']} ({', '.join(doc['reasons'])})" for doc in unreadable)
+        
+        routing['tasks'].append({
+            'task_id': f"TASK-{datetime.now().strftime('%Y%m%d%H%M%S')}-RU",
+            'type': 'request_reupload',
+            'description': f'Collect re-uploads of unreadable documents: {files}',
+            'department': 'admissions',
+            'estimated_time': 5,
+            'status': 'automated',  # Re-upload request already emailed
+            'note': 'Automated re-upload request sent. Manual follow-up if no response in 3 days.'
+        })
+        
+        routing['estimated_time'] += 5
+        routing['routing_reason'] += f' | {len(unreadable)} unreadable document(s) - re-upload requested'
+        
+        return routing
+    
     def _calculate_priority(self, application: Dict) -> str:
         """Calculate task priority based on application characteristics"""
         # Check for urgent conditions